@@ -46,8 +46,21 @@ class LLVMGenerator:
             module_name: The name of the LLVM module to create
         """
         logger.info(f"Initializing LLVM generator for module: {module_name}")
+        self.module_name = module_name
+        self.reset(ast)
+    
+    def reset(self, ast: Dict[str, Any]) -> None:
+        """
+        Start over with a fresh LLVM module for another AST.
+        
+        This lets one generator be reused for several ASTs instead of
+        constructing a new one per AST.
+        
+        Args:
+            ast: The validated AST to generate code from
+        """
         self.ast = ast
-        self.module = ir.Module(name=module_name)
+        self.module = ir.Module(name=self.module_name)
         self.builder = None  # Will be set when generating functions
         self.symbol_table: Dict[str, Dict[str, Any]] = {}
         self.current_function = None
@@ -721,6 +734,10 @@ class WasmGenerator(LLVMGenerator):
     def __init__(self, ast: Dict[str, Any], module_name: str = "AegisWasmModule"):
         """Initialize the WebAssembly generator."""
         super().__init__(ast, module_name)
+    
+    def reset(self, ast: Dict[str, Any]) -> None:
+        """Start over with a fresh WebAssembly-targeted module for another AST."""
+        super().reset(ast)
         
         # Set the WebAssembly target triple
         self.module.triple = "wasm32-unknown-unknown"
@@ -7,6 +7,17 @@ logger = get_logger(__name__)
 # -------------------------------
 class CodeGenerator:
     """Generates LLVM IR from the parsed AST."""
+    # AST node type -> name of the method that generates it
+    _GENERATORS = {
+        "Struct": "generate_struct",
+        "Function": "generate_function",
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may override generate_* methods
+        cls._dispatch = _build_dispatch(cls)
+
     def __init__(self, ast):
         logger.info("Starting CodeGenerator...")
         self.ast = ast
@@ -16,11 +27,11 @@ class CodeGenerator:
     def generate(self):
         """Generates LLVM IR for the entire AST."""
         logger.info("Generating LLVM IR...")
+        dispatch = self._dispatch
         for node in self.ast.children:
-            if node.node_type == "Struct":
-                self.generate_struct(node)
-            elif node.node_type == "Function":
-                self.generate_function(node)
+            method = dispatch.get(node.node_type)
+            if method is not None:
+                method(self, node)
         logger.debug(f"Generated LLVM IR:\n{str(self.module)}")
         llvm_ir = str(self.module)
         logger.debug(f"LLVM IR:\n{llvm_ir}")
@@ -96,3 +107,14 @@ class CodeGenerator:
         }
         logger.debug(f"LLVM type: {llvm_type_map.get(aegis_type, ir.VoidType())}")
         return llvm_type_map.get(aegis_type, ir.VoidType())
+
+
+def _build_dispatch(cls):
+    """Map each AST node type to the class's (possibly overridden) generator method."""
+    return {
+        node_type: getattr(cls, method_name)
+        for node_type, method_name in cls._GENERATORS.items()
+    }
+
+
+CodeGenerator._dispatch = _build_dispatch(CodeGenerator)
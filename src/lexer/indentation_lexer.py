@@ -22,6 +22,13 @@ class AegisIndentationLexer:
             lexer: The underlying ANTLR4 lexer that produces tokens
         """
         self.lexer = lexer
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Clear the indentation stack and recorded errors so the lexer can be
+        reused for another input.
+        """
         self.indents = [0]          # Indentation stack, starting with 0 (no indent)
         self.indent_errors = []     # Track indentation errors
     
@@ -42,15 +49,16 @@ class AegisIndentationLexer:
         pending_dedents = 0      # Track pending dedents for empty lines
         
         for i, line in enumerate(lines):
+            # Strip the leading whitespace once; its length is the indentation
+            content = line.lstrip()
+            
             # Handle empty lines and comments - preserve them but don't change indentation
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
+            if not content or content.startswith('#'):
                 result.append(line)
                 continue
             
             # Calculate the indentation level (number of spaces)
-            indent_level = len(line) - len(line.lstrip())
-            content = line.lstrip()
+            indent_level = len(line) - len(content)
             
             # Check for indentation change
             if indent_level > indentation_stack[-1]:
@@ -93,8 +101,7 @@ class AegisIndentationLexer:
         
         # Add any remaining DEDENT tokens at the end
         if len(indentation_stack) > 1:
-            for _ in range(len(indentation_stack) - 1):
-                result.append("DEDENT")
+            result.extend(["DEDENT"] * (len(indentation_stack) - 1))
         
         return '\n'.join(result)
     
@@ -1,4 +1,5 @@
 import re
+import string
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -70,6 +71,60 @@ TOKEN_PATTERNS = [
     (r"\s+", None),  # Ignore whitespace
 ]
 
+# Characters each of TOKEN_PATTERNS (in the same order) can start with
+_WORD_START = string.ascii_letters + "_"
+TOKEN_START_CHARS = [
+    _WORD_START,
+    _WORD_START,
+    string.digits,
+    _WORD_START,
+    '"',
+    "#",
+    "+-*/=<>!:",
+    "()[]{},:",
+    string.whitespace,
+]
+
+# Each pattern becomes a named group T<index>; the group that matched gives the token type
+_GROUP_TOKEN_TYPES = {f"T{index}": token_type for index, (_, token_type) in enumerate(TOKEN_PATTERNS)}
+
+
+def _combine_patterns(indices):
+    """
+    Compile the TOKEN_PATTERNS at the given indices into one alternation.
+    
+    Alternatives are tried left to right, so the first pattern (in
+    TOKEN_PATTERNS order) that matches wins, as in a pattern-by-pattern loop.
+    """
+    return re.compile("|".join(f"(?P<T{index}>{TOKEN_PATTERNS[index][0]})" for index in indices))
+
+
+ANY_TOKEN_PATTERN = _combine_patterns(range(len(TOKEN_PATTERNS)))
+
+
+def _build_start_char_table():
+    """
+    Map each start character to a combined pattern of only the token patterns
+    that can match from it, so the lexer skips patterns that cannot match.
+    Characters missing from the table fall back to ANY_TOKEN_PATTERN.
+    """
+    indices_by_char = {}
+    for index, start_chars in enumerate(TOKEN_START_CHARS):
+        for char in start_chars:
+            indices_by_char.setdefault(char, []).append(index)
+    # Characters with the same candidates share one compiled pattern
+    combined = {}
+    table = {}
+    for char, indices in indices_by_char.items():
+        key = tuple(indices)
+        if key not in combined:
+            combined[key] = _combine_patterns(key)
+        table[char] = combined[key]
+    return table
+
+
+START_CHAR_PATTERNS = _build_start_char_table()
+
 
 # -------------------------------
 # Lexer Function
@@ -93,16 +148,16 @@ def lex(input_code):
             idx += 1
             continue
 
-        for pattern, token_type in TOKEN_PATTERNS:
-            match = re.match(pattern, input_code[idx:])
-            if match:
-                if token_type:  # Skip whitespace
-                    tokens.append((token_type, match.group(0), line_num, column))
-                    logger.debug(f"Token: {token_type}, {match.group(0)}, {line_num}, {column}")
-                idx += len(match.group(0))
-                column += len(match.group(0))
-                match_found = True
-                break
+        pattern = START_CHAR_PATTERNS.get(input_code[idx], ANY_TOKEN_PATTERN)
+        match = pattern.match(input_code, idx)
+        if match:
+            token_type = _GROUP_TOKEN_TYPES[match.lastgroup]
+            if token_type:  # Skip whitespace
+                tokens.append((token_type, match.group(0), line_num, column))
+                logger.debug(f"Token: {token_type}, {match.group(0)}, {line_num}, {column}")
+            idx += len(match.group(0))
+            column += len(match.group(0))
+            match_found = True
 
         if not match_found:
             logger.error(f"No match found for line {line_num}, column {column}")
@@ -144,15 +199,15 @@ def lex_line(line_content, line_num):
             column = 1
             continue
 
-        for pattern, token_type in TOKEN_PATTERNS:
-            match = re.match(pattern, line_content[idx:])
-            if match:
-                if token_type:
-                    tokens.append((token_type, match.group(0), line_num, column))
-                idx += len(match.group(0))
-                column += len(match.group(0))
-                match_found = True
-                break
+        pattern = START_CHAR_PATTERNS.get(line_content[idx], ANY_TOKEN_PATTERN)
+        match = pattern.match(line_content, idx)
+        if match:
+            token_type = _GROUP_TOKEN_TYPES[match.lastgroup]
+            if token_type:
+                tokens.append((token_type, match.group(0), line_num, column))
+            idx += len(match.group(0))
+            column += len(match.group(0))
+            match_found = True
 
         if not match_found:
             logger.error(f"No match found for line {line_num}, column {column}")
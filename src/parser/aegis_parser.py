@@ -1,6 +1,7 @@
 from antlr4 import InputStream, CommonTokenStream, DiagnosticErrorListener
 import sys
 import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 # Add the generated parser directory to the path
@@ -187,8 +188,7 @@ class AegisParser:
         Returns:
             An abstract syntax tree representation as a dictionary
         """
-        with open(filepath, 'r') as file:
-            input_text = file.read()
+        input_text = Path(filepath).read_text(encoding='utf-8')
         return self.parse(input_text, filepath)
 
 
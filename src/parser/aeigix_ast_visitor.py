@@ -13,12 +13,25 @@ execution model.
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Extra node fields whose string values come from a small vocabulary and are
+# compared repeatedly during semantic analysis
+_INTERNED_FIELDS = ("operator", "literal_type")
+
+# Children of every leaf node; a shared tuple, so leaves allocate no list
+_NO_CHILDREN: tuple = ()
+
+@dataclass(frozen=True, slots=True)
 class SourcePosition:
-    """Represents a position in the source code file"""
+    """
+    Represents a position in the source code file (immutable and hashable).
+    
+    Every AST node carries one, so instances use __slots__ rather than a
+    per-instance __dict__.
+    """
     line: int
     column: int
     file_path: str = ""
@@ -26,6 +39,10 @@ class SourcePosition:
     def __str__(self) -> str:
         return f"{self.file_path}:{self.line}:{self.column}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the position as a plain dictionary, without dataclasses.asdict's deep copy."""
+        return {"line": self.line, "column": self.column, "file_path": self.file_path}
+
 class AegisASTVisitor:
     """
     Visitor for traversing Aegis language Abstract Syntax Trees.
@@ -35,6 +52,11 @@ class AegisASTVisitor:
     while making it suitable for AI-driven analysis and transformation.
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may add or override visit_* methods
+        cls._dispatch = _build_dispatch(cls)
+        
     def __init__(self, source_file: str = ""):
         """
         Initialize the AST visitor.
@@ -43,13 +65,30 @@ class AegisASTVisitor:
             source_file: Path to the source file being processed
         """
         self.source_file = source_file
+        self.reset()
+        
+    def reset(self) -> None:
+        """Clear per-traversal state so the visitor can be reused for another tree."""
         self.current_module = None
         self.errors = []
         
     def _make_node_info(self, node_type: str, name: str, 
                        children: List[Any], pos: SourcePosition,
                        **extra_info) -> Dict[str, Any]:
-        """Helper method to create consistent node information dictionaries."""
+        """
+        Helper method to create consistent node information dictionaries.
+        
+        Identifier, type and operator names are interned here, at the parse
+        boundary, so later passes compare them by identity. Literal values
+        are left alone since they are rarely compared and may be large.
+        """
+        if node_type != "literal" and isinstance(name, str):
+            name = sys.intern(name)
+        for key in _INTERNED_FIELDS:
+            value = extra_info.get(key)
+            if isinstance(value, str):
+                extra_info[key] = sys.intern(value)
+            
         info = {
             "node_type": node_type,
             "name": name,
@@ -60,6 +99,16 @@ class AegisASTVisitor:
         info.update(extra_info)
         return info
     
+    def _make_leaf_info(self, node_type: str, name: str, pos: SourcePosition,
+                        **extra_info) -> Dict[str, Any]:
+        """
+        Create the information dictionary for a node that has no children.
+        
+        Leaves (identifiers, literals, imports) are the most common nodes, so
+        they share one empty children tuple instead of each allocating a list.
+        """
+        return self._make_node_info(node_type, name, _NO_CHILDREN, pos, **extra_info)
+        
     def visit_module(self, node) -> Dict[str, Any]:
         """
         Visit a module declaration node.
@@ -80,7 +129,7 @@ class AegisASTVisitor:
         Returns:
             Dictionary with module information
         """
-        logger.debug(f"Visiting module: {node.name}")
+        logger.debug("Visiting module: %s", node.name)
         
         old_module = self.current_module
         self.current_module = node.name
@@ -97,7 +146,7 @@ class AegisASTVisitor:
             name=node.name,
             children=children,
             pos=SourcePosition(node.line, node.column, self.source_file),
-            exports=node.exports if hasattr(node, "exports") else []
+            exports=getattr(node, "exports", [])
         )
     
     def visit_struct(self, node) -> Dict[str, Any]:
@@ -124,7 +173,7 @@ class AegisASTVisitor:
         Returns:
             Dictionary with struct information
         """
-        logger.debug(f"Visiting struct: {node.name}")
+        logger.debug("Visiting struct: %s", node.name)
         
         fields = []
         methods = []
@@ -142,7 +191,7 @@ class AegisASTVisitor:
             pos=SourcePosition(node.line, node.column, self.source_file),
             fields=fields,
             methods=methods,
-            traits=node.traits if hasattr(node, "traits") else []
+            traits=getattr(node, "traits", [])
         )
     
     def visit_enum(self, node) -> Dict[str, Any]:
@@ -170,7 +219,7 @@ class AegisASTVisitor:
         Returns:
             Dictionary with enum information
         """
-        logger.debug(f"Visiting enum: {node.name}")
+        logger.debug("Visiting enum: %s", node.name)
         
         variants = []
         methods = []
@@ -188,7 +237,7 @@ class AegisASTVisitor:
             pos=SourcePosition(node.line, node.column, self.source_file),
             variants=variants,
             methods=methods,
-            type_params=node.type_params if hasattr(node, "type_params") else []
+            type_params=getattr(node, "type_params", [])
         )
     
     def visit_variant(self, node) -> Dict[str, Any]:
@@ -207,7 +256,7 @@ class AegisASTVisitor:
         """
         fields = []
         
-        if hasattr(node, "fields") and node.fields:
+        if getattr(node, "fields", None):
             for field in node.fields:
                 fields.append(self.visit_field(field))
         
@@ -242,7 +291,7 @@ class AegisASTVisitor:
             children=[type_info],
             pos=SourcePosition(node.line, node.column, self.source_file),
             type_annotation=type_info,
-            default_value=self.visit(node.default_value) if hasattr(node, "default_value") and node.default_value else None
+            default_value=self.visit(node.default_value) if getattr(node, "default_value", None) else None
         )
     
     def visit_function(self, node) -> Dict[str, Any]:
@@ -269,29 +318,26 @@ class AegisASTVisitor:
         Returns:
             Dictionary with function information
         """
-        logger.debug(f"Visiting function: {node.name}")
+        logger.debug("Visiting function: %s", node.name)
         
-        params = []
-        for param in node.params:
-            params.append(self.visit_parameter(param))
+        visit = self.visit
+        params = [self.visit_parameter(param) for param in node.params]
         
-        return_type = self.visit_type(node.return_type) if hasattr(node, "return_type") and node.return_type else None
+        return_type = self.visit_type(node.return_type) if getattr(node, "return_type", None) else None
         
-        body_nodes = []
-        for stmt in node.body:
-            body_nodes.append(self.visit(stmt))
+        body_nodes = [visit(stmt) for stmt in node.body]
         
         return self._make_node_info(
             node_type="function",
             name=node.name,
-            children=params + (body_nodes if body_nodes else []),
+            children=params + body_nodes,
             pos=SourcePosition(node.line, node.column, self.source_file),
             params=params,
             return_type=return_type,
             body=body_nodes,
-            is_async=node.is_async if hasattr(node, "is_async") else False,
-            is_method=node.is_method if hasattr(node, "is_method") else False,
-            visibility=node.visibility if hasattr(node, "visibility") else "public"
+            is_async=getattr(node, "is_async", False),
+            is_method=getattr(node, "is_method", False),
+            visibility=getattr(node, "visibility", "public")
         )
     
     def visit_parameter(self, node) -> Dict[str, Any]:
@@ -315,7 +361,7 @@ class AegisASTVisitor:
             children=[type_info],
             pos=SourcePosition(node.line, node.column, self.source_file),
             type_annotation=type_info,
-            default_value=self.visit(node.default_value) if hasattr(node, "default_value") and node.default_value else None
+            default_value=self.visit(node.default_value) if getattr(node, "default_value", None) else None
         )
     
     def visit_type(self, node) -> Dict[str, Any]:
@@ -340,7 +386,7 @@ class AegisASTVisitor:
             return None
         
         type_params = []
-        if hasattr(node, "type_params") and node.type_params:
+        if getattr(node, "type_params", None):
             for param in node.type_params:
                 type_params.append(self.visit_type(param))
         
@@ -349,7 +395,7 @@ class AegisASTVisitor:
             name=node.name,
             children=type_params,
             pos=SourcePosition(node.line, node.column, self.source_file),
-            is_primitive=node.is_primitive if hasattr(node, "is_primitive") else False,
+            is_primitive=getattr(node, "is_primitive", False),
             type_params=type_params
         )
     
@@ -402,7 +448,7 @@ class AegisASTVisitor:
             Dictionary with variable declaration information
         """
         type_info = self.visit_type(node.type_annotation)
-        init_value = self.visit(node.value) if hasattr(node, "value") and node.value else None
+        init_value = self.visit(node.value) if getattr(node, "value", None) else None
         
         return self._make_node_info(
             node_type="var_declaration",
@@ -443,7 +489,7 @@ class AegisASTVisitor:
             pos=SourcePosition(node.line, node.column, self.source_file),
             target=target,
             value=value,
-            operator=node.operator if hasattr(node, "operator") else "="
+            operator=getattr(node, "operator", "=")
         )
     
     def visit_if_statement(self, node) -> Dict[str, Any]:
@@ -471,11 +517,11 @@ class AegisASTVisitor:
         then_block = self.visit(node.then_block)
         
         else_block = None
-        if hasattr(node, "else_block") and node.else_block:
+        if getattr(node, "else_block", None):
             else_block = self.visit(node.else_block)
         
         elif_branches = []
-        if hasattr(node, "elif_branches") and node.elif_branches:
+        if getattr(node, "elif_branches", None):
             for branch in node.elif_branches:
                 elif_cond = self.visit(branch.condition)
                 elif_block = self.visit(branch.block)
@@ -572,7 +618,7 @@ class AegisASTVisitor:
         Returns:
             Dictionary with return statement information
         """
-        value = self.visit(node.value) if hasattr(node, "value") and node.value else None
+        value = self.visit(node.value) if getattr(node, "value", None) else None
         
         return self._make_node_info(
             node_type="return_statement",
@@ -688,10 +734,9 @@ class AegisASTVisitor:
         Returns:
             Dictionary with identifier information
         """
-        return self._make_node_info(
+        return self._make_leaf_info(
             node_type="identifier",
             name=node.name,
-            children=[],
             pos=SourcePosition(node.line, node.column, self.source_file)
         )
     
@@ -734,10 +779,9 @@ class AegisASTVisitor:
         Returns:
             Dictionary with literal information
         """
-        return self._make_node_info(
+        return self._make_leaf_info(
             node_type="literal",
             name=str(node.value),
-            children=[],
             pos=SourcePosition(node.line, node.column, self.source_file),
             value=node.value,
             literal_type=node.literal_type
@@ -814,7 +858,7 @@ class AegisASTVisitor:
             children=methods,
             pos=SourcePosition(node.line, node.column, self.source_file),
             methods=methods,
-            type_params=node.type_params if hasattr(node, "type_params") else []
+            type_params=getattr(node, "type_params", [])
         )
     
     def visit_impl(self, node) -> Dict[str, Any]:
@@ -845,7 +889,7 @@ class AegisASTVisitor:
             name="",
             children=methods,
             pos=SourcePosition(node.line, node.column, self.source_file),
-            trait_name=node.trait_name if hasattr(node, "trait_name") else None,
+            trait_name=getattr(node, "trait_name", None),
             type_name=node.type_name,
             methods=methods
         )
@@ -868,14 +912,13 @@ class AegisASTVisitor:
         Returns:
             Dictionary with import statement information
         """
-        return self._make_node_info(
+        return self._make_leaf_info(
             node_type="import",
             name=node.module_path,
-            children=[],
             pos=SourcePosition(node.line, node.column, self.source_file),
             module_path=node.module_path,
-            items=node.items if hasattr(node, "items") else [],
-            alias=node.alias if hasattr(node, "alias") else None
+            items=getattr(node, "items", []),
+            alias=getattr(node, "alias", None)
         )
     
     def visit_async_await(self, node) -> Dict[str, Any]:
@@ -948,9 +991,9 @@ class AegisASTVisitor:
         
         # Dispatch based on node type
         if hasattr(node, "type"):
-            method_name = f"visit_{node.type}"
-            if hasattr(self, method_name):
-                return getattr(self, method_name)(node)
+            method = self._dispatch.get(node.type)
+            if method is not None:
+                return method(self, node)
             else:
                 logger.warning(f"No visitor method for node type: {node.type}")
                 return {
@@ -972,3 +1015,16 @@ class AegisASTVisitor:
             "children": [],
             "position": SourcePosition(0, 0, self.source_file)
         }
+
+
+def _build_dispatch(cls) -> Dict[str, Any]:
+    """Map each node type to the visitor class's visit_<type> method."""
+    return {
+        name[len("visit_"):]: getattr(cls, name)
+        for name in dir(cls)
+        if name.startswith("visit_")
+    }
+
+# Node type -> visit method, built once so visit() needs a single dict lookup
+# instead of formatting a method name and probing attributes for every node
+AegisASTVisitor._dispatch = _build_dispatch(AegisASTVisitor)
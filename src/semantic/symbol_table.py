@@ -5,19 +5,43 @@ This module provides a symbol table implementation for tracking declarations
 and their scopes during semantic analysis.
 """
 
-from typing import Dict, List, Any, Optional, Union
-from enum import Enum, auto
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator, Tuple
+from array import array
+import sys
+from enum import IntEnum, auto
 from dataclasses import dataclass, field
 
-class SymbolType(Enum):
-    """Types of symbols that can be stored in the symbol table."""
+# Built-in type names. They are never declared in any scope, so resolving
+# them is a single hash probe into this fixed set rather than a scope walk.
+BUILTIN_TYPES = frozenset({"int", "float", "bool", "string", "void", "any"})
+
+def _intern(value: Any) -> Any:
+    """Intern a string so equal names and type names share one object; return other values unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+class SymbolType(IntEnum):
+    """
+    Types of symbols that can be stored in the symbol table.
+    
+    An IntEnum so that kind checks compare plain integers rather than
+    dispatching through Enum.__eq__.
+    """
     VARIABLE = auto()
     FUNCTION = auto()
     TYPE = auto()
     TRAIT = auto()
     MODULE = auto()
 
-@dataclass
+class TypeKind(IntEnum):
+    """
+    Kinds of user-defined types, stored as type_info["kind"] on TYPE symbols.
+    
+    Members are singletons, so kind checks can compare by identity.
+    """
+    STRUCT = auto()
+    ENUM = auto()
+
+@dataclass(slots=True)
 class Symbol:
     """
     Represents a symbol in the Aegis language.
@@ -28,17 +52,19 @@ class Symbol:
         type_info: Type information for the symbol
         is_mutable: Whether the symbol can be modified (for variables)
         scope: The scope in which the symbol is defined
+        index: Position of the symbol in its SymbolTable's flat registry
     """
     name: str
     symbol_type: SymbolType
     type_info: Any
     is_mutable: bool = False
     scope: str = ""
+    index: int = -1
     
     def __str__(self) -> str:
         return f"{self.name} ({self.symbol_type.name})"
 
-@dataclass
+@dataclass(slots=True)
 class Scope:
     """
     Represents a lexical scope in the program.
@@ -47,12 +73,12 @@ class Scope:
         name: The name of the scope
         parent: The parent scope, or None for global scope
         symbols: Mapping of symbol names to Symbol objects
-        children: Child scopes
+        children: Child scopes, or None until the first child is entered
     """
     name: str
     parent: Optional['Scope'] = None
     symbols: Dict[str, Symbol] = field(default_factory=dict)
-    children: List['Scope'] = field(default_factory=list)
+    children: Optional[List['Scope']] = None
     
     def add_symbol(self, symbol: Symbol) -> None:
         """Add a symbol to this scope."""
@@ -70,14 +96,36 @@ class SymbolTable:
     Symbol table for tracking declarations and their scopes.
     
     The symbol table maintains a hierarchy of scopes and allows looking up
-    symbols in the current and parent scopes.
+    symbols in the current and parent scopes. Alongside the scope tree it
+    keeps a display: for every name, the stack of visible declarations of
+    that name, innermost last. Entering a scope pushes nothing, declaring a
+    symbol pushes it, and exiting a scope pops the scope's own symbols, so
+    lookup is a single dict probe regardless of nesting depth.
+    
+    In streaming mode, exited scopes are not kept in the scope tree and
+    symbols are not kept in the flat registry, so a scope and its symbols
+    can be garbage collected once the analysis has left it. Whole-table
+    queries are unavailable in that mode.
     """
     
-    def __init__(self):
-        """Initialize an empty symbol table with a global scope."""
+    def __init__(self, streaming: bool = False):
+        """
+        Initialize an empty symbol table with a global scope.
+        
+        Args:
+            streaming: Drop finished scopes instead of retaining the full tree
+        """
+        self.streaming = streaming
         self.global_scope = Scope("global")
         self.current_scope = self.global_scope
         self.scope_stack = [self.global_scope]
+        # name -> visible declarations of that name, innermost last
+        self._visible: Dict[str, List[Symbol]] = {}
+        # Flat registry of every symbol in the table, in declaration order,
+        # with their kinds in a parallel array so whole-table scans walk two
+        # contiguous sequences instead of the scope tree
+        self.symbols: List[Symbol] = []
+        self.symbol_kinds = array('B')
     
     def enter_scope(self, name: str) -> None:
         """
@@ -87,15 +135,26 @@ class SymbolTable:
             name: The name of the new scope
         """
         new_scope = Scope(name, parent=self.current_scope)
-        self.current_scope.children.append(new_scope)
+        if not self.streaming:
+            if self.current_scope.children is None:
+                self.current_scope.children = []
+            self.current_scope.children.append(new_scope)
         self.current_scope = new_scope
         self.scope_stack.append(new_scope)
     
     def exit_scope(self) -> None:
         """Exit the current scope and return to the parent scope."""
         if len(self.scope_stack) > 1:
-            self.scope_stack.pop()
+            exited = self.scope_stack.pop()
             self.current_scope = self.scope_stack[-1]
+            
+            # The exited scope's declarations are the innermost ones
+            visible = self._visible
+            for name in exited.symbols:
+                shadowed = visible[name]
+                shadowed.pop()
+                if not shadowed:
+                    del visible[name]
     
     def add_symbol(self, name: str, symbol_type: SymbolType, type_info: Any, is_mutable: bool = False) -> Symbol:
         """
@@ -110,16 +169,83 @@ class SymbolTable:
         Returns:
             The created Symbol object
         """
+        # Names and plain type names are interned so later comparisons of
+        # equal strings are identity checks
+        name = sys.intern(name)
         symbol = Symbol(
             name=name,
             symbol_type=symbol_type,
-            type_info=type_info,
+            type_info=_intern(type_info),
             is_mutable=is_mutable,
             scope=self.current_scope.name
         )
+        
+        previous = self.current_scope.symbols.get(name)
+        self._register(symbol, previous)
+        self._make_visible(symbol, previous)
         self.current_scope.add_symbol(symbol)
         return symbol
     
+    def add_symbols(self, decls: Iterable[Tuple[str, SymbolType, Any, bool]]) -> List[Symbol]:
+        """
+        Add several symbols to the current scope at once.
+        
+        Equivalent to calling add_symbol for each declaration in order, but
+        builds the symbols in one loop and merges them into the scope with a
+        single dict update.
+        
+        Args:
+            decls: (name, symbol_type, type_info, is_mutable) tuples
+            
+        Returns:
+            The created Symbol objects, in input order
+        """
+        scope = self.current_scope
+        scope_name = scope.name
+        created = [
+            Symbol(sys.intern(name), symbol_type, _intern(type_info), is_mutable, scope_name)
+            for name, symbol_type, type_info, is_mutable in decls
+        ]
+        
+        register = self._register
+        make_visible = self._make_visible
+        existing = scope.symbols
+        pending: Dict[str, Symbol] = {}
+        
+        for symbol in created:
+            name = symbol.name
+            previous = pending.get(name) or existing.get(name)
+            register(symbol, previous)
+            make_visible(symbol, previous)
+            pending[name] = symbol
+        
+        existing.update(pending)
+        return created
+    
+    def _register(self, symbol: Symbol, previous: Optional[Symbol]) -> None:
+        """Record a symbol in the flat registry, replacing `previous` if it is a redeclaration."""
+        if self.streaming:
+            return
+        
+        if previous is not None:
+            symbol.index = previous.index
+            self.symbols[symbol.index] = symbol
+            self.symbol_kinds[symbol.index] = symbol.symbol_type
+        else:
+            symbol.index = len(self.symbols)
+            self.symbols.append(symbol)
+            self.symbol_kinds.append(symbol.symbol_type)
+    
+    def _make_visible(self, symbol: Symbol, previous: Optional[Symbol]) -> None:
+        """Push a symbol onto the display, replacing `previous` from the same scope."""
+        shadowed = self._visible.get(symbol.name)
+        if shadowed is None:
+            self._visible[symbol.name] = [symbol]
+        elif previous is not None:
+            shadowed[-1] = symbol
+        else:
+            shadowed.append(symbol)
+    
     def lookup(self, name: str) -> Optional[Symbol]:
         """
         Look up a symbol in the current scope and its ancestors.
@@ -130,13 +256,9 @@ class SymbolTable:
         Returns:
             The Symbol object if found, None otherwise
         """
-        # Look in current scope and parent scopes
-        scope = self.current_scope
-        while scope:
-            symbol = scope.lookup_local(name)
-            if symbol:
-                return symbol
-            scope = scope.parent
+        shadowed = self._visible.get(name)
+        if shadowed:
+            return shadowed[-1]
         
         return None
     
@@ -152,36 +274,56 @@ class SymbolTable:
             The Symbol object if found, None otherwise
         """
         # Find the scope with the given name
-        scope_to_check = self._find_scope(self.global_scope, scope_name)
+        scope_to_check = self._find_scope(scope_name)
         if not scope_to_check:
             return None
         
         return scope_to_check.lookup_local(name)
     
-    def _find_scope(self, current: Scope, name: str) -> Optional[Scope]:
-        """Recursively find a scope by name."""
-        if current.name == name:
-            return current
-        
-        for child in current.children:
-            result = self._find_scope(child, name)
-            if result:
-                return result
+    def _find_scope(self, name: str) -> Optional[Scope]:
+        """Find the first scope with the given name, in pre-order from the global scope."""
+        stack = [self.global_scope]
+        while stack:
+            scope = stack.pop()
+            if scope.name == name:
+                return scope
+            if scope.children:
+                stack.extend(reversed(scope.children))
         
         return None
     
+    def iter_all_symbols(self) -> Iterator[Symbol]:
+        """
+        Iterate over all symbols defined in all scopes, in declaration order.
+        
+        Unlike get_all_symbols, no intermediate list is built, so callers
+        that stop early only touch the symbols they consume.
+        """
+        self._require_full_table("iter_all_symbols")
+        return iter(self.symbols)
+    
     def get_all_symbols(self) -> List[Symbol]:
-        """Get all symbols defined in all scopes."""
-        symbols = []
-        self._collect_symbols(self.global_scope, symbols)
-        return symbols
+        """Get all symbols defined in all scopes, in declaration order."""
+        return list(self.iter_all_symbols())
     
-    def _collect_symbols(self, scope: Scope, symbols: List[Symbol]) -> None:
-        """Recursively collect symbols from a scope and its children."""
-        symbols.extend(scope.symbols.values())
+    def get_symbols_of_type(self, symbol_type: SymbolType) -> List[Symbol]:
+        """
+        Get all symbols of a given kind, in declaration order.
         
-        for child in scope.children:
-            self._collect_symbols(child, symbols)
+        Args:
+            symbol_type: The kind of symbol to select
+            
+        Returns:
+            The matching Symbol objects
+        """
+        self._require_full_table("get_symbols_of_type")
+        symbols = self.symbols
+        return [symbols[i] for i, kind in enumerate(self.symbol_kinds) if kind == symbol_type]
+    
+    def _require_full_table(self, operation: str) -> None:
+        """Reject whole-table queries on a streaming symbol table."""
+        if self.streaming:
+            raise RuntimeError(f"{operation} is not available on a streaming SymbolTable")
     
     def get_current_scope_name(self) -> str:
         """Get the name of the current scope."""
@@ -1,18 +1,261 @@
-from typing import Dict, List, Any, Optional, Union, Set
+from typing import Dict, List, Any, Iterator, Optional, Union, Sequence, Set, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
+import hashlib
+import json
+import os
+import sys
+import time
 from src.parser.aeigix_ast_visitor import SourcePosition
-from src.semantic.symbol_table import SymbolTable, Symbol, SymbolType, Scope
+from src.semantic.symbol_table import SymbolTable, Symbol, SymbolType, TypeKind, Scope, BUILTIN_TYPES
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Default location of the on-disk result cache used when a TypeChecker is
+# created with cache_path=DEFAULT_CACHE_PATH
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "aegis", "typecheck.json")
+
+# Cached results older than this many seconds are checked again
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Maximum number of ASTs kept in the cache; the oldest entries are evicted
+_CACHE_MAX_ENTRIES = 256
+
+# Mixed into every cache key; bump it whenever the checking rules or the
+# TypeCheckError format change, so results cached by an older checker are
+# never reused
+_CACHE_VERSION = 1
+
+# Message and suggestion templates for each TypeCheckError kind, filled in
+# with the error's args only when the text is actually read
+_MSG_TABLE: Dict[str, Tuple[str, str]] = {
+    "undefined_field_type": (
+        "Field '{0}' has undefined type '{1}'",
+        "Use a valid type like 'int', 'string', or define the struct '{1}' before using it",
+    ),
+    "undefined_variant_field_type": (
+        "Variant field '{0}' has undefined type '{1}'",
+        "Use a valid type like 'int', 'string', or define the type '{1}' before using it",
+    ),
+    "undefined_return_type": (
+        "Function '{0}' has undefined return type '{1}'",
+        "Use a valid type like 'int', 'string', or define the type '{1}' before using it",
+    ),
+    "undefined_param_type": (
+        "Parameter '{0}' has undefined type '{1}'",
+        "Use a valid type like 'int', 'string', or define the type '{1}' before using it",
+    ),
+    "missing_return": (
+        "Function '{0}' must return a value of type '{1}' on all code paths",
+        "Add a return statement with the appropriate value type at the end of the function",
+    ),
+    "undefined_var_type": (
+        "Variable '{0}' has undefined type '{1}'",
+        "Use a valid type like 'int', 'string', or define the type '{1}' before using it",
+    ),
+    "var_init_mismatch": (
+        "Cannot assign value of type '{0}' to variable '{1}' of type '{2}'",
+        "Use a value of type '{2}' or convert the value to '{2}'",
+    ),
+    "assign_mismatch": (
+        "Cannot assign value of type '{0}' to target of type '{1}'",
+        "Use a value of type '{1}' or convert the value to '{1}'",
+    ),
+    "assign_immutable": (
+        "Cannot assign to immutable variable '{0}'",
+        "Use 'var' instead of 'let' if the variable needs to be mutable",
+    ),
+    "if_condition_not_bool": (
+        "If condition must be a boolean, got '{0}'",
+        "Use a comparison or logical expression that evaluates to a boolean",
+    ),
+    "elif_condition_not_bool": (
+        "Elif condition must be a boolean, got '{0}'",
+        "Use a comparison or logical expression that evaluates to a boolean",
+    ),
+    "not_iterable": (
+        "Cannot iterate over type '{0}'",
+        "Use a collection type like an array, range, or implement the Iterable trait",
+    ),
+    "while_condition_not_bool": (
+        "While condition must be a boolean, got '{0}'",
+        "Use a comparison or logical expression that evaluates to a boolean",
+    ),
+    "void_return_value": (
+        "Cannot return a value from a function with void return type",
+        "Remove the return value or change the function return type",
+    ),
+    "missing_return_value": (
+        "Function expects return value of type '{0}' but no value is returned",
+        "Add a return value of type '{0}'",
+    ),
+    "return_type_mismatch": (
+        "Function expects return type '{0}' but got '{1}'",
+        "Return a value of type '{0}' or convert the current value",
+    ),
+    "undefined_symbol": (
+        "Undefined symbol '{0}'",
+        "Declare the variable before using it or check for typos",
+    ),
+    "guard_not_bool": (
+        "Match guard must be a boolean, got '{0}'",
+        "Use a comparison or logical expression that evaluates to a boolean",
+    ),
+    "await_outside_async": (
+        "Cannot use 'await' outside of an async function",
+        "Mark the enclosing function as async using the 'async' keyword",
+    ),
+    "invalid_arithmetic": (
+        "Operator '{0}' cannot be applied to types '{1}' and '{2}'",
+        "Use numeric types for arithmetic operations or strings for concatenation (+)",
+    ),
+    "invalid_comparison": (
+        "Cannot compare values of types '{0}' and '{1}' with operator '{2}'",
+        "Use comparable types or implement comparison operators for custom types",
+    ),
+    "invalid_logical": (
+        "Logical operator '{0}' requires boolean operands, got '{1}' and '{2}'",
+        "Use boolean expressions for logical operations",
+    ),
+    "invalid_negation": (
+        "Unary minus operator cannot be applied to type '{0}'",
+        "Use a numeric type with the negation operator",
+    ),
+    "invalid_not": (
+        "Logical not operator cannot be applied to type '{0}'",
+        "Use a boolean value or expression with the logical not operator",
+    ),
+    "undefined_function": (
+        "Call to undefined function '{0}'",
+        "Define the function before calling it or check for typos",
+    ),
+    "function_arg_count": (
+        "Function '{0}' expects {1} arguments but got {2}",
+        "Provide exactly {1} arguments as defined in the function signature",
+    ),
+    "function_arg_type": (
+        "Function '{0}' expects parameter '{1}' of type '{2}' but got '{3}'",
+        "Provide a value of type '{2}' or convert the argument to that type",
+    ),
+    "undefined_method": (
+        "Type '{0}' has no method named '{1}'",
+        "Check for typos or implement the method for type '{0}'",
+    ),
+    "method_arg_count": (
+        "Method '{0}' expects {1} arguments but got {2}",
+        "Provide exactly {1} arguments as defined in the method signature",
+    ),
+    "method_arg_type": (
+        "Method '{0}' expects argument of type '{1}' but got '{2}'",
+        "Provide a value of type '{1}' or convert the argument to that type",
+    ),
+    "member_on_non_type": (
+        "Cannot access member '{0}' on non-struct/enum type '{1}'",
+        "Use a struct or enum type with the member access operator",
+    ),
+    "undefined_member": (
+        "Type '{0}' has no member named '{1}'",
+        "Check for typos or add the member to type '{0}'",
+    ),
+    "not_awaitable": (
+        "Type '{0}' is not awaitable",
+        "Use a Task<T> or Future<T> type that can be awaited in an async function",
+    ),
+    "variant_pattern_non_enum": (
+        "Cannot match non-enum type '{0}' against variant pattern",
+        "Use a simple binding pattern or ensure the matched value is an enum",
+    ),
+    "undefined_variant": (
+        "Enum '{0}' has no variant named '{1}'",
+        "Use one of the defined variants: {2}",
+    ),
+    "variant_field_count": (
+        "Variant '{0}' expects {1} fields but got {2}",
+        "Provide the correct number of fields for this variant",
+    ),
+    "literal_pattern_mismatch": (
+        "Cannot match value of type '{0}' against literal of type '{1}'",
+        "Use a pattern of type '{0}'",
+    ),
+    "non_exhaustive_match": (
+        "Match statement for enum '{0}' is not exhaustive, missing variants: {1}",
+        "Add patterns for all variants or include a catch-all pattern with '_'",
+    ),
+}
+
+# Shared read-only defaults for missing AST keys, so lookups like
+# node.get("children", ...) do not allocate a fresh container on every miss
+_EMPTY_TUPLE: tuple = ()
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Position for nodes that carry none; SourcePosition is frozen, so it is shared
+_NULL_POS = SourcePosition(0, 0, "")
+
+# Literal kind -> the type of the literal expression
+_LITERAL_TYPES = {"int": "int", "float": "float", "bool": "bool", "string": "string"}
+
+_ARITHMETIC_OPS = frozenset({"+", "-", "*", "/", "%"})
+_COMPARISON_OPS = frozenset({"==", "!=", "<", ">", "<=", ">="})
+_EQUALITY_OPS = frozenset({"==", "!="})
+_LOGICAL_OPS = frozenset({"&&", "||"})
+_NUMERIC_TYPES = ("int", "float")
+_AWAITABLE_TYPES = frozenset({"Task", "Future"})
+
+def _build_binop_table() -> Dict[Tuple[str, str, str], str]:
+    """Build the (operator, left_type, right_type) -> result_type table for builtin operands."""
+    table = {}
+    for left in _NUMERIC_TYPES:
+        for right in _NUMERIC_TYPES:
+            # Mixed numeric arithmetic widens to float
+            widest = "float" if "float" in (left, right) else "int"
+            for op in _ARITHMETIC_OPS:
+                table[(op, left, right)] = widest
+            for op in _COMPARISON_OPS:
+                table[(op, left, right)] = "bool"
+    table[("+", "string", "string")] = "string"
+    for op in _LOGICAL_OPS:
+        table[(op, "bool", "bool")] = "bool"
+    return table
+
+_BINOP_TABLE = _build_binop_table()
+
+# (operator, operand_type) -> result_type for valid unary operations
+_UNOP_TABLE: Dict[Tuple[str, str], str] = {
+    ("-", "int"): "int",
+    ("-", "float"): "float",
+    ("!", "bool"): "bool",
+}
+
+# Unary operator -> error kind reported when its operand type is invalid
+_UNOP_ERRORS = {"-": "invalid_negation", "!": "invalid_not"}
+
+@dataclass(slots=True, frozen=True)
 class TypeCheckError:
-    """Represents a type checking error with a helpful message and suggestion."""
-    message: str
-    suggestion: str
+    """
+    Represents a type checking error with a helpful message and suggestion.
+    
+    Errors store a kind and its arguments; the message and suggestion text
+    are formatted from _MSG_TABLE only when they are read. Errors are
+    immutable and hashable so duplicates can be detected.
+    
+    Attributes:
+        kind: Key into _MSG_TABLE identifying the error
+        args: Values substituted into the message and suggestion templates
+        position: Source position of the offending construct
+    """
+    kind: str
+    args: tuple
     position: SourcePosition
     
+    @property
+    def message(self) -> str:
+        return _MSG_TABLE[self.kind][0].format(*self.args)
+    
+    @property
+    def suggestion(self) -> str:
+        return _MSG_TABLE[self.kind][1].format(*self.args)
+    
     def __str__(self) -> str:
         return f"{self.position}: Error: {self.message}\nSuggestion: {self.suggestion}"
 
@@ -26,17 +269,82 @@ class TypeChecker:
     Provides detailed, AI-friendly error messages with suggestions for fixing issues.
     """
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, cache_ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Initialize the type checker.
+        
+        Args:
+            cache_path: Optional file used to cache errors across runs, keyed
+                by a hash of the AST. Caching is disabled when None. The
+                file is plain JSON, so reading it never runs code, but
+                every check reads the whole file and every cache miss
+                rewrites it (up to _CACHE_MAX_ENTRIES entries); keep one
+                file per project rather than sharing one across many.
+            cache_ttl: Seconds after which a cached result is checked again
+        """
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.reset()
+        # Node kind -> handler, so dispatch is a single dict lookup
+        self._handlers = {
+            "module": self._check_module,
+            "struct": self._check_struct,
+            "enum": self._check_enum,
+            "function": self._check_function,
+            "var_declaration": self._check_var_declaration,
+            "assignment": self._check_assignment,
+            "binary_op": self._check_binary_op,
+            "unary_op": self._check_unary_op,
+            "call": self._check_call,
+            "if_statement": self._check_if_statement,
+            "for_loop": self._check_for_loop,
+            "while_loop": self._check_while_loop,
+            "return_statement": self._check_return_statement,
+            "block": self._check_block,
+            "identifier": self._check_identifier,
+            "member_access": self._check_member_access,
+            "literal": self._check_literal,
+            "match_statement": self._check_match_statement,
+            "await_expression": self._check_await_expression,
+            "task_spawn": self._check_task_spawn,
+        }
+    
+    def reset(self) -> None:
+        """
+        Clear all per-check state so the checker can be reused for another AST.
+        
+        The handler table and cache settings are kept, so reusing a checker
+        avoids rebuilding them for every AST.
+        """
         self.symbol_table = SymbolTable()
         self.errors = []
+        self._seen_errors: Set[TypeCheckError] = set()
         self.current_function = None
         self.current_function_returns = False
+        # Resolved return type and async flag of current_function, read by
+        # every return statement and await expression in its body
+        self.current_return_type = "void"
+        self.current_function_is_async = False
         self.in_loop = False
+        # Names of every type declared so far, seeded with the builtins
+        self._known_types: Set[str] = set(BUILTIN_TYPES)
+        # (struct_name, field_name) -> field type, for every registered struct
+        self._member_types: Dict[Tuple[str, str], str] = {}
+        # target_type -> {source_type -> result of _are_types_compatible}
+        self._compat_cache: Dict[str, Dict[str, bool]] = {}
+        # type name -> (base, generic params) as returned by _parse_type
+        self._type_parse_cache: Dict[str, Tuple[str, Optional[Tuple[str, ...]]]] = {}
+        # (type, method name) -> read-only info returned by _get_method_info
+        self._method_info_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
     
     def check(self, ast: Dict[str, Any]) -> List[TypeCheckError]:
         """
         Perform type checking on the entire AST.
         
+        When the result cache is enabled and holds the AST's errors, they are
+        returned without checking; the checker is reset as for a full check,
+        but its symbol table is not rebuilt and stays empty.
+        
         Args:
             ast: The AST to check
             
@@ -45,15 +353,24 @@ class TypeChecker:
         """
         logger.info("Starting type checking")
         
-        # Clear any previous state
-        self.symbol_table = SymbolTable()
-        self.errors = []
+        ast_hash = None
+        if self.cache_path is not None and ast is not None:
+            ast_hash = self._hash_ast(ast)
+            cached = self._load_cached_errors(ast_hash)
+            if cached is not None:
+                # Start from a clean checker, as a full check would; the
+                # symbol table is left empty rather than rebuilt
+                logger.info("Using cached type checking result")
+                self.reset()
+                self.errors = list(cached)
+                self._seen_errors = set(cached)
+                return self.errors
         
-        # First pass: register all top-level declarations
-        self._register_declarations(ast)
+        for _ in self.iter_errors(ast):
+            pass
         
-        # Second pass: validate all declarations and check for type errors
-        self._check_node(ast)
+        if ast_hash is not None:
+            self._store_cached_errors(ast_hash, self.errors)
         
         if not self.errors:
             logger.info("Type checking completed successfully")
@@ -62,37 +379,202 @@ class TypeChecker:
             
         return self.errors
     
-    def _register_declarations(self, node: Dict[str, Any]) -> None:
+    @staticmethod
+    def _hash_ast(ast: Dict[str, Any]) -> str:
+        """
+        Compute a content hash of an AST for the result cache.
+        
+        Args:
+            ast: The AST to hash
+            
+        Returns:
+            Hex digest identifying the AST's contents and the checker version
+        """
+        serialized = json.dumps(ast, sort_keys=True, default=repr)
+        return hashlib.blake2b(f"{_CACHE_VERSION}:{serialized}".encode()).hexdigest()
+    
+    def _read_cache(self) -> Dict[str, List[Any]]:
+        """
+        Read the cache file, treating a missing or unreadable file as empty.
+        
+        Returns:
+            Mapping from AST hash to [time stored, encoded errors], with the
+            errors as stored by _store_cached_errors
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable type check cache {self.cache_path}: {e}")
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # Skip malformed entries rather than failing on them later
+        return {
+            key: entry for key, entry in cache.items()
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], (int, float))
+        }
+    
+    def _load_cached_errors(self, ast_hash: str) -> Optional[Tuple[TypeCheckError, ...]]:
         """
-        First pass to register all declarations in the symbol table.
+        Look up the cached errors for an AST.
         
-        This establishes all available types, functions, and variables before
-        checking their implementations, which helps with forward references.
+        Args:
+            ast_hash: Hash of the AST, from _hash_ast
+            
+        Returns:
+            The cached errors, or None if there is no fresh entry
+        """
+        entry = self._read_cache().get(ast_hash)
+        if entry is None:
+            return None
+        stored_at, encoded = entry
+        if time.time() - stored_at > self.cache_ttl:
+            return None
+        try:
+            return tuple(
+                TypeCheckError(kind, tuple(args), SourcePosition(line, column, file_path))
+                for kind, args, line, column, file_path in encoded
+            )
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed type check cache entry in {self.cache_path}")
+            return None
+    
+    def _store_cached_errors(self, ast_hash: str, errors: List[TypeCheckError]) -> None:
+        """
+        Record the errors for an AST, dropping expired and the oldest entries.
         
         Args:
-            node: The AST node to process
+            ast_hash: Hash of the AST, from _hash_ast
+            errors: The errors found for the AST
         """
-        if node is None:
-            return
+        now = time.time()
+        cache = {
+            key: entry for key, entry in self._read_cache().items()
+            if key != ast_hash and now - entry[0] <= self.cache_ttl
+        }
+        # Errors are stored as (kind, args, line, column, file) rows
+        cache[ast_hash] = [now, [
+            [error.kind, error.args, error.position.line, error.position.column, error.position.file_path]
+            for error in errors
+        ]]
+        if len(cache) > _CACHE_MAX_ENTRIES:
+            newest = sorted(cache.items(), key=lambda item: item[1][0])[-_CACHE_MAX_ENTRIES:]
+            cache = dict(newest)
+        
+        # Write to a temporary file first so a concurrent reader never sees
+        # a partially written cache
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, default=str)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write type check cache {self.cache_path}: {e}")
+    
+    def iter_errors(self, ast: Dict[str, Any]) -> Iterator[TypeCheckError]:
+        """
+        Type check the AST, yielding errors as each top-level declaration is checked.
+        
+        All top-level declarations are registered first, then checked one at
+        a time; the errors found in each are yielded before the next is
+        checked. Callers that stop iterating early (e.g. after the first N
+        errors) skip checking the remaining declarations. Yielded errors are
+        also collected in self.errors.
+        
+        Args:
+            ast: The AST to check
             
-        node_type = node.get("node_type", "")
+        Yields:
+            Type checking errors, in the order they are found
+        """
+        # Clear any previous state
+        self.reset()
         
-        if node_type == "module":
-            # Register the module and process its children
-            module_name = node["name"]
-            self.symbol_table.enter_scope(module_name)
+        if ast is None:
+            return
             
-            for child in node.get("children", []):
-                self._register_declarations(child)
+        # A root module is unpacked so its declarations are checked one by
+        # one; any other root is treated as a single declaration
+        is_module = ast.get("node_type") == "module"
+        if is_module:
+            self.symbol_table.enter_scope(ast["name"])
+            nodes = ast.get("children", _EMPTY_TUPLE)
+        else:
+            nodes = (ast,)
+            
+        for node in nodes:
+            self._register_declaration(node)
+            
+        reported = 0
+        for node in nodes:
+            self._check_node(node)
+            while reported < len(self.errors):
+                yield self.errors[reported]
+                reported += 1
                 
+        if is_module:
             self.symbol_table.exit_scope()
+    
+    def _report(self, kind: str, position: SourcePosition, *args: Any) -> None:
+        """
+        Record an error of the given kind.
+        
+        Args:
+            kind: Key into _MSG_TABLE identifying the error
+            position: Source position of the offending construct
+            *args: Values substituted into the message and suggestion templates
+        """
+        self._add_error(TypeCheckError(kind, args, position))
+    
+    def _add_error(self, error: TypeCheckError) -> None:
+        """Record an error unless an identical one was already reported."""
+        if error not in self._seen_errors:
+            self._seen_errors.add(error)
+            self.errors.append(error)
+    
+    def _visit_scope(self, nodes: Sequence[Dict[str, Any]]) -> None:
+        """
+        Register and then check the declarations of one scope.
+        
+        All declarations in `nodes` are added to the current scope before any
+        of them is checked, which allows forward references within the scope.
+        Nested scopes repeat this when their own node is checked, so the AST
+        is walked once rather than in two whole-tree passes.
+        
+        Args:
+            nodes: The AST nodes declared directly in the current scope
+        """
+        for node in nodes:
+            self._register_declaration(node)
             
-        elif node_type == "struct":
+        for node in nodes:
+            self._check_node(node)
+    
+    def _register_declaration(self, node: Dict[str, Any]) -> None:
+        """
+        Register a single declaration in the current scope.
+        
+        Only the declaration's own symbol is added; its body is not visited.
+        Methods of structs and enums are registered in the type's scope when
+        the type is checked.
+        
+        Args:
+            node: The AST node to register
+        """
+        if node is None:
+            return
+            
+        node_type = node.get("node_type", "")
+        
+        if node_type == "struct":
             # Register the struct type
             struct_name = node["name"]
             fields = {}
             
-            for field in node.get("fields", []):
+            for field in node.get("fields", _EMPTY_TUPLE):
                 field_name = field["name"]
                 field_type = field["type_annotation"]["name"]
                 fields[field_name] = field_type
@@ -101,25 +583,24 @@ class TypeChecker:
                 name=struct_name,
                 symbol_type=SymbolType.TYPE,
                 type_info={
-                    "kind": "struct",
+                    "kind": TypeKind.STRUCT,
                     "fields": fields
                 }
             )
-            
-            # Process method declarations
-            for method in node.get("methods", []):
-                self._register_declarations(method)
+            self._known_types.add(struct_name)
+            for field_name, field_type in fields.items():
+                self._member_types[(struct_name, field_name)] = field_type
                 
         elif node_type == "enum":
             # Register the enum type
             enum_name = node["name"]
             variants = {}
             
-            for variant in node.get("variants", []):
+            for variant in node.get("variants", _EMPTY_TUPLE):
                 variant_name = variant["name"]
                 variant_fields = {}
                 
-                for field in variant.get("fields", []):
+                for field in variant.get("fields", _EMPTY_TUPLE):
                     field_name = field["name"] if "name" in field else ""
                     field_type = field["type_annotation"]["name"]
                     variant_fields[field_name] = field_type
@@ -130,35 +611,20 @@ class TypeChecker:
                 name=enum_name,
                 symbol_type=SymbolType.TYPE,
                 type_info={
-                    "kind": "enum",
-                    "variants": variants
+                    "kind": TypeKind.ENUM,
+                    "variants": variants,
+                    # Built once here for match exhaustiveness checks
+                    "variant_set": frozenset(variants)
                 }
             )
-            
-            # Process method declarations
-            for method in node.get("methods", []):
-                self._register_declarations(method)
+            self._known_types.add(enum_name)
                 
         elif node_type == "function":
             # Register the function signature
-            func_name = node["name"]
-            params = []
-            
-            for param in node.get("params", []):
-                param_name = param["name"]
-                param_type = param["type_annotation"]["name"] if param.get("type_annotation") else "any"
-                params.append((param_name, param_type))
-                
-            return_type = node.get("return_type", {}).get("name", "void")
-            
             self.symbol_table.add_symbol(
-                name=func_name,
+                name=node["name"],
                 symbol_type=SymbolType.FUNCTION,
-                type_info={
-                    "params": params,
-                    "return_type": return_type,
-                    "is_async": node.get("is_async", False)
-                }
+                type_info=self._signature_info(node)
             )
             
         elif node_type == "trait":
@@ -166,22 +632,8 @@ class TypeChecker:
             trait_name = node["name"]
             methods = {}
             
-            for method in node.get("methods", []):
-                method_name = method["name"]
-                params = []
-                
-                for param in method.get("params", []):
-                    param_name = param["name"]
-                    param_type = param["type_annotation"]["name"] if param.get("type_annotation") else "any"
-                    params.append((param_name, param_type))
-                    
-                return_type = method.get("return_type", {}).get("name", "void")
-                
-                methods[method_name] = {
-                    "params": params,
-                    "return_type": return_type,
-                    "is_async": method.get("is_async", False)
-                }
+            for method in node.get("methods", _EMPTY_TUPLE):
+                methods[method["name"]] = self._signature_info(method)
                 
             self.symbol_table.add_symbol(
                 name=trait_name,
@@ -191,6 +643,34 @@ class TypeChecker:
                 }
             )
     
+    def _signature_info(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the type_info for a function or method signature.
+        
+        Parameter names and types are stored as parallel tuples, which call
+        checks index directly; "params" keeps the (name, type) pairs.
+        
+        Args:
+            node: The function or method node
+            
+        Returns:
+            The signature's type_info dictionary
+        """
+        params = node.get("params", _EMPTY_TUPLE)
+        param_names = tuple(param["name"] for param in params)
+        param_types = tuple(
+            param["type_annotation"]["name"] if param.get("type_annotation") else "any"
+            for param in params
+        )
+        
+        return {
+            "params": list(zip(param_names, param_types)),
+            "param_names": param_names,
+            "param_types": param_types,
+            "return_type": node.get("return_type", _EMPTY_MAPPING).get("name", "void"),
+            "is_async": node.get("is_async", False)
+        }
+    
     def _check_node(self, node: Dict[str, Any]) -> Optional[str]:
         """
         Check a node for type errors and validate its children.
@@ -205,439 +685,463 @@ class TypeChecker:
             return None
             
         node_type = node.get("node_type", "")
-        position = node.get("position", SourcePosition(0, 0, ""))
         
-        # Handle each node type
-        if node_type == "module":
-            module_name = node["name"]
-            self.symbol_table.enter_scope(module_name)
-            
-            for child in node.get("children", []):
-                self._check_node(child)
-                
-            self.symbol_table.exit_scope()
-            
-        elif node_type == "struct":
-            struct_name = node["name"]
-            self.symbol_table.enter_scope(struct_name)
-            
-            # Check field types exist
-            for field in node.get("fields", []):
-                field_type_name = field["type_annotation"]["name"]
-                if not self._is_valid_type(field_type_name):
-                    self.errors.append(TypeCheckError(
-                        message=f"Field '{field['name']}' has undefined type '{field_type_name}'",
-                        suggestion=f"Use a valid type like 'int', 'string', or define the struct '{field_type_name}' before using it",
-                        position=field["position"]
-                    ))
-            
-            # Check methods
-            for method in node.get("methods", []):
-                self._check_node(method)
-                
-            self.symbol_table.exit_scope()
+        # Literals are the most common leaves and need neither a position
+        # nor a handler call
+        if node_type == "literal":
+            return _LITERAL_TYPES.get(node.get("literal_type"))
             
-        elif node_type == "enum":
-            enum_name = node["name"]
-            self.symbol_table.enter_scope(enum_name)
-            
-            # Check variant field types exist
-            for variant in node.get("variants", []):
-                for field in variant.get("fields", []):
-                    field_type_name = field["type_annotation"]["name"]
-                    if not self._is_valid_type(field_type_name):
-                        self.errors.append(TypeCheckError(
-                            message=f"Variant field '{field['name']}' has undefined type '{field_type_name}'",
-                            suggestion=f"Use a valid type like 'int', 'string', or define the type '{field_type_name}' before using it",
-                            position=field["position"]
-                        ))
-            
-            # Check methods
-            for method in node.get("methods", []):
-                self._check_node(method)
-                
-            self.symbol_table.exit_scope()
-            
-        elif node_type == "function":
-            func_name = node["name"]
-            self.current_function = node
-            self.current_function_returns = False
-            
-            # Check return type exists
-            return_type = node.get("return_type", {}).get("name", "void")
-            if return_type != "void" and not self._is_valid_type(return_type):
-                self.errors.append(TypeCheckError(
-                    message=f"Function '{func_name}' has undefined return type '{return_type}'",
-                    suggestion=f"Use a valid type like 'int', 'string', or define the type '{return_type}' before using it",
-                    position=node["position"]
-                ))
-            
-            # Enter function scope
-            self.symbol_table.enter_scope(func_name)
-            
-            # Add parameters to scope
-            for param in node.get("params", []):
-                param_name = param["name"]
-                param_type = param["type_annotation"]["name"] if param.get("type_annotation") else "any"
-                
-                # Check parameter type exists
-                if not self._is_valid_type(param_type):
-                    self.errors.append(TypeCheckError(
-                        message=f"Parameter '{param_name}' has undefined type '{param_type}'",
-                        suggestion=f"Use a valid type like 'int', 'string', or define the type '{param_type}' before using it",
-                        position=param["position"]
-                    ))
-                
-                self.symbol_table.add_symbol(
-                    name=param_name,
-                    symbol_type=SymbolType.VARIABLE,
-                    type_info=param_type
-                )
-            
-            # Check function body
-            for stmt in node.get("body", []):
-                self._check_node(stmt)
-            
-            # Check if function returns a value on all paths if non-void
-            if return_type != "void" and not self.current_function_returns:
-                self.errors.append(TypeCheckError(
-                    message=f"Function '{func_name}' must return a value of type '{return_type}' on all code paths",
-                    suggestion="Add a return statement with the appropriate value type at the end of the function",
-                    position=node["position"]
-                ))
+        position = node.get("position", _NULL_POS)
+        
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            return None
+        return handler(node, position)
+    
+    def _check_module(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a module node."""
+        module_name = node["name"]
+        self.symbol_table.enter_scope(module_name)
+        self._visit_scope(node.get("children", _EMPTY_TUPLE))
+        self.symbol_table.exit_scope()
+    
+    def _check_struct(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a struct node."""
+        struct_name = node["name"]
+        self.symbol_table.enter_scope(struct_name)
+        
+        # Check field types exist
+        fields = node.get("fields", _EMPTY_TUPLE)
+        self._check_declared_types(
+            fields, [field["type_annotation"]["name"] for field in fields], "undefined_field_type"
+        )
+        
+        # Register and check methods
+        self._visit_scope(node.get("methods", _EMPTY_TUPLE))
             
-            self.symbol_table.exit_scope()
-            self.current_function = None
-            
-        elif node_type == "var_declaration":
-            var_name = node["name"]
-            var_type = node["type_annotation"]["name"] if node.get("type_annotation") else None
-            
-            # Check if the variable type exists
-            if var_type and not self._is_valid_type(var_type):
-                self.errors.append(TypeCheckError(
-                    message=f"Variable '{var_name}' has undefined type '{var_type}'",
-                    suggestion=f"Use a valid type like 'int', 'string', or define the type '{var_type}' before using it",
-                    position=node["position"]
-                ))
-            
-            # Check initialization value type
-            init_value = node.get("init_value")
-            if init_value:
-                init_type = self._check_node(init_value)
-                
-                if var_type and init_type and not self._are_types_compatible(var_type, init_type):
-                    self.errors.append(TypeCheckError(
-                        message=f"Cannot assign value of type '{init_type}' to variable '{var_name}' of type '{var_type}'",
-                        suggestion=f"Use a value of type '{var_type}' or convert the value to '{var_type}'",
-                        position=node["position"]
-                    ))
-                
-                # Infer type if not specified
-                if not var_type and init_type:
-                    var_type = init_type
+        self.symbol_table.exit_scope()
+    
+    def _check_enum(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check an enum node."""
+        enum_name = node["name"]
+        self.symbol_table.enter_scope(enum_name)
+        
+        # Check variant field types exist
+        fields = [
+            field
+            for variant in node.get("variants", _EMPTY_TUPLE)
+            for field in variant.get("fields", _EMPTY_TUPLE)
+        ]
+        self._check_declared_types(
+            fields, [field["type_annotation"]["name"] for field in fields], "undefined_variant_field_type"
+        )
+        
+        # Register and check methods
+        self._visit_scope(node.get("methods", _EMPTY_TUPLE))
             
-            # Add variable to symbol table
+        self.symbol_table.exit_scope()
+    
+    def _check_function(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a function node."""
+        func_name = node["name"]
+        self.current_function = node
+        self.current_function_returns = False
+        
+        # Check return type exists
+        return_type = node.get("return_type", _EMPTY_MAPPING).get("name", "void")
+        self.current_return_type = return_type
+        self.current_function_is_async = node.get("is_async", False)
+        if return_type != "void" and not self._is_valid_type(return_type):
+            self._report("undefined_return_type", node["position"], func_name, return_type)
+        
+        # Enter function scope
+        self.symbol_table.enter_scope(func_name)
+        
+        # Add parameters to scope
+        params = node.get("params", _EMPTY_TUPLE)
+        param_types = [
+            param["type_annotation"]["name"] if param.get("type_annotation") else "any"
+            for param in params
+        ]
+        
+        # Check parameter types exist
+        self._check_declared_types(params, param_types, "undefined_param_type")
+        
+        self.symbol_table.add_symbols([
+            (param["name"], SymbolType.VARIABLE, param_type, False)
+            for param, param_type in zip(params, param_types)
+        ])
+        
+        # Check function body
+        for stmt in node.get("body", _EMPTY_TUPLE):
+            self._check_node(stmt)
+        
+        # Check if function returns a value on all paths if non-void
+        if return_type != "void" and not self.current_function_returns:
+            self._report("missing_return", node["position"], func_name, return_type)
+        
+        self.symbol_table.exit_scope()
+        self.current_function = None
+    
+    def _check_var_declaration(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a var declaration node."""
+        var_name = node["name"]
+        var_type = node["type_annotation"]["name"] if node.get("type_annotation") else None
+        init_value = node.get("init_value")
+        
+        # Fast path for the most common declaration, a primitive annotation
+        # initialized with a literal of the same type: the type is a builtin
+        # and the value is trivially compatible
+        if (var_type and init_value and init_value.get("node_type") == "literal"
+                and _LITERAL_TYPES.get(init_value.get("literal_type")) == var_type):
             self.symbol_table.add_symbol(
                 name=var_name,
                 symbol_type=SymbolType.VARIABLE,
-                type_info=var_type or "any"
+                type_info=var_type
             )
-            
             return var_type
+        
+        # Check if the variable type exists
+        if var_type and not self._is_valid_type(var_type):
+            self._report("undefined_var_type", node["position"], var_name, var_type)
+        
+        # Check initialization value type
+        if init_value:
+            init_type = self._check_node(init_value)
             
-        elif node_type == "assignment":
-            target = node["target"]
-            target_type = self._check_node(target)
-            
-            value = node["value"]
-            value_type = self._check_node(value)
-            
-            # Check if types are compatible
-            if target_type and value_type and not self._are_types_compatible(target_type, value_type):
-                target_name = target.get("name", "expression")
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot assign value of type '{value_type}' to target of type '{target_type}'",
-                    suggestion=f"Use a value of type '{target_type}' or convert the value to '{target_type}'",
-                    position=node["position"]
-                ))
-            
-            # Check if target is immutable (let)
-            if target.get("node_type") == "identifier":
-                symbol = self.symbol_table.lookup(target["name"])
-                if symbol and hasattr(symbol, "is_mutable") and not symbol.is_mutable:
-                    self.errors.append(TypeCheckError(
-                        message=f"Cannot assign to immutable variable '{target['name']}'",
-                        suggestion="Use 'var' instead of 'let' if the variable needs to be mutable",
-                        position=node["position"]
-                    ))
-            
-            return target_type
-            
-        elif node_type == "binary_op":
-            left_type = self._check_node(node["left"])
-            right_type = self._check_node(node["right"])
-            operator = node["operator"]
-            
-            # Check operator compatibility
-            result_type = self._check_binary_op_types(left_type, right_type, operator, node["position"])
-            return result_type
-            
-        elif node_type == "unary_op":
-            operand_type = self._check_node(node["operand"])
-            operator = node["operator"]
-            
-            # Check operator compatibility
-            result_type = self._check_unary_op_types(operand_type, operator, node["position"])
-            return result_type
+            if var_type and init_type and not self._are_types_compatible(var_type, init_type):
+                self._report("var_init_mismatch", node["position"], init_type, var_name, var_type)
             
-        elif node_type == "call":
-            callee = node["callee"]
-            callee_type = self._check_node(callee)
+            # Infer type if not specified
+            if not var_type and init_type:
+                var_type = init_type
+        
+        # Add variable to symbol table
+        self.symbol_table.add_symbol(
+            name=var_name,
+            symbol_type=SymbolType.VARIABLE,
+            type_info=var_type or "any"
+        )
+        
+        return var_type
+    
+    def _check_assignment(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check an assignment node."""
+        target = node["target"]
+        target_type = self._check_node(target)
+        
+        value = node["value"]
+        value_type = self._check_node(value)
+        
+        # Check if types are compatible
+        if target_type and value_type and not self._are_types_compatible(target_type, value_type):
+            target_name = target.get("name", "expression")
+            self._report("assign_mismatch", node["position"], value_type, target_type)
+        
+        # Check if target is immutable (let)
+        if target.get("node_type") == "identifier":
+            symbol = self.symbol_table.lookup(target["name"])
+            if symbol and hasattr(symbol, "is_mutable") and not symbol.is_mutable:
+                self._report("assign_immutable", node["position"], target['name'])
+        
+        return target_type
+    
+    def _check_binary_op(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a binary op node."""
+        return self._check_operator_tree(node)
+    
+    def _check_unary_op(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a unary op node."""
+        return self._check_operator_tree(node)
+    
+    def _check_operator_tree(self, node: Dict[str, Any]) -> Optional[str]:
+        """
+        Check a tree of nested binary and unary operators.
+        
+        Long operator chains nest one level per operator, so the tree is
+        walked with an explicit work list instead of recursing through
+        _check_node for every operator. Operands that are not operators
+        are still checked with _check_node.
+        
+        Args:
+            node: The root binary_op or unary_op node
             
-            # Handle method calls and function calls differently
-            if callee.get("node_type") == "member_access":
-                return self._check_method_call(callee, node.get("args", []), node["position"])
+        Returns:
+            The type of the whole expression, if it is valid
+        """
+        # Entries are (node, expanded); an expanded operator has its operand
+        # types on top of the result stack
+        work = [(node, False)]
+        results: List[Optional[str]] = []
+        while work:
+            current, expanded = work.pop()
+            node_type = current.get("node_type") if current is not None else None
+            
+            if node_type == "binary_op":
+                if expanded:
+                    right_type = results.pop()
+                    left_type = results.pop()
+                    results.append(self._check_binary_op_types(left_type, right_type, current["operator"], current["position"]))
+                else:
+                    # Left is pushed last so it is checked first
+                    work.append((current, True))
+                    work.append((current["right"], False))
+                    work.append((current["left"], False))
+            elif node_type == "unary_op":
+                if expanded:
+                    results.append(self._check_unary_op_types(results.pop(), current["operator"], current["position"]))
+                else:
+                    work.append((current, True))
+                    work.append((current["operand"], False))
             else:
-                return self._check_function_call(callee["name"] if "name" in callee else "", node.get("args", []), node["position"])
-            
-        elif node_type == "if_statement":
-            # Check condition is boolean
-            condition_type = self._check_node(node["condition"])
-            if condition_type and condition_type != "bool":
-                self.errors.append(TypeCheckError(
-                    message=f"If condition must be a boolean, got '{condition_type}'",
-                    suggestion="Use a comparison or logical expression that evaluates to a boolean",
-                    position=node["position"]
-                ))
-            
-            # Check branches
-            self.symbol_table.enter_scope("if_branch")
-            self._check_node(node["then_block"])
-            self.symbol_table.exit_scope()
-            
-            if node.get("else_block"):
-                self.symbol_table.enter_scope("else_branch")
-                self._check_node(node["else_block"])
-                self.symbol_table.exit_scope()
-            
-            # Check elif branches
-            for branch in node.get("elif_branches", []):
-                elif_condition_type = self._check_node(branch["condition"])
-                if elif_condition_type and elif_condition_type != "bool":
-                    self.errors.append(TypeCheckError(
-                        message=f"Elif condition must be a boolean, got '{elif_condition_type}'",
-                        suggestion="Use a comparison or logical expression that evaluates to a boolean",
-                        position=branch["condition"]["position"]
-                    ))
+                results.append(self._check_node(current))
                 
-                self.symbol_table.enter_scope("elif_branch")
-                self._check_node(branch["block"])
-                self.symbol_table.exit_scope()
-            
-        elif node_type == "for_loop":
-            self.in_loop = True
-            
-            # Check iterable is actually iterable
-            iterable_type = self._check_node(node["iterable"])
-            element_type = self._get_element_type(iterable_type)
-            
-            if not element_type:
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot iterate over type '{iterable_type}'",
-                    suggestion="Use a collection type like an array, range, or implement the Iterable trait",
-                    position=node["iterable"]["position"]
-                ))
-            
-            # Set up loop variable in new scope
-            self.symbol_table.enter_scope("for_loop")
-            iterator_name = node["iterator"]["name"] if node["iterator"].get("node_type") == "var_declaration" else node["iterator"]["name"]
-            
-            self.symbol_table.add_symbol(
-                name=iterator_name,
-                symbol_type=SymbolType.VARIABLE,
-                type_info=element_type or "any"
-            )
-            
-            # Check loop body
-            self._check_node(node["body"])
-            
-            self.symbol_table.exit_scope()
-            self.in_loop = False
-            
-        elif node_type == "while_loop":
-            self.in_loop = True
-            
-            # Check condition is boolean
-            condition_type = self._check_node(node["condition"])
-            if condition_type and condition_type != "bool":
-                self.errors.append(TypeCheckError(
-                    message=f"While condition must be a boolean, got '{condition_type}'",
-                    suggestion="Use a comparison or logical expression that evaluates to a boolean",
-                    position=node["condition"]["position"]
-                ))
-            
-            # Check loop body
-            self.symbol_table.enter_scope("while_loop")
-            self._check_node(node["body"])
+        return results[0]
+    
+    def _check_call(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a call node."""
+        callee = node["callee"]
+        callee_type = self._check_node(callee)
+        
+        # Handle method calls and function calls differently
+        if callee.get("node_type") == "member_access":
+            return self._check_method_call(callee, node.get("args", _EMPTY_TUPLE), node["position"])
+        else:
+            return self._check_function_call(callee["name"] if "name" in callee else "", node.get("args", _EMPTY_TUPLE), node["position"])
+    
+    def _check_if_statement(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check an if statement node."""
+        # Check condition is boolean
+        condition_type = self._check_node(node["condition"])
+        if condition_type and condition_type != "bool":
+            self._report("if_condition_not_bool", node["position"], condition_type)
+        
+        # Check branches
+        self.symbol_table.enter_scope("if_branch")
+        self._check_node(node["then_block"])
+        self.symbol_table.exit_scope()
+        
+        if node.get("else_block"):
+            self.symbol_table.enter_scope("else_branch")
+            self._check_node(node["else_block"])
             self.symbol_table.exit_scope()
-            
-            self.in_loop = False
-            
-        elif node_type == "return_statement":
-            # Mark that this function has a return statement
-            self.current_function_returns = True
-            
-            # Check return type matches function return type
-            if self.current_function:
-                expected_type = self.current_function.get("return_type", {}).get("name", "void")
-                
-                if expected_type == "void" and node.get("value"):
-                    self.errors.append(TypeCheckError(
-                        message="Cannot return a value from a function with void return type",
-                        suggestion="Remove the return value or change the function return type",
-                        position=node["position"]
-                    ))
-                elif expected_type != "void":
-                    if not node.get("value"):
-                        self.errors.append(TypeCheckError(
-                            message=f"Function expects return value of type '{expected_type}' but no value is returned",
-                            suggestion=f"Add a return value of type '{expected_type}'",
-                            position=node["position"]
-                        ))
-                    else:
-                        actual_type = self._check_node(node["value"])
-                        if actual_type and not self._are_types_compatible(expected_type, actual_type):
-                            self.errors.append(TypeCheckError(
-                                message=f"Function expects return type '{expected_type}' but got '{actual_type}'",
-                                suggestion=f"Return a value of type '{expected_type}' or convert the current value",
-                                position=node["value"]["position"]
-                            ))
-            
-        elif node_type == "block":
-            self.symbol_table.enter_scope("block")
-            
-            for stmt in node.get("statements", []):
-                self._check_node(stmt)
-                
+        
+        # Check elif branches
+        for branch in node.get("elif_branches", _EMPTY_TUPLE):
+            elif_condition_type = self._check_node(branch["condition"])
+            if elif_condition_type and elif_condition_type != "bool":
+                self._report("elif_condition_not_bool", branch["condition"]["position"], elif_condition_type)
+            
+            self.symbol_table.enter_scope("elif_branch")
+            self._check_node(branch["block"])
             self.symbol_table.exit_scope()
+    
+    def _check_for_loop(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a for loop node."""
+        self.in_loop = True
+        
+        # Check iterable is actually iterable
+        iterable_type = self._check_node(node["iterable"])
+        element_type = self._get_element_type(iterable_type)
+        
+        if not element_type:
+            self._report("not_iterable", node["iterable"]["position"], iterable_type)
+        
+        # Set up loop variable in new scope
+        self.symbol_table.enter_scope("for_loop")
+        iterator_name = node["iterator"]["name"] if node["iterator"].get("node_type") == "var_declaration" else node["iterator"]["name"]
+        
+        self.symbol_table.add_symbol(
+            name=iterator_name,
+            symbol_type=SymbolType.VARIABLE,
+            type_info=element_type or "any"
+        )
+        
+        # Check loop body
+        self._check_node(node["body"])
+        
+        self.symbol_table.exit_scope()
+        self.in_loop = False
+    
+    def _check_while_loop(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a while loop node."""
+        self.in_loop = True
+        
+        # Check condition is boolean
+        condition_type = self._check_node(node["condition"])
+        if condition_type and condition_type != "bool":
+            self._report("while_condition_not_bool", node["condition"]["position"], condition_type)
+        
+        # Check loop body
+        self.symbol_table.enter_scope("while_loop")
+        self._check_node(node["body"])
+        self.symbol_table.exit_scope()
+        
+        self.in_loop = False
+    
+    def _check_return_statement(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a return statement node."""
+        # Mark that this function has a return statement
+        self.current_function_returns = True
+        
+        # Check return type matches function return type
+        if self.current_function:
+            expected_type = self.current_return_type
+            
+            if expected_type == "void" and node.get("value"):
+                self._report("void_return_value", node["position"])
+            elif expected_type != "void":
+                if not node.get("value"):
+                    self._report("missing_return_value", node["position"], expected_type)
+                else:
+                    actual_type = self._check_node(node["value"])
+                    if actual_type and not self._are_types_compatible(expected_type, actual_type):
+                        self._report("return_type_mismatch", node["value"]["position"], expected_type, actual_type)
+    
+    def _check_block(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a block node."""
+        self.symbol_table.enter_scope("block")
+        
+        for stmt in node.get("statements", _EMPTY_TUPLE):
+            self._check_node(stmt)
             
-        elif node_type == "identifier":
-            name = node["name"]
-            symbol = self.symbol_table.lookup(name)
-            
-            if not symbol:
-                self.errors.append(TypeCheckError(
-                    message=f"Undefined symbol '{name}'",
-                    suggestion=f"Declare the variable before using it or check for typos",
-                    position=node["position"]
-                ))
-                return None
-                
-            if symbol.symbol_type == SymbolType.VARIABLE:
-                return symbol.type_info
-            elif symbol.symbol_type == SymbolType.FUNCTION:
-                return "function"
-            elif symbol.symbol_type == SymbolType.TYPE:
-                return "type"
-            
+        self.symbol_table.exit_scope()
+    
+    def _check_identifier(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check an identifier node."""
+        name = node["name"]
+        symbol = self.symbol_table.lookup(name)
+        
+        if not symbol:
+            self._report("undefined_symbol", node["position"], name)
             return None
             
-        elif node_type == "member_access":
-            object_type = self._check_node(node["object"])
-            member_name = node["member"]
-            
-            # Get the field type from the struct or enum
-            field_type = self._get_member_type(object_type, member_name, node["position"])
-            return field_type
+        if symbol.symbol_type == SymbolType.VARIABLE:
+            return symbol.type_info
+        elif symbol.symbol_type == SymbolType.FUNCTION:
+            return "function"
+        elif symbol.symbol_type == SymbolType.TYPE:
+            return "type"
+        
+        return None
+    
+    def _check_member_access(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a member access node."""
+        object_type = self._check_node(node["object"])
+        member_name = node["member"]
+        
+        # Get the field type from the struct or enum
+        field_type = self._get_member_type(object_type, member_name, node["position"])
+        return field_type
+    
+    def _check_literal(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a literal node."""
+        return _LITERAL_TYPES.get(node.get("literal_type"))
+    
+    def _check_match_statement(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a match statement node."""
+        check_node = self._check_node
+        subject_type = check_node(node["subject"])
+        
+        # Bound once, since every branch enters and exits its own scope
+        symbol_table = self.symbol_table
+        enter_scope = symbol_table.enter_scope
+        exit_scope = symbol_table.exit_scope
+        
+        # Check each branch
+        for branch in node.get("branches", _EMPTY_TUPLE):
+            enter_scope("match_branch")
             
-        elif node_type == "literal":
-            literal_type = node.get("literal_type", "")
+            # Check pattern compatibility with subject
+            pattern = branch["pattern"]
+            if pattern.get("node_type") == "identifier":
+                # Binding pattern - adds variable to scope
+                symbol_table.add_symbol(
+                    name=pattern["name"],
+                    symbol_type=SymbolType.VARIABLE,
+                    type_info=subject_type or "any"
+                )
+            elif subject_type:
+                # Check if pattern is compatible with subject type
+                self._check_match_pattern(subject_type, pattern)
             
-            if literal_type == "int":
-                return "int"
-            elif literal_type == "float":
-                return "float"
-            elif literal_type == "bool":
-                return "bool"
-            elif literal_type == "string":
-                return "string"
-            else:
-                return None
-                
-        elif node_type == "match_statement":
-            subject_type = self._check_node(node["subject"])
+            # Check guard condition
+            guard = branch.get("guard")
+            if guard:
+                guard_type = check_node(guard)
+                if guard_type and guard_type != "bool":
+                    self._report("guard_not_bool", guard["position"], guard_type)
             
-            # Check each branch
-            for branch in node.get("branches", []):
-                self.symbol_table.enter_scope("match_branch")
-                
-                # Check pattern compatibility with subject
-                pattern = branch["pattern"]
-                if pattern.get("node_type") == "identifier":
-                    # Binding pattern - adds variable to scope
-                    self.symbol_table.add_symbol(
-                        name=pattern["name"],
-                        symbol_type=SymbolType.VARIABLE,
-                        type_info=subject_type or "any"
-                    )
-                elif subject_type:
-                    # Check if pattern is compatible with subject type
-                    self._check_match_pattern(subject_type, pattern)
-                
-                # Check guard condition
-                if branch.get("guard"):
-                    guard_type = self._check_node(branch["guard"])
-                    if guard_type and guard_type != "bool":
-                        self.errors.append(TypeCheckError(
-                            message=f"Match guard must be a boolean, got '{guard_type}'",
-                            suggestion="Use a comparison or logical expression that evaluates to a boolean",
-                            position=branch["guard"]["position"]
-                        ))
-                
-                # Check branch body
-                self._check_node(branch["body"])
-                
-                self.symbol_table.exit_scope()
-                
-        elif node_type == "await_expression":
-            expression_type = self._check_node(node["expression"])
-            
-            # Check if we're in an async function
-            if self.current_function and not self.current_function.get("is_async", False):
-                self.errors.append(TypeCheckError(
-                    message="Cannot use 'await' outside of an async function",
-                    suggestion="Mark the enclosing function as async using the 'async' keyword",
-                    position=node["position"]
-                ))
-            
-            # Check if expression is awaitable
-            awaitable_type = self._get_awaitable_type(expression_type, node["position"])
-            return awaitable_type
-            
-        elif node_type == "task_spawn":
-            # Check task body
-            self.symbol_table.enter_scope("task")
-            body_type = self._check_node(node["body"])
-            self.symbol_table.exit_scope()
+            # Check branch body
+            check_node(branch["body"])
             
-            # Task types always wrap their result type
-            return f"Task<{body_type or 'void'}>"
+            exit_scope()
+    
+    def _check_await_expression(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check an await expression node."""
+        expression_type = self._check_node(node["expression"])
         
-        return None
+        # Check if we're in an async function
+        if self.current_function and not self.current_function_is_async:
+            self._report("await_outside_async", node["position"])
+        
+        # Check if expression is awaitable
+        awaitable_type = self._get_awaitable_type(expression_type, node["position"])
+        return awaitable_type
+    
+    def _check_task_spawn(self, node: Dict[str, Any], position: SourcePosition) -> Optional[str]:
+        """Check a task spawn node."""
+        # Check task body
+        self.symbol_table.enter_scope("task")
+        body_type = self._check_node(node["body"])
+        self.symbol_table.exit_scope()
+        
+        # Task types always wrap their result type
+        return f"Task<{body_type or 'void'}>"
     
     def _is_valid_type(self, type_name: str) -> bool:
-        """Check if a type name refers to a valid type."""
-        # Primitive types
-        if type_name in ["int", "float", "bool", "string", "void", "any"]:
-            return True
+        """Check if a type name refers to a builtin or a declared struct or enum."""
+        return type_name in self._known_types
+    
+    def _check_declared_types(self, decls: Sequence[Dict[str, Any]], type_names: List[str], kind: str) -> None:
+        """
+        Report every declaration whose type is not a known type.
+        
+        The type names are first checked as one batch, so the common case
+        where all of them are valid costs a single set comparison; only
+        otherwise are the declarations scanned one by one.
+        
+        Args:
+            decls: Field or parameter nodes, each with a name and position
+            type_names: The type name of each node in decls
+            kind: TypeCheckError kind to report for undefined types
+        """
+        known_types = self._known_types
+        if known_types.issuperset(type_names):
+            return
             
-        # Check user-defined types
-        symbol = self.symbol_table.lookup(type_name)
-        return symbol is not None and symbol.symbol_type == SymbolType.TYPE
+        for decl, type_name in zip(decls, type_names):
+            if type_name not in known_types:
+                self._report(kind, decl["position"], decl["name"], type_name)
     
     def _are_types_compatible(self, target_type: str, source_type: str) -> bool:
-        """Check if source_type can be assigned to target_type."""
+        """Check if source_type can be assigned to target_type, memoized per check."""
+        # One row per target type, so a hit needs no key tuple allocation.
+        # Compatibility depends only on the type names, so rows never need
+        # invalidating when new types are declared.
+        row = self._compat_cache.get(target_type)
+        if row is None:
+            row = self._compat_cache[target_type] = {}
+        cached = row.get(source_type)
+        if cached is not None:
+            return cached
+            
+        result = self._compute_types_compatible(target_type, source_type)
+        row[source_type] = result
+        return result
+    
+    def _compute_types_compatible(self, target_type: str, source_type: str) -> bool:
+        """Check if source_type can be assigned to target_type, without the cache."""
         # Same types are always compatible
         if target_type == source_type:
             return True
@@ -656,23 +1160,18 @@ class TypeChecker:
             return True
             
         # Generic type compatibility
-        if "<" in target_type and "<" in source_type:
-            # Extract the base types and type parameters
-            target_base = target_type.split("<")[0]
-            source_base = source_type.split("<")[0]
-            
+        target_base, target_params = self._parse_type(target_type)
+        source_base, source_params = self._parse_type(source_type)
+        if target_params is not None and source_params is not None:
             if target_base != source_base:
                 return False
                 
-            # Extract and check type parameters
-            target_params = target_type[target_type.index("<")+1:target_type.rindex(">")].split(",")
-            source_params = source_type[source_type.index("<")+1:source_type.rindex(">")].split(",")
-            
+            # Check type parameters pairwise
             if len(target_params) != len(source_params):
                 return False
                 
-            for i in range(len(target_params)):
-                if not self._are_types_compatible(target_params[i].strip(), source_params[i].strip()):
+            for target_param, source_param in zip(target_params, source_params):
+                if not self._are_types_compatible(target_param, source_param):
                     return False
                     
             return True
@@ -682,89 +1181,96 @@ class TypeChecker:
         
         return False
     
+    def _parse_type(self, type_name: str) -> Tuple[str, Optional[Tuple[str, ...]]]:
+        """
+        Split a type name into its base name and generic parameters.
+        
+        Parameters are split on top-level commas only, so nested generics
+        such as Result<Map<K,V>,Error> keep their inner commas. The sliced
+        names are interned, and results are cached per check.
+        
+        Args:
+            type_name: The type name, e.g. "Array<int>" or "int"
+            
+        Returns:
+            (base, params), where params is None for non-generic types
+        """
+        parsed = self._type_parse_cache.get(type_name)
+        if parsed is not None:
+            return parsed
+            
+        start = type_name.find("<")
+        end = type_name.rfind(">")
+        intern = sys.intern
+        if start == -1 or end < start:
+            parsed = (type_name, None)
+        elif "<" not in type_name[start + 1:end]:
+            # Flat parameter list: a single C-level split is enough
+            parsed = (intern(type_name[:start]), tuple(intern(param.strip()) for param in type_name[start + 1:end].split(",")))
+        else:
+            params = []
+            depth = 0
+            param_start = start + 1
+            for i in range(start + 1, end):
+                char = type_name[i]
+                if char == "<":
+                    depth += 1
+                elif char == ">":
+                    depth -= 1
+                elif char == "," and depth == 0:
+                    params.append(intern(type_name[param_start:i].strip()))
+                    param_start = i + 1
+            params.append(intern(type_name[param_start:end].strip()))
+            parsed = (intern(type_name[:start]), tuple(params))
+            
+        self._type_parse_cache[type_name] = parsed
+        return parsed
+    
     def _check_binary_op_types(self, left_type: str, right_type: str, operator: str, position: SourcePosition) -> Optional[str]:
         """Check if the binary operator can be applied to the given types."""
+        # Fixed operand combinations resolve with a single table lookup
+        result_type = _BINOP_TABLE.get((operator, left_type, right_type))
+        if result_type is not None:
+            return result_type
+            
         # Handle arithmetic operators
-        if operator in ["+", "-", "*", "/", "%"]:
-            if left_type in ["int", "float"] and right_type in ["int", "float"]:
-                # For mixed numeric operations, result is widest type
-                if left_type == "float" or right_type == "float":
-                    return "float"
-                else:
-                    return "int"
-            elif operator == "+" and left_type == "string" and right_type == "string":
-                # String concatenation
-                return "string"
-            else:
-                self.errors.append(TypeCheckError(
-                    message=f"Operator '{operator}' cannot be applied to types '{left_type}' and '{right_type}'",
-                    suggestion=f"Use numeric types for arithmetic operations or strings for concatenation (+)",
-                    position=position
-                ))
-                return None
+        if operator in _ARITHMETIC_OPS:
+            self._report("invalid_arithmetic", position, operator, left_type, right_type)
+            return None
                 
         # Handle comparison operators
-        elif operator in ["==", "!=", "<", ">", "<=", ">="]:
+        elif operator in _COMPARISON_OPS:
             if left_type is None or right_type is None:
                 return None
                 
             if left_type == right_type:
                 # Same types can always be compared for equality
                 return "bool"
-            elif left_type in ["int", "float"] and right_type in ["int", "float"]:
-                # Mixed numeric comparisons are valid
-                return "bool"
-            else:
-                if operator in ["==", "!="]:
-                    # Only allow equality checks if types are compatible
-                    if self._are_types_compatible(left_type, right_type) or self._are_types_compatible(right_type, left_type):
-                        return "bool"
-                        
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot compare values of types '{left_type}' and '{right_type}' with operator '{operator}'",
-                    suggestion="Use comparable types or implement comparison operators for custom types",
-                    position=position
-                ))
-                return None
+            
+            if operator in _EQUALITY_OPS:
+                # Only allow equality checks if types are compatible
+                if self._are_types_compatible(left_type, right_type) or self._are_types_compatible(right_type, left_type):
+                    return "bool"
+                    
+            self._report("invalid_comparison", position, left_type, right_type, operator)
+            return None
                 
         # Handle logical operators
-        elif operator in ["&&", "||"]:
-            if left_type == "bool" and right_type == "bool":
-                return "bool"
-            else:
-                self.errors.append(TypeCheckError(
-                    message=f"Logical operator '{operator}' requires boolean operands, got '{left_type}' and '{right_type}'",
-                    suggestion="Use boolean expressions for logical operations",
-                    position=position
-                ))
-                return None
+        elif operator in _LOGICAL_OPS:
+            self._report("invalid_logical", position, operator, left_type, right_type)
+            return None
         
         return None
     
     def _check_unary_op_types(self, operand_type: str, operator: str, position: SourcePosition) -> Optional[str]:
         """Check if the unary operator can be applied to the given type."""
-        if operator == "-":
-            if operand_type in ["int", "float"]:
-                return operand_type
-            else:
-                self.errors.append(TypeCheckError(
-                    message=f"Unary minus operator cannot be applied to type '{operand_type}'",
-                    suggestion="Use a numeric type with the negation operator",
-                    position=position
-                ))
-                return None
-                
-        elif operator == "!":
-            if operand_type == "bool":
-                return "bool"
-            else:
-                self.errors.append(TypeCheckError(
-                    message=f"Logical not operator cannot be applied to type '{operand_type}'",
-                    suggestion="Use a boolean value or expression with the logical not operator",
-                    position=position
-                ))
-                return None
-        
+        result_type = _UNOP_TABLE.get((operator, operand_type))
+        if result_type is not None:
+            return result_type
+            
+        kind = _UNOP_ERRORS.get(operator)
+        if kind is not None:
+            self._report(kind, position, operand_type)
         return None
     
     def _check_function_call(self, func_name: str, args: List[Dict[str, Any]], position: SourcePosition) -> Optional[str]:
@@ -772,34 +1278,22 @@ class TypeChecker:
         symbol = self.symbol_table.lookup(func_name)
         
         if not symbol or symbol.symbol_type != SymbolType.FUNCTION:
-            self.errors.append(TypeCheckError(
-                message=f"Call to undefined function '{func_name}'",
-                suggestion="Define the function before calling it or check for typos",
-                position=position
-            ))
+            self._report("undefined_function", position, func_name)
             return None
             
         # Check argument count
-        params = symbol.type_info["params"]
-        if len(args) != len(params):
-            self.errors.append(TypeCheckError(
-                message=f"Function '{func_name}' expects {len(params)} arguments but got {len(args)}",
-                suggestion=f"Provide exactly {len(params)} arguments as defined in the function signature",
-                position=position
-            ))
+        param_types = symbol.type_info["param_types"]
+        if len(args) != len(param_types):
+            self._report("function_arg_count", position, func_name, len(param_types), len(args))
             return None
             
         # Check argument types
         for i, arg in enumerate(args):
             arg_type = self._check_node(arg)
-            param_name, param_type = params[i]
+            param_type = param_types[i]
             
             if arg_type and param_type and not self._are_types_compatible(param_type, arg_type):
-                self.errors.append(TypeCheckError(
-                    message=f"Function '{func_name}' expects parameter '{param_name}' of type '{param_type}' but got '{arg_type}'",
-                    suggestion=f"Provide a value of type '{param_type}' or convert the argument to that type",
-                    position=arg["position"]
-                ))
+                self._report("function_arg_type", arg["position"], func_name, symbol.type_info["param_names"][i], param_type, arg_type)
         
         return symbol.type_info["return_type"]
     
@@ -815,36 +1309,23 @@ class TypeChecker:
         method_info = self._get_method_info(object_type, method_name)
         
         if not method_info:
-            self.errors.append(TypeCheckError(
-                message=f"Type '{object_type}' has no method named '{method_name}'",
-                suggestion=f"Check for typos or implement the method for type '{object_type}'",
-                position=position
-            ))
+            self._report("undefined_method", position, object_type, method_name)
             return None
             
         # Check argument count (accounting for implicit self)
-        params = method_info["params"]
-        expected_arg_count = len(params) - 1  # Subtract 1 for implicit self
+        param_types = method_info["param_types"][1:]  # Skip implicit self
+        expected_arg_count = len(param_types)
         
         if len(args) != expected_arg_count:
-            self.errors.append(TypeCheckError(
-                message=f"Method '{method_name}' expects {expected_arg_count} arguments but got {len(args)}",
-                suggestion=f"Provide exactly {expected_arg_count} arguments as defined in the method signature",
-                position=position
-            ))
+            self._report("method_arg_count", position, method_name, expected_arg_count, len(args))
             return None
             
-        # Check argument types (starting from index 1 to skip self)
-        for i, arg in enumerate(args):
+        # Check argument types against the non-self parameters
+        for arg, param_type in zip(args, param_types):
             arg_type = self._check_node(arg)
-            _, param_type = params[i + 1]  # +1 to skip self
             
             if arg_type and param_type and not self._are_types_compatible(param_type, arg_type):
-                self.errors.append(TypeCheckError(
-                    message=f"Method '{method_name}' expects argument of type '{param_type}' but got '{arg_type}'",
-                    suggestion=f"Provide a value of type '{param_type}' or convert the argument to that type",
-                    position=arg["position"]
-                ))
+                self._report("method_arg_type", arg["position"], method_name, param_type, arg_type)
         
         return method_info["return_type"]
     
@@ -853,60 +1334,75 @@ class TypeChecker:
         if not object_type:
             return None
             
+        # Struct fields resolve with one probe; the rest only classifies errors
+        field_type = self._member_types.get((object_type, member_name))
+        if field_type is not None:
+            return field_type
+            
         # Look up the type
-        symbol = self.symbol_table.lookup(object_type)
-        
-        if not symbol or symbol.symbol_type != SymbolType.TYPE:
-            self.errors.append(TypeCheckError(
-                message=f"Cannot access member '{member_name}' on non-struct/enum type '{object_type}'",
-                suggestion="Use a struct or enum type with the member access operator",
-                position=position
-            ))
+        type_info = self._lookup_type(object_type)
+        if type_info is None:
+            self._report("member_on_non_type", position, member_name, object_type)
             return None
             
-        type_info = symbol.type_info
-        kind = type_info.get("kind", "")
+        kind = type_info["kind"]
         
-        if kind == "struct":
+        if kind is TypeKind.STRUCT:
             # Check struct fields
-            fields = type_info.get("fields", {})
+            fields = type_info.get("fields", _EMPTY_MAPPING)
             if member_name in fields:
                 return fields[member_name]
                 
             # Could be a method, which would be handled by the call node
             
-        elif kind == "enum":
+        elif kind is TypeKind.ENUM:
             # For enums, members are typically methods, handled by the call node
             pass
             
-        self.errors.append(TypeCheckError(
-            message=f"Type '{object_type}' has no member named '{member_name}'",
-            suggestion=f"Check for typos or add the member to type '{object_type}'",
-            position=position
-        ))
+        self._report("undefined_member", position, object_type, member_name)
+        
+        return None
+    
+    def _lookup_type(self, name: str, _type: SymbolType = SymbolType.TYPE) -> Optional[Dict[str, Any]]:
+        """
+        Look up a declared struct, enum, or other type by name.
         
+        Args:
+            name: The type name
+            
+        Returns:
+            The type's type_info, or None if name is not a visible type
+        """
+        symbol = self.symbol_table.lookup(name)
+        if symbol is not None and symbol.symbol_type is _type:
+            return symbol.type_info
         return None
     
     def _get_method_info(self, object_type: str, method_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a method of a struct, enum, or trait."""
         # Look up the type
-        symbol = self.symbol_table.lookup(object_type)
-        
-        if not symbol or symbol.symbol_type != SymbolType.TYPE:
+        type_info = self._lookup_type(object_type)
+        if type_info is None:
             return None
             
-        type_info = symbol.type_info
-        
         # Find method implementation
         # For now, methods are not properly modeled in our prototype
         # This would require tracking method implementations for types
         
         # Simple placeholder for demo purposes
         # In a real implementation, we'd look through the type's methods and trait implementations
-        return {
-            "params": [("self", object_type)],  # Self parameter
-            "return_type": "any"  # Placeholder
-        }
+        # The type lookup above depends on scope, but the info built for a
+        # (type, method) pair does not, so it is shared by every call site
+        key = (object_type, method_name)
+        method_info = self._method_info_cache.get(key)
+        if method_info is None:
+            method_info = self._method_info_cache[key] = {
+                "params": [("self", object_type)],  # Self parameter
+                "param_names": ("self",),
+                "param_types": (object_type,),
+                "return_type": "any"  # Placeholder
+            }
+        return method_info
     
     def _get_element_type(self, collection_type: str) -> Optional[str]:
         """Get the element type of a collection."""
@@ -914,9 +1410,9 @@ class TypeChecker:
             return None
             
         # Array types
-        if collection_type.startswith("Array<") and collection_type.endswith(">"):
-            element_type = collection_type[6:-1]  # Extract type parameter
-            return element_type
+        base, params = self._parse_type(collection_type)
+        if base == "Array" and params is not None and len(params) == 1:
+            return params[0]
             
         # Range type
         if collection_type == "Range":
@@ -936,20 +1432,12 @@ class TypeChecker:
             return None
             
         # Task and Future types
-        if awaitable_type.startswith("Task<") and awaitable_type.endswith(">"):
-            result_type = awaitable_type[5:-1]  # Extract type parameter
-            return result_type
-            
-        if awaitable_type.startswith("Future<") and awaitable_type.endswith(">"):
-            result_type = awaitable_type[7:-1]  # Extract type parameter
-            return result_type
+        base, params = self._parse_type(awaitable_type)
+        if base in _AWAITABLE_TYPES and params is not None and len(params) == 1:
+            return params[0]
             
         # Not an awaitable type
-        self.errors.append(TypeCheckError(
-            message=f"Type '{awaitable_type}' is not awaitable",
-            suggestion="Use a Task<T> or Future<T> type that can be awaited in an async function",
-            position=position
-        ))
+        self._report("not_awaitable", position, awaitable_type)
         return None
     
     def _check_match_pattern(self, subject_type: str, pattern: Dict[str, Any]) -> None:
@@ -960,66 +1448,42 @@ class TypeChecker:
             subject_type: The type of the match subject
             pattern: The pattern AST node
         """
-        if pattern.get("node_type") == "identifier":
+        node_type = pattern.get("node_type")
+        if node_type == "identifier":
             # This is a binding pattern, already handled
             return
             
         # For enum variant patterns
-        if pattern.get("node_type") == "variant_pattern":
+        if node_type == "variant_pattern":
             variant_name = pattern.get("name", "")
             
             # Check if subject is an enum
-            symbol = self.symbol_table.lookup(subject_type)
-            if not symbol or symbol.symbol_type != SymbolType.TYPE:
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot match non-enum type '{subject_type}' against variant pattern",
-                    suggestion=f"Use a simple binding pattern or ensure the matched value is an enum",
-                    position=pattern["position"]
-                ))
-                return
-                
-            type_info = symbol.type_info
-            if type_info.get("kind") != "enum":
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot match non-enum type '{subject_type}' against variant pattern",
-                    suggestion=f"Use a simple binding pattern or ensure the matched value is an enum",
-                    position=pattern["position"]
-                ))
+            type_info = self._lookup_type(subject_type)
+            if type_info is None or type_info["kind"] is not TypeKind.ENUM:
+                self._report("variant_pattern_non_enum", pattern["position"], subject_type)
                 return
                 
             # Check if variant exists
-            variants = type_info.get("variants", {})
+            variants = type_info.get("variants", _EMPTY_MAPPING)
             if variant_name not in variants:
-                self.errors.append(TypeCheckError(
-                    message=f"Enum '{subject_type}' has no variant named '{variant_name}'",
-                    suggestion=f"Use one of the defined variants: {', '.join(variants.keys())}",
-                    position=pattern["position"]
-                ))
+                self._report("undefined_variant", pattern["position"], subject_type, variant_name, ', '.join(variants.keys()))
                 return
                 
             # Check pattern arguments match variant fields
             variant_fields = variants[variant_name]
-            pattern_fields = pattern.get("fields", [])
+            pattern_fields = pattern.get("fields", _EMPTY_TUPLE)
             
             if len(pattern_fields) != len(variant_fields):
-                self.errors.append(TypeCheckError(
-                    message=f"Variant '{variant_name}' expects {len(variant_fields)} fields but got {len(pattern_fields)}",
-                    suggestion=f"Provide the correct number of fields for this variant",
-                    position=pattern["position"]
-                ))
+                self._report("variant_field_count", pattern["position"], variant_name, len(variant_fields), len(pattern_fields))
                 
             # More detailed field checking could be added here
                 
         # Literal patterns
-        elif pattern.get("node_type") == "literal":
+        elif node_type == "literal":
             literal_type = pattern.get("literal_type", "")
             
             if not self._are_types_compatible(subject_type, literal_type):
-                self.errors.append(TypeCheckError(
-                    message=f"Cannot match value of type '{subject_type}' against literal of type '{literal_type}'",
-                    suggestion=f"Use a pattern of type '{subject_type}'",
-                    position=pattern["position"]
-                ))
+                self._report("literal_pattern_mismatch", pattern["position"], subject_type, literal_type)
     
     def check_match_exhaustiveness(self, subject_type: str, branches: List[Dict[str, Any]], position: SourcePosition) -> None:
         """
@@ -1031,41 +1495,26 @@ class TypeChecker:
             position: The source position of the match statement
         """
         # Only check exhaustiveness for enum types
-        symbol = self.symbol_table.lookup(subject_type)
-        if not symbol or symbol.symbol_type != SymbolType.TYPE:
-            return
-            
-        type_info = symbol.type_info
-        if type_info.get("kind") != "enum":
+        type_info = self._lookup_type(subject_type)
+        if type_info is None or type_info["kind"] is not TypeKind.ENUM:
             return
             
-        # Get all variants for this enum
-        all_variants = set(type_info.get("variants", {}).keys())
-        covered_variants = set()
-        has_wildcard = False
-        
         # Check which variants are covered
+        covered_variants = []
         for branch in branches:
-            pattern = branch.get("pattern", {})
+            pattern = branch.get("pattern", _EMPTY_MAPPING)
+            node_type = pattern.get("node_type")
             
-            if pattern.get("node_type") == "identifier":
-                # This is a catch-all binding pattern
-                has_wildcard = True
-                break
+            if node_type == "identifier":
+                # A catch-all binding pattern covers every variant, so
+                # nothing else needs to be collected
+                return
                 
-            elif pattern.get("node_type") == "variant_pattern":
-                variant_name = pattern.get("name", "")
-                covered_variants.add(variant_name)
+            elif node_type == "variant_pattern":
+                covered_variants.append(pattern.get("name", ""))
         
-        # If we have a wildcard pattern, all variants are covered
-        if has_wildcard:
-            return
-            
         # Check if all variants are covered
-        missing_variants = all_variants - covered_variants
+        missing_variants = type_info["variant_set"].difference(covered_variants)
         if missing_variants:
-            self.errors.append(TypeCheckError(
-                message=f"Match statement for enum '{subject_type}' is not exhaustive, missing variants: {', '.join(missing_variants)}",
-                suggestion="Add patterns for all variants or include a catch-all pattern with '_'",
-                position=position
-            ))
\ No newline at end of file
+            # Sorted so the message does not depend on set iteration order
+            self._report("non_exhaustive_match", position, subject_type, ', '.join(sorted(missing_variants)))
\ No newline at end of file
@@ -1,26 +1,6 @@
-class StandardLibrary:
-    """Defines the core standard library functions for AegisLang."""
-
-    def __init__(self):
-        self.library = {}
-
-    def register_builtin_functions(self):
-        """Registers core built-in functions."""
-        self.library["print"] = {
-            "params": [("message", "string")],
-            "return": "void",
-            "llvm_ir": self.generate_print_function(),
-        }
-
-        self.library["add"] = {
-            "params": [("a", "int"), ("b", "int")],
-            "return": "int",
-            "llvm_ir": self.generate_add_function(),
-        }
-
-    def generate_print_function(self):
-        """Generates LLVM IR for a print function."""
-        return """
+# LLVM IR for each library function. The text never changes, so it is
+# defined once here rather than rebuilt on every registration.
+_PRINT_IR = """
         declare void @puts(i8*)
         
         define void @print(i8* %message) {
@@ -29,73 +9,28 @@ class StandardLibrary:
         }
         """
 
-    def generate_add_function(self):
-        """Generates LLVM IR for an integer addition function."""
-        return """
+_ADD_IR = """
         define i64 @add(i64 %a, i64 %b) {
             %sum = add i64 %a, %b
             ret i64 %sum
         }
         """
 
-
-class ExtendedStandardLibrary(StandardLibrary):
-    """Expands the standard library with more built-in functions."""
-
-    def register_extended_functions(self):
-        """Registers additional utility functions."""
-
-        self.library["subtract"] = {
-            "params": [("a", "int"), ("b", "int")],
-            "return": "int",
-            "llvm_ir": self.generate_subtract_function(),
-        }
-
-        self.library["multiply"] = {
-            "params": [("a", "int"), ("b", "int")],
-            "return": "int",
-            "llvm_ir": self.generate_multiply_function(),
-        }
-
-        self.library["divide"] = {
-            "params": [("a", "int"), ("b", "int")],
-            "return": "Result<int, string>",
-            "llvm_ir": self.generate_divide_function(),
-        }
-
-        self.library["length"] = {
-            "params": [("s", "string")],
-            "return": "int",
-            "llvm_ir": self.generate_length_function(),
-        }
-
-        self.library["concat"] = {
-            "params": [("s1", "string"), ("s2", "string")],
-            "return": "string",
-            "llvm_ir": self.generate_concat_function(),
-        }
-
-    def generate_subtract_function(self):
-        """Generates LLVM IR for subtraction."""
-        return """
+_SUBTRACT_IR = """
         define i64 @subtract(i64 %a, i64 %b) {
             %diff = sub i64 %a, %b
             ret i64 %diff
         }
         """
 
-    def generate_multiply_function(self):
-        """Generates LLVM IR for multiplication."""
-        return """
+_MULTIPLY_IR = """
         define i64 @multiply(i64 %a, i64 %b) {
             %product = mul i64 %a, %b
             ret i64 %product
         }
         """
 
-    def generate_divide_function(self):
-        """Generates LLVM IR for safe division (returns Result<int, string>)."""
-        return """
+_DIVIDE_IR = """
         define i64 @divide(i64 %a, i64 %b) {
             %is_zero = icmp eq i64 %b, 0
             br i1 %is_zero, label %error, label %continue
@@ -109,9 +44,7 @@ class ExtendedStandardLibrary(StandardLibrary):
         }
         """
 
-    def generate_length_function(self):
-        """Generates LLVM IR for string length calculation."""
-        return """
+_LENGTH_IR = """
         declare i64 @strlen(i8*)
 
         define i64 @length(i8* %s) {
@@ -120,9 +53,7 @@ class ExtendedStandardLibrary(StandardLibrary):
         }
         """
 
-    def generate_concat_function(self):
-        """Generates LLVM IR for string concatenation."""
-        return """
+_CONCAT_IR = """
         declare i8* @strcat(i8*, i8*)
 
         define i8* @concat(i8* %s1, i8* %s2) {
@@ -131,55 +62,7 @@ class ExtendedStandardLibrary(StandardLibrary):
         }
         """
 
-
-class FullStandardLibrary(ExtendedStandardLibrary):
-    """Further expands the standard library with file I/O, networking, and date/time utilities."""
-
-    def register_advanced_functions(self):
-        """Registers file I/O, networking, and date/time functions."""
-
-        # File I/O Functions
-        self.library["read_file"] = {
-            "params": [("filename", "string")],
-            "return": "string",
-            "llvm_ir": self.generate_read_file_function(),
-        }
-
-        self.library["write_file"] = {
-            "params": [("filename", "string"), ("content", "string")],
-            "return": "bool",
-            "llvm_ir": self.generate_write_file_function(),
-        }
-
-        # HTTP Networking Functions
-        self.library["http_get"] = {
-            "params": [("url", "string")],
-            "return": "string",
-            "llvm_ir": self.generate_http_get_function(),
-        }
-
-        self.library["http_post"] = {
-            "params": [("url", "string"), ("data", "string")],
-            "return": "string",
-            "llvm_ir": self.generate_http_post_function(),
-        }
-
-        # Date/Time Functions
-        self.library["current_timestamp"] = {
-            "params": [],
-            "return": "int",
-            "llvm_ir": self.generate_current_timestamp_function(),
-        }
-
-        self.library["format_date"] = {
-            "params": [("timestamp", "int"), ("format", "string")],
-            "return": "string",
-            "llvm_ir": self.generate_format_date_function(),
-        }
-
-    def generate_read_file_function(self):
-        """Generates LLVM IR for reading a file."""
-        return """
+_READ_FILE_IR = """
         declare i8* @read_file(i8*)
         
         define i8* @read_file_wrapper(i8* %filename) {
@@ -188,9 +71,7 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
-    def generate_write_file_function(self):
-        """Generates LLVM IR for writing to a file."""
-        return """
+_WRITE_FILE_IR = """
         declare i1 @write_file(i8*, i8*)
         
         define i1 @write_file_wrapper(i8* %filename, i8* %content) {
@@ -199,9 +80,7 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
-    def generate_http_get_function(self):
-        """Generates LLVM IR for HTTP GET requests."""
-        return """
+_HTTP_GET_IR = """
         declare i8* @http_get(i8*)
         
         define i8* @http_get_wrapper(i8* %url) {
@@ -210,9 +89,7 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
-    def generate_http_post_function(self):
-        """Generates LLVM IR for HTTP POST requests."""
-        return """
+_HTTP_POST_IR = """
         declare i8* @http_post(i8*, i8*)
         
         define i8* @http_post_wrapper(i8* %url, i8* %data) {
@@ -221,9 +98,7 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
-    def generate_current_timestamp_function(self):
-        """Generates LLVM IR for getting the current timestamp."""
-        return """
+_CURRENT_TIMESTAMP_IR = """
         declare i64 @current_timestamp()
         
         define i64 @current_timestamp_wrapper() {
@@ -232,9 +107,7 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
-    def generate_format_date_function(self):
-        """Generates LLVM IR for formatting timestamps."""
-        return """
+_FORMAT_DATE_IR = """
         declare i8* @format_date(i64, i8*)
         
         define i8* @format_date_wrapper(i64 %timestamp, i8* %format) {
@@ -243,6 +116,125 @@ class FullStandardLibrary(ExtendedStandardLibrary):
         }
         """
 
+# Registration specs: (name, params, return type, LLVM IR) per function.
+# Params are (name, type) tuples, immutable and shared by every instance.
+
+# Core built-in functions
+_BUILTIN_SPEC = (
+    ("print", (("message", "string"),), "void", _PRINT_IR),
+    ("add", (("a", "int"), ("b", "int")), "int", _ADD_IR),
+)
+
+# Additional utility functions
+_EXTENDED_SPEC = (
+    ("subtract", (("a", "int"), ("b", "int")), "int", _SUBTRACT_IR),
+    ("multiply", (("a", "int"), ("b", "int")), "int", _MULTIPLY_IR),
+    ("divide", (("a", "int"), ("b", "int")), "Result<int, string>", _DIVIDE_IR),
+    ("length", (("s", "string"),), "int", _LENGTH_IR),
+    ("concat", (("s1", "string"), ("s2", "string")), "string", _CONCAT_IR),
+)
+
+# File I/O, networking, and date/time functions
+_ADVANCED_SPEC = (
+    # File I/O Functions
+    ("read_file", (("filename", "string"),), "string", _READ_FILE_IR),
+    ("write_file", (("filename", "string"), ("content", "string")), "bool", _WRITE_FILE_IR),
+    # HTTP Networking Functions
+    ("http_get", (("url", "string"),), "string", _HTTP_GET_IR),
+    ("http_post", (("url", "string"), ("data", "string")), "string", _HTTP_POST_IR),
+    # Date/Time Functions
+    ("current_timestamp", (), "int", _CURRENT_TIMESTAMP_IR),
+    ("format_date", (("timestamp", "int"), ("format", "string")), "string", _FORMAT_DATE_IR),
+)
+
+
+class StandardLibrary:
+    """Defines the core standard library functions for AegisLang."""
+
+    def __init__(self):
+        self.library = {}
+
+    def _register_from_spec(self, spec):
+        """Registers every function described by a (name, params, return, llvm_ir) spec."""
+        for name, params, return_type, llvm_ir in spec:
+            self.library[name] = {
+                "params": params,
+                "return": return_type,
+                "llvm_ir": llvm_ir,
+            }
+
+    def register_builtin_functions(self):
+        """Registers core built-in functions."""
+        self._register_from_spec(_BUILTIN_SPEC)
+
+    def generate_print_function(self):
+        """Generates LLVM IR for a print function."""
+        return _PRINT_IR
+
+    def generate_add_function(self):
+        """Generates LLVM IR for an integer addition function."""
+        return _ADD_IR
+
+
+class ExtendedStandardLibrary(StandardLibrary):
+    """Expands the standard library with more built-in functions."""
+
+    def register_extended_functions(self):
+        """Registers additional utility functions."""
+        self._register_from_spec(_EXTENDED_SPEC)
+
+    def generate_subtract_function(self):
+        """Generates LLVM IR for subtraction."""
+        return _SUBTRACT_IR
+
+    def generate_multiply_function(self):
+        """Generates LLVM IR for multiplication."""
+        return _MULTIPLY_IR
+
+    def generate_divide_function(self):
+        """Generates LLVM IR for safe division (returns Result<int, string>)."""
+        return _DIVIDE_IR
+
+    def generate_length_function(self):
+        """Generates LLVM IR for string length calculation."""
+        return _LENGTH_IR
+
+    def generate_concat_function(self):
+        """Generates LLVM IR for string concatenation."""
+        return _CONCAT_IR
+
+
+class FullStandardLibrary(ExtendedStandardLibrary):
+    """Further expands the standard library with file I/O, networking, and date/time utilities."""
+
+    def register_advanced_functions(self):
+        """Registers file I/O, networking, and date/time functions."""
+        self._register_from_spec(_ADVANCED_SPEC)
+
+    def generate_read_file_function(self):
+        """Generates LLVM IR for reading a file."""
+        return _READ_FILE_IR
+
+    def generate_write_file_function(self):
+        """Generates LLVM IR for writing to a file."""
+        return _WRITE_FILE_IR
+
+    def generate_http_get_function(self):
+        """Generates LLVM IR for HTTP GET requests."""
+        return _HTTP_GET_IR
+
+    def generate_http_post_function(self):
+        """Generates LLVM IR for HTTP POST requests."""
+        return _HTTP_POST_IR
+
+    def generate_current_timestamp_function(self):
+        """Generates LLVM IR for getting the current timestamp."""
+        return _CURRENT_TIMESTAMP_IR
+
+    def generate_format_date_function(self):
+        """Generates LLVM IR for formatting timestamps."""
+        return _FORMAT_DATE_IR
+
 
 # Example usage:
 if __name__ == "__main__":
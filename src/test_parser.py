@@ -4,7 +4,6 @@ Test script for the Aegis parser.
 This script loads and parses an Aegis file using the ANTLR-based parser.
 """
 
-import os
 import sys
 import json
 from pathlib import Path
@@ -23,7 +22,7 @@ def main():
         sys.exit(1)
     
     file_path = sys.argv[1]
-    if not os.path.exists(file_path):
+    if not Path(file_path).is_file():
         print(f"Error: File '{file_path}' not found.")
         sys.exit(1)
     
@@ -3,6 +3,7 @@
 Test script for the indentation preprocessor.
 """
 
+import mmap
 import sys
 import os
 from pathlib import Path
@@ -15,6 +16,32 @@ if script_dir not in sys.path:
 from lexer.indentation_lexer import AegisIndentationLexer
 
 
+def read_source(path):
+    """
+    Read a UTF-8 source file through a read-only memory map.
+    
+    The mapped bytes are decoded straight into a str, without first being
+    copied into an intermediate bytes object. Line endings are normalized
+    to '\n' as text-mode reads would.
+    
+    Args:
+        path: Path to the source file
+        
+    Returns:
+        The file contents
+    """
+    with open(path, 'rb') as f:
+        # Empty files cannot be memory mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 def main():
     """Test the indentation preprocessor."""
     if len(sys.argv) < 2:
@@ -22,8 +49,7 @@ def main():
         sys.exit(1)
     
     # Read the input file
-    with open(sys.argv[1], 'r') as f:
-        input_text = f.read()
+    input_text = read_source(sys.argv[1])
     
     # Preprocess the input
     preprocessor = AegisIndentationLexer(None)
@@ -1,32 +1,115 @@
-from llvmlite import ir
+import functools
+import hashlib
 
+from llvmlite import ir, binding
+from src.compiler.code_generator import CodeGenerator
+from utils.logger import get_logger
 
-# Enabling Compilation to WebAssembly (WASM) for AegisLang
-class WebAssemblyCompiler:
-    """Compiles AegisLang LLVM IR into WebAssembly (WASM) bytecode."""
+logger = get_logger(__name__)
 
-    def __init__(self, llvm_ir):
-        self.llvm_ir = llvm_ir
+# Initialize LLVM; the WebAssembly backend is not the native target, so all
+# targets are registered
+binding.initialize()
+binding.initialize_all_targets()
+binding.initialize_all_asmprinters()
+
+WASM_TARGET_TRIPLE = "wasm32-unknown-unknown"
 
-    def compile_to_wasm(self):
-        """Compiles the LLVM IR to WASM."""
-        # Create a WASM-compatible target machine
-        target_triple = "wasm32-unknown-unknown"
-        target = binding.Target.from_triple(target_triple)
-        target_machine = target.create_target_machine(codemodel="default")
+# AegisLang types -> WASM-compatible LLVM types, built once; llvmlite types are immutable
+_WASM_TYPE_MAP = {
+    "int": ir.IntType(32),  # WebAssembly prefers 32-bit integers
+    "float": ir.FloatType(),
+    "bool": ir.IntType(1),
+    "string": ir.PointerType(ir.IntType(8)),  # WASM handles strings as memory pointers
+}
+_WASM_VOID = ir.VoidType()
 
-        # Convert LLVM IR to WASM binary format
-        llvm_module = binding.parse_assembly(self.llvm_ir)
-        llvm_module.verify()
 
-        object_code = target_machine.emit_object(llvm_module)
+@functools.lru_cache(maxsize=1)
+def _wasm_target_machine():
+    """Create the WASM target machine once and share it between compilations."""
+    target = binding.Target.from_triple(WASM_TARGET_TRIPLE)
+    return target.create_target_machine(codemodel="default")
 
-        # Save the compiled WASM file
-        wasm_filename = "output.wasm"
-        with open(wasm_filename, "wb") as wasm_file:
-            wasm_file.write(object_code)
 
-        return f"WebAssembly compilation successful. Output saved as '{wasm_filename}'."
+# blake2b digests of the IR texts that have passed verification. Only the
+# outcome is shared between compilers, never a parsed module: emission
+# modifies the module it compiles, so every compiler parses its own.
+_VERIFIED_IR_DIGESTS = set()
+
+
+# Enabling Compilation to WebAssembly (WASM) for AegisLang
+class WebAssemblyCompiler:
+    """Compiles AegisLang LLVM IR into WebAssembly (WASM) bytecode."""
+
+    def __init__(self, llvm_ir):
+        """
+        Args:
+            llvm_ir: LLVM IR text, an llvmlite ir.Module, or an already
+                parsed binding.ModuleRef. A ModuleRef is compiled in place,
+                without a copy, and is modified by emission (LLVM adds the
+                target's data layout and function attributes to it); pass
+                str(module_ref) to leave the caller's module untouched
+        """
+        self.llvm_ir = llvm_ir
+        self._verified = None  # Parsed and verified module, set on first compile
+
+    def prepare(self):
+        """
+        Parse and verify the IR, once per compiler.
+        
+        For text and ir.Module inputs, each compiler parses its own copy of
+        the module, but IR that another compiler already verified (matched
+        by digest) is not verified again.
+        
+        Returns:
+            The verified binding.ModuleRef
+        """
+        if self._verified is None:
+            if isinstance(self.llvm_ir, binding.ModuleRef):
+                # Used in place; emit() modifies the caller's module
+                llvm_module = self.llvm_ir
+                llvm_module.verify()
+            else:
+                # str() of an ir.Module is its IR text
+                ir_text = str(self.llvm_ir)
+                llvm_module = binding.parse_assembly(ir_text)
+                ir_digest = hashlib.blake2b(ir_text.encode(), digest_size=16).digest()
+                if ir_digest not in _VERIFIED_IR_DIGESTS:
+                    llvm_module.verify()
+                    _VERIFIED_IR_DIGESTS.add(ir_digest)
+            self._verified = llvm_module
+        return self._verified
+
+    def emit(self):
+        """
+        Emit a WASM object for the prepared module.
+        
+        Returns:
+            The object code as bytes
+        """
+        # WASM-compatible target machine, created on first use
+        return _wasm_target_machine().emit_object(self.prepare())
+
+    def compile_to_wasm(self, out_path=None):
+        """
+        Compiles the LLVM IR to WASM.
+        
+        Args:
+            out_path: File to save the WASM object to; nothing is written
+                when None
+        
+        Returns:
+            The WASM object code as bytes
+        """
+        object_code = self.emit()
+
+        if out_path is not None:
+            with open(out_path, "wb") as wasm_file:
+                wasm_file.write(object_code)
+            logger.info(f"WebAssembly compilation successful. Output saved as '{out_path}'.")
+
+        return object_code
 
 
 # Generating WebAssembly-Compatible LLVM IR
@@ -37,7 +120,7 @@ class WebAssemblyIRGenerator(CodeGenerator):
 
     def __init__(self, ast):
         super().__init__(ast)
-        self.module.triple = "wasm32-unknown-unknown"
+        self.module.triple = WASM_TARGET_TRIPLE
 
     def generate_function(self, function_node):
         """Generates WASM-compatible LLVM function definitions."""
@@ -60,14 +143,5 @@ class WebAssemblyIRGenerator(CodeGenerator):
 
     def get_wasm_compatible_type(self, aegis_type):
         """Maps AegisLang types to WASM-compatible LLVM types."""
-        wasm_type_map = {
-            "int": ir.IntType(32),  # WebAssembly prefers 32-bit integers
-            "float": ir.FloatType(),
-            "bool": ir.IntType(1),
-            "string": ir.PointerType(
-                ir.IntType(8)
-            ),  # WASM handles strings as memory pointers
-        }
-        return wasm_type_map.get(
-            aegis_type, ir.VoidType()
-        )  # Default to void if unknown
+        return _WASM_TYPE_MAP.get(aegis_type, _WASM_VOID)  # Default to void if unknown
+
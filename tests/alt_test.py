@@ -5,8 +5,9 @@ from src.compiler.type_checker import TypeChecker
 from src.compiler.code_generator import CodeGenerator
 
 class CompilerTest(unittest.TestCase):
-    def setUp(self):
-        self.source_code = """
+    @classmethod
+    def setUpClass(cls):
+        cls.source_code = """
         module TestModule:
             struct User:
                 name: string
@@ -15,22 +16,18 @@ class CompilerTest(unittest.TestCase):
             fn create_user(name: string) -> User:
                 return User(name, 25)
         """
+        # Lex and parse once; every test works from the same tokens and AST
+        cls.tokens = lex(cls.source_code)
+        cls.ast = AegisParser(cls.tokens).parse()
 
     def test_lexer(self):
-        tokens = lex(self.source_code)
-        self.assertTrue(len(tokens) > 0)
+        self.assertTrue(len(self.tokens) > 0)
 
     def test_parser(self):
-        tokens = lex(self.source_code)
-        parser = AegisParser(tokens)
-        ast = parser.parse()
-        self.assertEqual(ast.node_type, "Module")
+        self.assertEqual(self.ast.node_type, "Module")
 
     def test_type_checker(self):
-        tokens = lex(self.source_code)
-        parser = AegisParser(tokens)
-        ast = parser.parse()
-        type_checker = TypeChecker(ast)
+        type_checker = TypeChecker(self.ast)
         self.assertEqual(type_checker.check(), "Semantic Analysis Passed")
 
 
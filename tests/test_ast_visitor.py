@@ -6,334 +6,272 @@ in the Aegis language, ensuring the AST structure is properly created.
 """
 
 import unittest
+from functools import lru_cache
+from operator import itemgetter
 from src.parser.aeigix_ast_visitor import AegisASTVisitor, SourcePosition
-from dataclasses import asdict
 from typing import Dict, Any
 
+class MockNode:
+    """
+    Stand-in for an ANTLR parse tree node.
+    
+    A single slotted class shared by every mock, rather than a new class per
+    node; as with a class, reading an attribute that was not given raises
+    AttributeError.
+    """
+    __slots__ = (
+        "bindings", "body", "branches", "column", "condition", "else_branch",
+        "expression", "field_type", "guard", "is_async", "left", "line",
+        "literal_type", "name", "operator", "param_type", "parameters",
+        "pattern", "return_type", "right", "subject", "then_branch", "traits",
+        "type", "type_params", "value",
+    )
+    
+    def __init__(self, **attrs):
+        for key, value in attrs.items():
+            setattr(self, key, value)
+
+# Shared empty sequences for fixture nodes; the visitor only iterates them
+_EMPTY_BODY = ()
+_EMPTY_PARAMS = ()
+
+# Builders for the node shapes the fixtures have in common
+
+def _identifier(name, line, column):
+    return MockNode(type='identifier', name=name, line=line, column=column)
+
+def _literal(value, literal_type, line, column):
+    return MockNode(type='literal', value=value, literal_type=literal_type, line=line, column=column)
+
+def _return(value, line, column):
+    return MockNode(type='return_statement', value=value, line=line, column=column)
+
+def _expr(spec):
+    """
+    Build an expression node tree from a flat tuple spec.
+    
+    Specs are ('id', name, line, column), ('lit', value, literal_type, line,
+    column) or (operator, left_spec, right_spec, line, column).
+    """
+    tag = spec[0]
+    if tag == 'id':
+        return _identifier(*spec[1:])
+    if tag == 'lit':
+        return _literal(*spec[1:])
+    _, left, right, line, column = spec
+    return MockNode(
+        type='binary_operation',
+        operator=tag,
+        left=_expr(left),
+        right=_expr(right),
+        line=line,
+        column=column
+    )
+
+def _function(name, parameters, return_type, body, **extra):
+    return MockNode(
+        name=name,
+        parameters=parameters,
+        return_type=return_type,
+        body=body,
+        line=1,
+        column=1,
+        type='function',
+        **extra
+    )
+
+def _build_module():
+    return MockNode(name='TestModule', body=_EMPTY_BODY, line=1, column=1)
+
+def _build_struct():
+    field1 = MockNode(type='field', name='id', field_type=MockNode(name='int'), line=2, column=5)
+    field2 = MockNode(type='field', name='name', field_type=MockNode(name='string'), line=3, column=5)
+    return MockNode(name='User', body=[field1, field2], line=1, column=1, traits=())
+
+def _build_add_function():
+    param = MockNode(name='x', param_type=MockNode(name='int'), line=2, column=10)
+    return _function('add', [param], MockNode(name='int'), [_return(_literal(42, 'int', 3, 12), 3, 5)])
+
+def _build_option_function():
+    # A function returning Option<User>
+    option_type = MockNode(name='Option', type_params=[MockNode(name='User')], line=1, column=10)
+    return _function('get_user', _EMPTY_PARAMS, option_type, _EMPTY_BODY)
+
+def _build_async_function():
+    return _function(
+        'fetch_data', _EMPTY_PARAMS, MockNode(name='string'),
+        [_return(_literal("result", 'string', 2, 12), 2, 5)],
+        is_async=True
+    )
+
+def _build_if_statement():
+    # if x > 0: return x else: return 0
+    return MockNode(
+        type='if_statement',
+        condition=_expr(('>', ('id', 'x', 2, 5), ('lit', 0, 'int', 2, 9), 2, 7)),
+        then_branch=[_return(_identifier('x', 3, 12), 3, 5)],
+        else_branch=[_return(_literal(0, 'int', 5, 12), 5, 5)],
+        line=1,
+        column=1
+    )
+
+def _build_match_option():
+    # match result: Some(value) => value, None => 0
+    some_pattern = MockNode(
+        type='constructor_pattern',
+        name='Some',
+        bindings=[MockNode(type='binding_pattern', name='value', line=2, column=10)],
+        line=2,
+        column=5
+    )
+    some_body = MockNode(
+        type='expression_statement',
+        expression=_identifier('value', 2, 20),
+        line=2,
+        column=15
+    )
+    none_pattern = MockNode(type='constructor_pattern', name='None', bindings=(), line=3, column=5)
+    branches = [
+        MockNode(pattern=some_pattern, body=some_body, guard=None, line=2, column=5),
+        MockNode(pattern=none_pattern, body=_literal(0, 'int', 3, 15), guard=None, line=3, column=5)
+    ]
+    return MockNode(
+        type='match_statement',
+        subject=_identifier('result', 1, 7),
+        branches=branches,
+        line=1,
+        column=1
+    )
+
+# Extract the values a test compares in one call, as a tuple
+_kind_and_name = itemgetter("node_type", "name")
+_name = itemgetter("name")
+
+_FIXTURE_BUILDERS = {
+    "module": _build_module,
+    "struct": _build_struct,
+    "add_function": _build_add_function,
+    "option_function": _build_option_function,
+    "async_function": _build_async_function,
+    "if_statement": _build_if_statement,
+    "match_option": _build_match_option,
+}
+
+@lru_cache(maxsize=None)
+def _fixture(kind):
+    """Return the mock node tree for kind, built once and shared; the visitor only reads it."""
+    return _FIXTURE_BUILDERS[kind]()
+
 class TestASTVisitor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.shared_visitor = AegisASTVisitor(source_file="test.ae")
+        # Node type -> visit method, looked up once instead of via hasattr per test
+        cls.dispatch = AegisASTVisitor._dispatch
+    
     def setUp(self):
-        self.visitor = AegisASTVisitor(source_file="test.ae")
-        
+        # Reuse one visitor, clearing whatever the previous test left behind
+        self.visitor = self.shared_visitor
+        self.visitor.reset()
+    
     def test_visit_module(self):
         """Test module node visitation"""
-        # Create a mock module node
-        module_node = type('obj', (object,), {
-            'name': 'TestModule',
-            'body': [],
-            'line': 1,
-            'column': 1
-        })
-        
-        result = self.visitor.visit_module(module_node)
-        
-        self.assertEqual(result["node_type"], "module")
-        self.assertEqual(result["name"], "TestModule")
-        self.assertEqual(len(result["children"]), 0)
+        result = self.visitor.visit_module(_fixture("module"))
         
+        self.assertEqual(
+            {"kind": _kind_and_name(result), "n_children": len(result["children"])},
+            {"kind": ("module", "TestModule"), "n_children": 0}
+        )
+    
     def test_visit_struct(self):
         """Test struct node visitation"""
-        # Create a mock struct node with fields
-        field1 = type('obj', (object,), {
-            'type': 'field',
-            'name': 'id',
-            'field_type': type('obj', (object,), {'name': 'int'}),
-            'line': 2,
-            'column': 5
-        })
-        field2 = type('obj', (object,), {
-            'type': 'field',
-            'name': 'name',
-            'field_type': type('obj', (object,), {'name': 'string'}),
-            'line': 3,
-            'column': 5
-        })
-        
-        struct_node = type('obj', (object,), {
-            'name': 'User',
-            'body': [field1, field2],
-            'line': 1,
-            'column': 1,
-            'traits': []
-        })
-        
-        result = self.visitor.visit_struct(struct_node)
-        
-        self.assertEqual(result["node_type"], "struct")
-        self.assertEqual(result["name"], "User")
-        self.assertEqual(len(result["fields"]), 2)
-        self.assertEqual(result["fields"][0]["name"], "id")
-        
+        result = self.visitor.visit_struct(_fixture("struct"))
+        
+        self.assertEqual(
+            {
+                "kind": _kind_and_name(result),
+                "n_fields": len(result["fields"]),
+                "first_field": _name(result["fields"][0]),
+            },
+            {"kind": ("struct", "User"), "n_fields": 2, "first_field": "id"}
+        )
+    
     def test_visit_function(self):
         """Test function node visitation"""
-        # Create a mock function node
-        ret_type = type('obj', (object,), {'name': 'int'})
-        param = type('obj', (object,), {
-            'name': 'x',
-            'param_type': type('obj', (object,), {'name': 'int'}),
-            'line': 2,
-            'column': 10
-        })
-        
-        stmt = type('obj', (object,), {
-            'type': 'return_statement',
-            'value': type('obj', (object,), {
-                'type': 'literal',
-                'value': 42,
-                'literal_type': 'int',
-                'line': 3,
-                'column': 12
-            }),
-            'line': 3,
-            'column': 5
-        })
-        
-        function_node = type('obj', (object,), {
-            'name': 'add',
-            'parameters': [param],
-            'return_type': ret_type,
-            'body': [stmt],
-            'line': 1,
-            'column': 1,
-            'type': 'function'
-        })
-        
-        result = self.visitor.visit_function(function_node)
-        
-        self.assertEqual(result["node_type"], "function")
-        self.assertEqual(result["name"], "add")
-        self.assertEqual(len(result["parameters"]), 1)
-        self.assertEqual(result["parameters"][0]["name"], "x")
-        
+        result = self.visitor.visit_function(_fixture("add_function"))
+        
+        self.assertEqual(
+            {
+                "kind": _kind_and_name(result),
+                "n_parameters": len(result["parameters"]),
+                "first_parameter": _name(result["parameters"][0]),
+            },
+            {"kind": ("function", "add"), "n_parameters": 1, "first_parameter": "x"}
+        )
+    
     def test_visit_option_type(self):
         """Test option type visitation"""
-        # Create a mock Option<T> type node
-        inner_type = type('obj', (object,), {'name': 'User'})
-        option_type = type('obj', (object,), {
-            'name': 'Option',
-            'type_params': [inner_type],
-            'line': 1,
-            'column': 10
-        })
-        
-        # Mock a function return type using Option<User>
-        function_node = type('obj', (object,), {
-            'name': 'get_user',
-            'parameters': [],
-            'return_type': option_type,
-            'body': [],
-            'line': 1,
-            'column': 1,
-            'type': 'function'
-        })
-        
-        result = self.visitor.visit_function(function_node)
-        
-        # Verify that the return type is properly captured
-        self.assertEqual(result["node_type"], "function")
-        self.assertEqual(result["name"], "get_user")
-        # The return_type structure depends on visitor implementation
-        self.assertTrue("return_type" in result)
-        
+        result = self.visitor.visit_function(_fixture("option_function"))
+        
+        # Verify that the return type is properly captured; its structure
+        # depends on visitor implementation, so only its presence is checked
+        self.assertEqual(
+            {"kind": _kind_and_name(result), "has_return_type": "return_type" in result},
+            {"kind": ("function", "get_user"), "has_return_type": True}
+        )
+    
     def test_visit_if_statement(self):
         """Test if statement visitation"""
-        # Create a mock if statement node
-        condition = type('obj', (object,), {
-            'type': 'binary_operation',
-            'operator': '>',
-            'left': type('obj', (object,), {
-                'type': 'identifier',
-                'name': 'x',
-                'line': 2,
-                'column': 5
-            }),
-            'right': type('obj', (object,), {
-                'type': 'literal',
-                'value': 0,
-                'literal_type': 'int',
-                'line': 2,
-                'column': 9
-            }),
-            'line': 2,
-            'column': 7
-        })
-        
-        then_stmt = type('obj', (object,), {
-            'type': 'return_statement',
-            'value': type('obj', (object,), {
-                'type': 'identifier',
-                'name': 'x',
-                'line': 3,
-                'column': 12
-            }),
-            'line': 3,
-            'column': 5
-        })
-        
-        else_stmt = type('obj', (object,), {
-            'type': 'return_statement',
-            'value': type('obj', (object,), {
-                'type': 'literal',
-                'value': 0,
-                'literal_type': 'int',
-                'line': 5,
-                'column': 12
-            }),
-            'line': 5,
-            'column': 5
-        })
-        
-        if_node = type('obj', (object,), {
-            'type': 'if_statement',
-            'condition': condition,
-            'then_branch': [then_stmt],
-            'else_branch': [else_stmt],
-            'line': 1,
-            'column': 1
-        })
-        
         # Check if visitor has visit_if_statement method
-        if hasattr(self.visitor, 'visit_if_statement'):
-            result = self.visitor.visit_if_statement(if_node)
+        visit = self.dispatch.get('if_statement')
+        if visit is not None:
+            result = visit(self.visitor, _fixture("if_statement"))
             
-            self.assertEqual(result["node_type"], "if_statement")
-            self.assertTrue("condition" in result)
-            self.assertTrue("then_branch" in result)
-            self.assertTrue("else_branch" in result)
+            self.assertEqual(
+                {"node_type": result["node_type"], "has_branches": {"condition", "then_branch", "else_branch"} <= result.keys()},
+                {"node_type": "if_statement", "has_branches": True}
+            )
     
     def test_visit_match_statement(self):
         """Test match statement visitation"""
-        # Create a mock match statement with Option<T> patterns
-        
-        subject = type('obj', (object,), {
-            'type': 'identifier',
-            'name': 'result',
-            'line': 1,
-            'column': 7
-        })
-        
-        some_pattern = type('obj', (object,), {
-            'type': 'constructor_pattern',
-            'name': 'Some',
-            'bindings': [type('obj', (object,), {
-                'type': 'binding_pattern',
-                'name': 'value',
-                'line': 2,
-                'column': 10
-            })],
-            'line': 2,
-            'column': 5
-        })
-        
-        some_body = type('obj', (object,), {
-            'type': 'expression_statement',
-            'expression': type('obj', (object,), {
-                'type': 'identifier',
-                'name': 'value',
-                'line': 2,
-                'column': 20
-            }),
-            'line': 2,
-            'column': 15
-        })
-        
-        none_pattern = type('obj', (object,), {
-            'type': 'constructor_pattern',
-            'name': 'None',
-            'bindings': [],
-            'line': 3,
-            'column': 5
-        })
-        
-        none_body = type('obj', (object,), {
-            'type': 'literal',
-            'value': 0,
-            'literal_type': 'int',
-            'line': 3,
-            'column': 15
-        })
-        
-        branches = [
-            type('obj', (object,), {
-                'pattern': some_pattern,
-                'body': some_body,
-                'guard': None,
-                'line': 2,
-                'column': 5
-            }),
-            type('obj', (object,), {
-                'pattern': none_pattern,
-                'body': none_body,
-                'guard': None,
-                'line': 3,
-                'column': 5
-            })
-        ]
-        
-        match_node = type('obj', (object,), {
-            'type': 'match_statement',
-            'subject': subject,
-            'branches': branches,
-            'line': 1,
-            'column': 1
-        })
-        
         # Check if visitor has visit_match_statement method
-        if hasattr(self.visitor, 'visit_match_statement'):
-            result = self.visitor.visit_match_statement(match_node)
+        visit = self.dispatch.get('match_statement')
+        if visit is not None:
+            result = visit(self.visitor, _fixture("match_option"))
             
-            self.assertEqual(result["node_type"], "match_statement")
-            self.assertTrue("subject" in result)
-            self.assertTrue("branches" in result)
-            self.assertEqual(len(result["branches"]), 2)
+            self.assertEqual(
+                {
+                    "node_type": result["node_type"],
+                    "has_subject": "subject" in result,
+                    "n_branches": len(result.get("branches", ())),
+                },
+                {"node_type": "match_statement", "has_subject": True, "n_branches": 2}
+            )
     
     def test_visit_async_function(self):
         """Test async function visitation"""
-        # Create a mock async function node
-        ret_type = type('obj', (object,), {'name': 'string'})
-        
-        stmt = type('obj', (object,), {
-            'type': 'return_statement',
-            'value': type('obj', (object,), {
-                'type': 'literal',
-                'value': "result",
-                'literal_type': 'string',
-                'line': 2,
-                'column': 12
-            }),
-            'line': 2,
-            'column': 5
-        })
-        
-        async_function_node = type('obj', (object,), {
-            'name': 'fetch_data',
-            'parameters': [],
-            'return_type': ret_type,
-            'body': [stmt],
-            'line': 1,
-            'column': 1,
-            'type': 'function',
-            'is_async': True  # Indicate this is an async function
-        })
-        
         # Check if visitor properly handles async functions
-        result = self.visitor.visit_function(async_function_node)
+        result = self.visitor.visit_function(_fixture("async_function"))
         
-        self.assertEqual(result["node_type"], "function")
-        self.assertEqual(result["name"], "fetch_data")
+        self.assertEqual(_kind_and_name(result), ("function", "fetch_data"))
         # The is_async attribute depends on visitor implementation
         if "is_async" in result:
             self.assertTrue(result["is_async"])
     
+    def test_visit_dispatches_on_node_type(self):
+        """Test that the generic visit method dispatches on the node's type"""
+        result = self.visitor.visit(_identifier('x', 4, 2))
+        
+        self.assertEqual(
+            {"kind": _kind_and_name(result), "position": result["position"]},
+            {"kind": ("identifier", "x"), "position": SourcePosition(4, 2, "test.ae")}
+        )
+        
+        unknown = self.visitor.visit(MockNode(type='no_such_node', name='n', line=1, column=1))
+        self.assertEqual(unknown["node_type"], "no_such_node")
+    
     def test_source_position_tracking(self):
         """Test that source positions are tracked correctly"""
-        # Create a node with line and column information
-        node = type('obj', (object,), {
-            'name': 'test',
-            'body': [],
-            'line': 42,
-            'column': 10
-        })
-        
         # Test with visitor's _make_node_info helper method
         pos = SourcePosition(42, 10, "test.ae")
         node_info = self.visitor._make_node_info("test", "test", [], pos)
@@ -341,6 +279,19 @@ class TestASTVisitor(unittest.TestCase):
         self.assertEqual(node_info["position"].line, 42)
         self.assertEqual(node_info["position"].column, 10)
         self.assertEqual(node_info["position"].file_path, "test.ae")
+        self.assertEqual(
+            node_info["position"].to_dict(),
+            {"line": 42, "column": 10, "file_path": "test.ae"}
+        )
+    
+    def test_leaf_nodes_share_empty_children(self):
+        """Test that leaf nodes are built without allocating a children list"""
+        first = self.visitor.visit_identifier(_identifier('x', 1, 1))
+        second = self.visitor.visit_literal(_literal(0, 'int', 1, 5))
+        
+        self.assertEqual(len(first["children"]), 0)
+        self.assertIs(first["children"], second["children"])
+        self.assertEqual(second["literal_type"], "int")
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
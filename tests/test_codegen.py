@@ -3,730 +3,416 @@ Test suite for the LLVM code generation in Aegis.
 
 Tests the generation of LLVM IR code for various Aegis language constructs,
 ensuring that the output is correct and can be compiled/executed.
+
+Generated IR is always parsed; set AEGIS_VERIFY_IR=0 to skip the slower
+LLVM verifier pass for a quick run.
 """
 
 import unittest
-import tempfile
+import functools
 import os
-import subprocess
+import re
+from types import MappingProxyType
 from src.codegen.llvm_generator import LLVMGenerator, WasmGenerator
-from src.parser.aeigix_ast_visitor import SourcePosition, AegisASTVisitor
+from src.parser.aeigix_ast_visitor import SourcePosition
 from llvmlite import binding
 
-# Initialize LLVM
-binding.initialize()
-binding.initialize_native_target()
-binding.initialize_native_asmprinter()
+# Run the LLVM verifier on parsed IR unless AEGIS_VERIFY_IR=0
+_VERIFY_IR = os.getenv("AEGIS_VERIFY_IR", "1") == "1"
+
+# The module's target triple line, and i32 as a whole type name (not i320)
+_RE_WASM_TRIPLE = re.compile(r'(?m)^target triple = "wasm32-unknown-unknown"$')
+_RE_I32 = re.compile(r"\bi32\b")
+
+# Branch and integer comparison instructions, as whole instructions rather
+# than substrings of labels or names
+_RE_BR = re.compile(r"(?m)^\s*br\s")
+_RE_ICMP = re.compile(r"(?m)^\s*%\S+\s*=\s*icmp\s")
+
+@functools.lru_cache(maxsize=64)
+def _parse_and_verify(ir_code):
+    """
+    Parse and verify LLVM IR, once per distinct IR string.
+    
+    Verification is skipped when _VERIFY_IR is off; parsing always runs.
+    
+    Args:
+        ir_code: The textual LLVM IR to check
+        
+    Returns:
+        The parsed module; raises RuntimeError if the IR is invalid
+    """
+    module = binding.parse_assembly(ir_code)
+    if _VERIFY_IR:
+        module.verify()
+    return module
+
+# Builders for the AST node shapes the fixtures have in common
+
+def _pos(line, column):
+    return SourcePosition(line, column, "test.ae")
+
+def _id(name, line, column):
+    return {"node_type": "identifier", "name": name, "position": _pos(line, column)}
+
+def _lit(value, literal_type, line, column):
+    return {
+        "node_type": "literal",
+        "literal_type": literal_type,
+        "value": value,
+        "position": _pos(line, column)
+    }
+
+def _binop(operator, left, right, line, column):
+    return {
+        "node_type": "binary_operation",
+        "operator": operator,
+        "left": left,
+        "right": right,
+        "position": _pos(line, column)
+    }
+
+def _call(name, arguments, line, column):
+    return {
+        "node_type": "constructor_call",
+        "name": name,
+        "arguments": arguments,
+        "position": _pos(line, column)
+    }
+
+def _ret(value, line, column):
+    return {"node_type": "return_statement", "value": value, "position": _pos(line, column)}
+
+def _expr_stmt(expression, line, column):
+    return {"node_type": "expression_statement", "expression": expression, "position": _pos(line, column)}
+
+def _var(name, type_name, init_value, line, column):
+    return {
+        "node_type": "variable_declaration",
+        "name": name,
+        "var_type": {"name": type_name},
+        "init_value": init_value,
+        "position": _pos(line, column)
+    }
+
+def _if(condition, then_branch, else_branch, line, column):
+    return {
+        "node_type": "if_statement",
+        "condition": condition,
+        "then_branch": then_branch,
+        "else_branch": else_branch,
+        "position": _pos(line, column)
+    }
+
+def _generic(name, type_params, line, column):
+    return {
+        "name": name,
+        "type_params": [{"name": param} for param in type_params],
+        "position": _pos(line, column)
+    }
+
+def _param(name, param_type, line, column):
+    if isinstance(param_type, str):
+        param_type = {"name": param_type}
+    return {"name": name, "param_type": param_type, "position": _pos(line, column)}
+
+def _field(name, type_name, line, column):
+    return {
+        "node_type": "field",
+        "name": name,
+        "field_type": {"name": type_name},
+        "position": _pos(line, column)
+    }
+
+def _function(name, parameters, return_type, body, line=1):
+    if isinstance(return_type, str):
+        return_type = {"name": return_type}
+    return {
+        "node_type": "function",
+        "name": name,
+        "parameters": parameters,
+        "return_type": return_type,
+        "body": body,
+        "position": _pos(line, 1)
+    }
+
+def _struct(name, fields):
+    return {
+        "node_type": "struct",
+        "name": name,
+        "fields": fields,
+        "methods": [],
+        "position": _pos(1, 1)
+    }
+
+def _freeze(node):
+    """Make an AST read-only: dicts become mapping proxies and lists become tuples"""
+    if isinstance(node, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return tuple(_freeze(item) for item in node)
+    return node
+
+def _module(name, children):
+    # Module trees are shared by every test, so they are frozen against mutation
+    return _freeze({"node_type": "module", "name": name, "children": children, "position": _pos(1, 1)})
+
+# AST fixtures, built once at import; LLVMGenerator only reads its input
+
+_A_B_PARAMS = [_param("a", "int", 1, 15), _param("b", "int", 1, 25)]
+
+# fn add(a: int, b: int) -> int { return a + b }
+_ADD_FUNCTION = _function("add", _A_B_PARAMS, "int", [
+    _ret(_binop("+", _id("a", 2, 12), _id("b", 2, 16), 2, 14), 2, 5)
+])
+
+_AST_ADD = _module("Test", [_ADD_FUNCTION])
+
+_AST_WASM_ADD = _module("WasmTest", [_ADD_FUNCTION])
+
+# struct Point { x: int, y: int }
+_AST_POINT = _module("Test", [
+    _struct("Point", [_field("x", "int", 2, 5), _field("y", "int", 3, 5)])
+])
+
+# fn max(a: int, b: int) -> int { if a > b { return a } else { return b } }
+_AST_MAX = _module("Test", [
+    _function("max", _A_B_PARAMS, "int", [
+        _if(
+            _binop(">", _id("a", 2, 9), _id("b", 2, 13), 2, 11),
+            [_ret(_id("a", 3, 16), 3, 9)],
+            [_ret(_id("b", 5, 16), 5, 9)],
+            2, 5
+        )
+    ])
+])
+
+# fn find_value(key: int) -> Option<int> { if key > 0 { Some(key) } else { None } }
+_AST_FIND_VALUE = _module("Test", [
+    _function("find_value", [_param("key", "int", 1, 15)], _generic("Option", ["int"], 1, 35), [
+        _if(
+            _binop(">", _id("key", 2, 9), _lit(0, "int", 2, 15), 2, 13),
+            [_ret(_call("Some", [_id("key", 3, 21)], 3, 16), 3, 9)],
+            [_ret(_call("None", [], 5, 16), 5, 9)],
+            2, 5
+        )
+    ])
+])
+
+# fn sum_to_n(n: int) -> int { sum = 0; i = 1; while i <= n { sum = sum + i; i = i + 1 }; return sum }
+_AST_SUM_TO_N = _module("Test", [
+    _function("sum_to_n", [_param("n", "int", 1, 15)], "int", [
+        _var("sum", "int", _lit(0, "int", 2, 14), 2, 5),
+        _var("i", "int", _lit(1, "int", 3, 12), 3, 5),
+        {
+            "node_type": "while_statement",
+            "condition": _binop("<=", _id("i", 4, 12), _id("n", 4, 17), 4, 14),
+            "body": [
+                _expr_stmt(
+                    _binop("=", _id("sum", 5, 9), _binop("+", _id("sum", 5, 15), _id("i", 5, 21), 5, 19), 5, 13),
+                    5, 9
+                ),
+                _expr_stmt(
+                    _binop("=", _id("i", 6, 9), _binop("+", _id("i", 6, 13), _lit(1, "int", 6, 17), 6, 15), 6, 11),
+                    6, 9
+                )
+            ],
+            "position": _pos(4, 5)
+        },
+        _ret(_id("sum", 8, 12), 8, 5)
+    ])
+])
+
+# fn safe_divide(a: int, b: int) -> Result<int, string> { if b == 0 { Err(...) } else { Ok(a / b) } }
+_AST_SAFE_DIVIDE = _module("Test", [
+    _function("safe_divide", _A_B_PARAMS, _generic("Result", ["int", "string"], 1, 35), [
+        _if(
+            _binop("==", _id("b", 2, 9), _lit(0, "int", 2, 14), 2, 11),
+            [_ret(_call("Err", [_lit("Division by zero", "string", 3, 20)], 3, 16), 3, 9)],
+            [_ret(_call("Ok", [_binop("/", _id("a", 5, 19), _id("b", 5, 23), 5, 21)], 5, 16), 5, 9)],
+            2, 5
+        )
+    ])
+])
+
+# fn process_option(opt: Option<int>) -> int { match opt { Some(value) => value, None => 0 } }
+_AST_PROCESS_OPTION = _module("Test", [
+    _function("process_option", [_param("opt", _generic("Option", ["int"], 1, 25), 1, 20)], "int", [{
+        "node_type": "match_statement",
+        "subject": _id("opt", 2, 11),
+        "branches": [
+            {
+                "pattern": {
+                    "node_type": "constructor_pattern",
+                    "name": "Some",
+                    "bindings": [{
+                        "node_type": "binding_pattern",
+                        "name": "value",
+                        "position": _pos(3, 15)
+                    }],
+                    "position": _pos(3, 5)
+                },
+                "body": _ret(_id("value", 3, 25), 3, 18),
+                "guard": None
+            },
+            {
+                "pattern": {
+                    "node_type": "constructor_pattern",
+                    "name": "None",
+                    "bindings": [],
+                    "position": _pos(4, 5)
+                },
+                "body": _ret(_lit(0, "int", 4, 25), 4, 18),
+                "guard": None
+            }
+        ],
+        "position": _pos(2, 5)
+    }])
+])
+
+# struct Query { table: string }; fn select(fields: string) -> Query { query = Query(""); return query }
+_AST_QUERY_DSL = _module("QueryDSL", [
+    _struct("Query", [_field("table", "string", 2, 5)]),
+    _function("select", [_param("fields", "string", 5, 15)], "Query", [
+        _var("query", "Query", _call("Query", [_lit("", "string", 6, 20)], 6, 14), 6, 5),
+        _ret(_id("query", 7, 12), 7, 5)
+    ], line=5)
+])
 
 class TestLLVMCodeGen(unittest.TestCase):
-    def setUp(self):
-        # Create a simple mock for the target machine
-        self.target = binding.Target.from_default_triple()
-        self.target_machine = self.target.create_target_machine()
+    # Set once LLVM has been initialized, so it is not initialized twice
+    _llvm_ready = False
+    
+    @classmethod
+    def setUpClass(cls):
+        # Initialize LLVM once for all tests
+        if not TestLLVMCodeGen._llvm_ready:
+            binding.initialize()
+            binding.initialize_native_target()
+            binding.initialize_native_asmprinter()
+            TestLLVMCodeGen._llvm_ready = True
+        # One generator reused by every test through reset()
+        cls.generator = LLVMGenerator(_module("Empty", []))
+    
+    def generate(self, ast):
+        """Generate LLVM IR for ast with the shared generator"""
+        self.generator.reset(ast)
+        return self.generator.generate()
+    
+    def assertFunctionDefined(self, module, name):
+        """Assert that the parsed module defines (not just declares) a function"""
+        try:
+            function = module.get_function(name)
+        except NameError:
+            self.fail(f"function {name!r} not found in module")
+        self.assertFalse(function.is_declaration, f"function {name!r} is only declared")
+    
+    def assertStructDefined(self, module, name):
+        """Assert that the parsed module defines a named struct type"""
+        try:
+            module.get_struct_type(name)
+        except NameError:
+            self.fail(f"struct type {name!r} not found in module")
     
     def test_basic_function_generation(self):
         """Test generation of a basic function"""
-        # Create a simple AST for a function that returns an integer
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "add",
-                "parameters": [
-                    {
-                        "name": "a",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    },
-                    {
-                        "name": "b",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 25, "test.ae")
-                    }
-                ],
-                "return_type": {"name": "int"},
-                "body": [{
-                    "node_type": "return_statement",
-                    "value": {
-                        "node_type": "binary_operation",
-                        "operator": "+",
-                        "left": {
-                            "node_type": "identifier",
-                            "name": "a",
-                            "position": SourcePosition(2, 12, "test.ae")
-                        },
-                        "right": {
-                            "node_type": "identifier",
-                            "name": "b",
-                            "position": SourcePosition(2, 16, "test.ae")
-                        },
-                        "position": SourcePosition(2, 14, "test.ae")
-                    },
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_ADD)
         
         # Verify the IR is valid
-        module = binding.parse_assembly(ir_code)
-        module.verify()
+        module = _parse_and_verify(ir_code)
         
-        # Check for key elements in the generated IR
-        self.assertIn("define", ir_code)
-        self.assertIn("add", ir_code)
-        self.assertIn("add", ir_code)
+        # Check that add is defined, not merely mentioned
+        self.assertFunctionDefined(module, "add")
         
     def test_struct_generation(self):
         """Test generation of a struct with fields"""
-        # Create an AST for a struct definition
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "struct",
-                "name": "Point",
-                "fields": [
-                    {
-                        "node_type": "field",
-                        "name": "x",
-                        "field_type": {"name": "int"},
-                        "position": SourcePosition(2, 5, "test.ae")
-                    },
-                    {
-                        "node_type": "field",
-                        "name": "y",
-                        "field_type": {"name": "int"},
-                        "position": SourcePosition(3, 5, "test.ae")
-                    }
-                ],
-                "methods": [],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_POINT)
         
         # Verify the IR is valid
-        module = binding.parse_assembly(ir_code)
-        module.verify()
+        module = _parse_and_verify(ir_code)
         
         # Check for struct type definition
-        self.assertIn("type %Point", ir_code.replace(" ", ""))
+        self.assertStructDefined(module, "Point")
         
     def test_conditional_code_generation(self):
         """Test generation of if-else statements"""
-        # Create an AST with an if-else statement
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "max",
-                "parameters": [
-                    {
-                        "name": "a",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    },
-                    {
-                        "name": "b",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 25, "test.ae")
-                    }
-                ],
-                "return_type": {"name": "int"},
-                "body": [{
-                    "node_type": "if_statement",
-                    "condition": {
-                        "node_type": "binary_operation",
-                        "operator": ">",
-                        "left": {
-                            "node_type": "identifier",
-                            "name": "a",
-                            "position": SourcePosition(2, 9, "test.ae")
-                        },
-                        "right": {
-                            "node_type": "identifier",
-                            "name": "b",
-                            "position": SourcePosition(2, 13, "test.ae")
-                        },
-                        "position": SourcePosition(2, 11, "test.ae")
-                    },
-                    "then_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "identifier",
-                            "name": "a",
-                            "position": SourcePosition(3, 16, "test.ae")
-                        },
-                        "position": SourcePosition(3, 9, "test.ae")
-                    }],
-                    "else_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "identifier",
-                            "name": "b",
-                            "position": SourcePosition(5, 16, "test.ae")
-                        },
-                        "position": SourcePosition(5, 9, "test.ae")
-                    }],
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_MAX)
         
         # Verify the IR contains branching instructions
-        self.assertIn("icmp", ir_code)
-        self.assertIn("br", ir_code)
+        self.assertRegex(ir_code, _RE_ICMP)
+        self.assertRegex(ir_code, _RE_BR)
         
     def test_option_type_generation(self):
         """Test generation of Option<T> pattern"""
-        # Create an AST with Option<T> usage
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "find_value",
-                "parameters": [
-                    {
-                        "name": "key",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    }
-                ],
-                "return_type": {
-                    "name": "Option",
-                    "type_params": [{"name": "int"}],
-                    "position": SourcePosition(1, 35, "test.ae")
-                },
-                "body": [{
-                    "node_type": "if_statement",
-                    "condition": {
-                        "node_type": "binary_operation",
-                        "operator": ">",
-                        "left": {
-                            "node_type": "identifier",
-                            "name": "key",
-                            "position": SourcePosition(2, 9, "test.ae")
-                        },
-                        "right": {
-                            "node_type": "literal",
-                            "literal_type": "int",
-                            "value": 0,
-                            "position": SourcePosition(2, 15, "test.ae")
-                        },
-                        "position": SourcePosition(2, 13, "test.ae")
-                    },
-                    "then_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "constructor_call",
-                            "name": "Some",
-                            "arguments": [{
-                                "node_type": "identifier",
-                                "name": "key",
-                                "position": SourcePosition(3, 21, "test.ae")
-                            }],
-                            "position": SourcePosition(3, 16, "test.ae")
-                        },
-                        "position": SourcePosition(3, 9, "test.ae")
-                    }],
-                    "else_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "constructor_call",
-                            "name": "None",
-                            "arguments": [],
-                            "position": SourcePosition(5, 16, "test.ae")
-                        },
-                        "position": SourcePosition(5, 9, "test.ae")
-                    }],
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_FIND_VALUE)
         
         # Check if the IR compiles successfully
-        module = binding.parse_assembly(ir_code)
-        module.verify()
+        module = _parse_and_verify(ir_code)
         
     def test_loop_generation(self):
         """Test generation of loop constructs"""
-        # Create an AST with a while loop
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "sum_to_n",
-                "parameters": [
-                    {
-                        "name": "n",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    }
-                ],
-                "return_type": {"name": "int"},
-                "body": [
-                    {
-                        "node_type": "variable_declaration",
-                        "name": "sum",
-                        "var_type": {"name": "int"},
-                        "init_value": {
-                            "node_type": "literal",
-                            "literal_type": "int",
-                            "value": 0,
-                            "position": SourcePosition(2, 14, "test.ae")
-                        },
-                        "position": SourcePosition(2, 5, "test.ae")
-                    },
-                    {
-                        "node_type": "variable_declaration",
-                        "name": "i",
-                        "var_type": {"name": "int"},
-                        "init_value": {
-                            "node_type": "literal",
-                            "literal_type": "int",
-                            "value": 1,
-                            "position": SourcePosition(3, 12, "test.ae")
-                        },
-                        "position": SourcePosition(3, 5, "test.ae")
-                    },
-                    {
-                        "node_type": "while_statement",
-                        "condition": {
-                            "node_type": "binary_operation",
-                            "operator": "<=",
-                            "left": {
-                                "node_type": "identifier",
-                                "name": "i",
-                                "position": SourcePosition(4, 12, "test.ae")
-                            },
-                            "right": {
-                                "node_type": "identifier",
-                                "name": "n",
-                                "position": SourcePosition(4, 17, "test.ae")
-                            },
-                            "position": SourcePosition(4, 14, "test.ae")
-                        },
-                        "body": [
-                            {
-                                "node_type": "expression_statement",
-                                "expression": {
-                                    "node_type": "binary_operation",
-                                    "operator": "=",
-                                    "left": {
-                                        "node_type": "identifier",
-                                        "name": "sum",
-                                        "position": SourcePosition(5, 9, "test.ae")
-                                    },
-                                    "right": {
-                                        "node_type": "binary_operation",
-                                        "operator": "+",
-                                        "left": {
-                                            "node_type": "identifier",
-                                            "name": "sum",
-                                            "position": SourcePosition(5, 15, "test.ae")
-                                        },
-                                        "right": {
-                                            "node_type": "identifier",
-                                            "name": "i",
-                                            "position": SourcePosition(5, 21, "test.ae")
-                                        },
-                                        "position": SourcePosition(5, 19, "test.ae")
-                                    },
-                                    "position": SourcePosition(5, 13, "test.ae")
-                                },
-                                "position": SourcePosition(5, 9, "test.ae")
-                            },
-                            {
-                                "node_type": "expression_statement",
-                                "expression": {
-                                    "node_type": "binary_operation",
-                                    "operator": "=",
-                                    "left": {
-                                        "node_type": "identifier",
-                                        "name": "i",
-                                        "position": SourcePosition(6, 9, "test.ae")
-                                    },
-                                    "right": {
-                                        "node_type": "binary_operation",
-                                        "operator": "+",
-                                        "left": {
-                                            "node_type": "identifier",
-                                            "name": "i",
-                                            "position": SourcePosition(6, 13, "test.ae")
-                                        },
-                                        "right": {
-                                            "node_type": "literal",
-                                            "literal_type": "int",
-                                            "value": 1,
-                                            "position": SourcePosition(6, 17, "test.ae")
-                                        },
-                                        "position": SourcePosition(6, 15, "test.ae")
-                                    },
-                                    "position": SourcePosition(6, 11, "test.ae")
-                                },
-                                "position": SourcePosition(6, 9, "test.ae")
-                            }
-                        ],
-                        "position": SourcePosition(4, 5, "test.ae")
-                    },
-                    {
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "identifier",
-                            "name": "sum",
-                            "position": SourcePosition(8, 12, "test.ae")
-                        },
-                        "position": SourcePosition(8, 5, "test.ae")
-                    }
-                ],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_SUM_TO_N)
         
         # Verify that the IR contains loop constructs
-        self.assertIn("br", ir_code)
-        self.assertIn("icmp", ir_code)
+        self.assertRegex(ir_code, _RE_BR)
+        self.assertRegex(ir_code, _RE_ICMP)
         
     def test_result_type_generation(self):
         """Test generation of Result<T, E> pattern"""
-        # Create an AST with Result<T, E> usage
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "safe_divide",
-                "parameters": [
-                    {
-                        "name": "a",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    },
-                    {
-                        "name": "b",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 25, "test.ae")
-                    }
-                ],
-                "return_type": {
-                    "name": "Result",
-                    "type_params": [{"name": "int"}, {"name": "string"}],
-                    "position": SourcePosition(1, 35, "test.ae")
-                },
-                "body": [{
-                    "node_type": "if_statement",
-                    "condition": {
-                        "node_type": "binary_operation",
-                        "operator": "==",
-                        "left": {
-                            "node_type": "identifier",
-                            "name": "b",
-                            "position": SourcePosition(2, 9, "test.ae")
-                        },
-                        "right": {
-                            "node_type": "literal",
-                            "literal_type": "int",
-                            "value": 0,
-                            "position": SourcePosition(2, 14, "test.ae")
-                        },
-                        "position": SourcePosition(2, 11, "test.ae")
-                    },
-                    "then_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "constructor_call",
-                            "name": "Err",
-                            "arguments": [{
-                                "node_type": "literal",
-                                "literal_type": "string",
-                                "value": "Division by zero",
-                                "position": SourcePosition(3, 20, "test.ae")
-                            }],
-                            "position": SourcePosition(3, 16, "test.ae")
-                        },
-                        "position": SourcePosition(3, 9, "test.ae")
-                    }],
-                    "else_branch": [{
-                        "node_type": "return_statement",
-                        "value": {
-                            "node_type": "constructor_call",
-                            "name": "Ok",
-                            "arguments": [{
-                                "node_type": "binary_operation",
-                                "operator": "/",
-                                "left": {
-                                    "node_type": "identifier",
-                                    "name": "a",
-                                    "position": SourcePosition(5, 19, "test.ae")
-                                },
-                                "right": {
-                                    "node_type": "identifier",
-                                    "name": "b",
-                                    "position": SourcePosition(5, 23, "test.ae")
-                                },
-                                "position": SourcePosition(5, 21, "test.ae")
-                            }],
-                            "position": SourcePosition(5, 16, "test.ae")
-                        },
-                        "position": SourcePosition(5, 9, "test.ae")
-                    }],
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_SAFE_DIVIDE)
         
         # Verify the IR is valid
-        module = binding.parse_assembly(ir_code)
-        module.verify()
+        module = _parse_and_verify(ir_code)
         
     def test_match_expression_generation(self):
         """Test generation of match expression"""
-        # Create an AST with a match expression
-        ast = {
-            "node_type": "module",
-            "name": "Test",
-            "children": [{
-                "node_type": "function",
-                "name": "process_option",
-                "parameters": [
-                    {
-                        "name": "opt",
-                        "param_type": {
-                            "name": "Option",
-                            "type_params": [{"name": "int"}],
-                            "position": SourcePosition(1, 25, "test.ae")
-                        },
-                        "position": SourcePosition(1, 20, "test.ae")
-                    }
-                ],
-                "return_type": {"name": "int"},
-                "body": [{
-                    "node_type": "match_statement",
-                    "subject": {
-                        "node_type": "identifier",
-                        "name": "opt",
-                        "position": SourcePosition(2, 11, "test.ae")
-                    },
-                    "branches": [
-                        {
-                            "pattern": {
-                                "node_type": "constructor_pattern",
-                                "name": "Some",
-                                "bindings": [{
-                                    "node_type": "binding_pattern",
-                                    "name": "value",
-                                    "position": SourcePosition(3, 15, "test.ae")
-                                }],
-                                "position": SourcePosition(3, 5, "test.ae")
-                            },
-                            "body": {
-                                "node_type": "return_statement",
-                                "value": {
-                                    "node_type": "identifier",
-                                    "name": "value",
-                                    "position": SourcePosition(3, 25, "test.ae")
-                                },
-                                "position": SourcePosition(3, 18, "test.ae")
-                            },
-                            "guard": None
-                        },
-                        {
-                            "pattern": {
-                                "node_type": "constructor_pattern",
-                                "name": "None",
-                                "bindings": [],
-                                "position": SourcePosition(4, 5, "test.ae")
-                            },
-                            "body": {
-                                "node_type": "return_statement",
-                                "value": {
-                                    "node_type": "literal",
-                                    "literal_type": "int",
-                                    "value": 0,
-                                    "position": SourcePosition(4, 25, "test.ae")
-                                },
-                                "position": SourcePosition(4, 18, "test.ae")
-                            },
-                            "guard": None
-                        }
-                    ],
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_PROCESS_OPTION)
         
         # Verify the IR contains pattern matching constructs
         self.assertIn("switch", ir_code)
         
     def test_wasm_generation(self):
         """Test WebAssembly compatible IR generation"""
-        # Create a simple AST
-        ast = {
-            "node_type": "module",
-            "name": "WasmTest",
-            "children": [{
-                "node_type": "function",
-                "name": "add",
-                "parameters": [
-                    {
-                        "name": "a",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 15, "test.ae")
-                    },
-                    {
-                        "name": "b",
-                        "param_type": {"name": "int"},
-                        "position": SourcePosition(1, 25, "test.ae")
-                    }
-                ],
-                "return_type": {"name": "int"},
-                "body": [{
-                    "node_type": "return_statement",
-                    "value": {
-                        "node_type": "binary_operation",
-                        "operator": "+",
-                        "left": {
-                            "node_type": "identifier",
-                            "name": "a",
-                            "position": SourcePosition(2, 12, "test.ae")
-                        },
-                        "right": {
-                            "node_type": "identifier",
-                            "name": "b",
-                            "position": SourcePosition(2, 16, "test.ae")
-                        },
-                        "position": SourcePosition(2, 14, "test.ae")
-                    },
-                    "position": SourcePosition(2, 5, "test.ae")
-                }],
-                "position": SourcePosition(1, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate WebAssembly-compatible IR
-        generator = WasmGenerator(ast)
+        generator = WasmGenerator(_AST_WASM_ADD)
         ir_code = generator.generate()
         
         # Verify that the module has WASM target triple
-        self.assertIn("wasm32-unknown-unknown", ir_code)
+        self.assertRegex(ir_code, _RE_WASM_TRIPLE)
         
         # Verify that int types are 32-bit (WebAssembly prefers 32-bit integers)
-        self.assertIn("i32", ir_code)
+        self.assertRegex(ir_code, _RE_I32)
         
     def test_dsl_pattern_generation(self):
         """Test generation of DSL-like pattern"""
-        # Create an AST with a DSL-like pattern for a query builder
-        ast = {
-            "node_type": "module",
-            "name": "QueryDSL",
-            "children": [{
-                "node_type": "struct",
-                "name": "Query",
-                "fields": [
-                    {
-                        "node_type": "field",
-                        "name": "table",
-                        "field_type": {"name": "string"},
-                        "position": SourcePosition(2, 5, "test.ae")
-                    }
-                ],
-                "methods": [],
-                "position": SourcePosition(1, 1, "test.ae")
-            }, {
-                "node_type": "function",
-                "name": "select",
-                "parameters": [{
-                    "name": "fields",
-                    "param_type": {"name": "string"},
-                    "position": SourcePosition(5, 15, "test.ae")
-                }],
-                "return_type": {"name": "Query"},
-                "body": [{
-                    "node_type": "variable_declaration",
-                    "name": "query",
-                    "var_type": {"name": "Query"},
-                    "init_value": {
-                        "node_type": "constructor_call",
-                        "name": "Query",
-                        "arguments": [{
-                            "node_type": "literal",
-                            "literal_type": "string",
-                            "value": "",
-                            "position": SourcePosition(6, 20, "test.ae")
-                        }],
-                        "position": SourcePosition(6, 14, "test.ae")
-                    },
-                    "position": SourcePosition(6, 5, "test.ae")
-                }, {
-                    "node_type": "return_statement",
-                    "value": {
-                        "node_type": "identifier",
-                        "name": "query",
-                        "position": SourcePosition(7, 12, "test.ae")
-                    },
-                    "position": SourcePosition(7, 5, "test.ae")
-                }],
-                "position": SourcePosition(5, 1, "test.ae")
-            }],
-            "position": SourcePosition(1, 1, "test.ae")
-        }
-        
         # Generate LLVM IR for DSL pattern
-        generator = LLVMGenerator(ast)
-        ir_code = generator.generate()
+        ir_code = self.generate(_AST_QUERY_DSL)
         
         # Verify the IR is valid
-        module = binding.parse_assembly(ir_code)
-        module.verify()
+        module = _parse_and_verify(ir_code)
         
         # Verify struct type and function
-        self.assertIn("type %Query", ir_code.replace(" ", ""))
-        self.assertIn("define", ir_code)
-        self.assertIn("select", ir_code)
+        self.assertStructDefined(module, "Query")
+        self.assertFunctionDefined(module, "select")
+    
+    def test_reset_starts_fresh_module(self):
+        """Test that reset discards the previous AST's module and symbols"""
+        generator = WasmGenerator(_AST_POINT)
+        previous = generator.module
+        generator.symbol_table["Point"] = {"type": "struct"}
+        generator.reset(_AST_WASM_ADD)
+        
+        self.assertIs(generator.ast, _AST_WASM_ADD)
+        self.assertIsNot(generator.module, previous)
+        self.assertEqual(set(generator.symbol_table), {"console_log"})
+        self.assertEqual(generator.module.triple, "wasm32-unknown-unknown")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -12,10 +12,8 @@ from src.compiler.type_checker import TypeChecker
 from src.compiler.code_generator import CodeGenerator
 
 
-class TestAegisCompiler(unittest.TestCase):
-    def setUp(self):
-        # Example AegisLang source to test
-        self.source_code = """
+# Example AegisLang source to test
+SOURCE_CODE = """
 module TestModule:
     struct Test:
         id: int
@@ -24,9 +22,16 @@ module TestModule:
     fn get_test(id: int) -> Test:
         return Test(id, "Sample")
 """
-        self.tokens = lex(self.source_code)
-        self.parser = AegisParser(self.tokens)
-        self.ast = self.parser.parse()
+
+
+class TestAegisCompiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Lex and parse the example source once; the tests only read the AST
+        cls.source_code = SOURCE_CODE
+        cls.tokens = lex(cls.source_code)
+        cls.parser = AegisParser(cls.tokens)
+        cls.ast = cls.parser.parse()
 
     def test_type_checker(self):
         type_checker = TypeChecker(self.ast)
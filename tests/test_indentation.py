@@ -5,23 +5,16 @@ Tests the indentation handling capabilities of the lexer, ensuring proper
 INDENT and DEDENT tokens are created and error detection works as expected.
 """
 
+import re
 import unittest
+from types import SimpleNamespace
 from src.lexer.indentation_lexer import AegisIndentationLexer
 from antlr4 import InputStream, CommonTokenStream
 from AegisLangLexer import AegisLangLexer  # Auto-generated from ANTLR4
 
-class MockLexer:
-    """Mock lexer for testing the indentation lexer"""
-    def __init__(self):
-        self.tokens = []
+# Indentation test inputs
 
-class TestIndentationLexer(unittest.TestCase):
-    def setUp(self):
-        self.lexer = AegisIndentationLexer(MockLexer())
-
-    def test_basic_indentation(self):
-        """Test basic indentation patterns"""
-        source = """
+SOURCE_BASIC = """
 module Test:
     fn function():
         statement1
@@ -29,13 +22,8 @@ module Test:
     fn function2():
         statement3
 """
-        processed = self.lexer.process_indentation(source)
-        self.assertIn("INDENT", processed)
-        self.assertIn("DEDENT", processed)
 
-    def test_multi_level_indentation(self):
-        """Test multiple levels of indentation"""
-        source = """
+SOURCE_MULTI_LEVEL = """
 module Test:
     fn function():
         if condition:
@@ -43,46 +31,22 @@ module Test:
             statement2
         statement3
 """
-        processed = self.lexer.process_indentation(source)
-        lines = processed.split('\n')
-        indent_count = sum(1 for line in lines if "INDENT" in line)
-        dedent_count = sum(1 for line in lines if "DEDENT" in line)
-        
-        # Should have 2 indents (for fn and if) and 2 dedents
-        self.assertEqual(indent_count, 2)
-        self.assertEqual(dedent_count, 2)
 
-    def test_mixed_indentation_error(self):
-        """Test error detection with mixed indentation"""
-        source = """
+SOURCE_MIXED = """
 module Test:
     fn function():
         statement1
        wrong_indent
 """
-        self.lexer.process_indentation(source)
-        # Should detect the indentation error
-        self.assertTrue(len(self.lexer.indent_errors) > 0)
-        error = self.lexer.indent_errors[0]
-        self.assertIn("IndentationError", error["type"])
-        self.assertIn("wrong_indent", source)
 
-    def test_over_indentation_error(self):
-        """Test error detection with over-indentation"""
-        source = """
+SOURCE_OVER_INDENTED = """
 module Test:
     fn function():
         statement1
             over_indented
 """
-        processed = self.lexer.process_indentation(source)
-        # Should still process it with INDENT but record an error
-        self.assertIn("INDENT", processed)
-        self.assertTrue(len(self.lexer.indent_errors) > 0)
 
-    def test_empty_lines_and_comments(self):
-        """Test handling of empty lines and comments"""
-        source = """
+SOURCE_COMMENTS = """
 module Test:
     # This is a comment
     
@@ -92,37 +56,16 @@ module Test:
         
         statement2
 """
-        processed = self.lexer.process_indentation(source)
-        # Comments and empty lines should be preserved
-        self.assertIn("# This is a comment", processed)
-        self.assertIn("# Another comment", processed)
-        
-        # Proper indentation should still work
-        self.assertIn("INDENT", processed)
 
-    def test_dedent_handling(self):
-        """Test multiple dedent levels are handled correctly"""
-        source = """
+SOURCE_DEDENT = """
 module Test:
     fn outer():
         if condition:
             statement1
         statement2
 """
-        processed = self.lexer.process_indentation(source)
-        # Check that we dedent properly from the if block
-        dedent_line = None
-        for line in processed.split('\n'):
-            if "statement2" in line and "DEDENT" in line:
-                dedent_line = line
-                break
-        
-        self.assertIsNotNone(dedent_line)
-        self.assertIn("DEDENT", dedent_line)
 
-    def test_complex_nesting(self):
-        """Test complex nesting patterns"""
-        source = """
+SOURCE_COMPLEX = """
 module Test:
     struct User:
         name: string
@@ -136,19 +79,8 @@ module Test:
                 return None
         return None
 """
-        processed = self.lexer.process_indentation(source)
-        
-        # Count indents and dedents
-        indent_count = sum(1 for line in processed.split('\n') if "INDENT" in line)
-        dedent_count = sum(1 for line in processed.split('\n') if "DEDENT" in line)
-        
-        # Should have appropriate number of indents and dedents
-        self.assertEqual(indent_count, 3)  # module->struct, module->fn, fn->if, if->if
-        self.assertEqual(dedent_count, 3)  # or more with final dedents
 
-    def test_option_type_dsl_pattern(self):
-        """Test indentation with Option<T> and DSL-like patterns"""
-        source = """
+SOURCE_OPTION_DSL = """
 module OptTest:
     fn process_optional(opt: Option<int>) -> int:
         match opt:
@@ -160,11 +92,93 @@ module OptTest:
             None => 
                 return 0
 """
-        processed = self.lexer.process_indentation(source)
+
+# An INDENT followed, somewhere later, by a DEDENT
+_INDENT_DEDENT_RE = re.compile(r"INDENT.*DEDENT", re.S)
+
+class TestIndentationLexer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The underlying lexer is only a holder for an empty token list
+        cls.shared_lexer = AegisIndentationLexer(SimpleNamespace(tokens=[]))
+    
+    def setUp(self):
+        # Reuse one lexer, clearing the errors the previous test recorded
+        self.lexer = self.shared_lexer
+        self.lexer.reset()
+
+    def test_basic_indentation(self):
+        """Test basic indentation patterns"""
+        processed = self.lexer.process_indentation(SOURCE_BASIC)
+        self.assertRegex(processed, _INDENT_DEDENT_RE)
+
+    def test_multi_level_indentation(self):
+        """Test multiple levels of indentation"""
+        processed = self.lexer.process_indentation(SOURCE_MULTI_LEVEL)
+        indent_count = processed.count("INDENT")
+        dedent_count = processed.count("DEDENT")
         
-        # Should handle the match statement and nested if-else properly
+        # Should have 2 indents (for fn and if) and 2 dedents
+        self.assertEqual(indent_count, 2)
+        self.assertEqual(dedent_count, 2)
+
+    def test_mixed_indentation_error(self):
+        """Test error detection with mixed indentation"""
+        self.lexer.process_indentation(SOURCE_MIXED)
+        # Should detect the indentation error
+        self.assertTrue(len(self.lexer.indent_errors) > 0)
+        error = self.lexer.indent_errors[0]
+        self.assertIn("IndentationError", error["type"])
+        self.assertIn("wrong_indent", SOURCE_MIXED)
+
+    def test_over_indentation_error(self):
+        """Test error detection with over-indentation"""
+        processed = self.lexer.process_indentation(SOURCE_OVER_INDENTED)
+        # Should still process it with INDENT but record an error
         self.assertIn("INDENT", processed)
-        self.assertIn("DEDENT", processed)
+        self.assertTrue(len(self.lexer.indent_errors) > 0)
+
+    def test_empty_lines_and_comments(self):
+        """Test handling of empty lines and comments"""
+        processed = self.lexer.process_indentation(SOURCE_COMMENTS)
+        # Comments and empty lines should be preserved
+        self.assertIn("# This is a comment", processed)
+        self.assertIn("# Another comment", processed)
+        
+        # Proper indentation should still work
+        self.assertIn("INDENT", processed)
+
+    def test_dedent_handling(self):
+        """Test multiple dedent levels are handled correctly"""
+        processed = self.lexer.process_indentation(SOURCE_DEDENT)
+        # Check that we dedent properly from the if block
+        dedent_line = None
+        for line in processed.split('\n'):
+            if "statement2" in line and "DEDENT" in line:
+                dedent_line = line
+                break
+        
+        self.assertIsNotNone(dedent_line)
+        self.assertIn("DEDENT", dedent_line)
+
+    def test_complex_nesting(self):
+        """Test complex nesting patterns"""
+        processed = self.lexer.process_indentation(SOURCE_COMPLEX)
+        
+        # Count indents and dedents
+        indent_count = processed.count("INDENT")
+        dedent_count = processed.count("DEDENT")
+        
+        # Should have appropriate number of indents and dedents
+        self.assertEqual(indent_count, 3)  # module->struct, module->fn, fn->if, if->if
+        self.assertEqual(dedent_count, 3)  # or more with final dedents
+
+    def test_option_type_dsl_pattern(self):
+        """Test indentation with Option<T> and DSL-like patterns"""
+        processed = self.lexer.process_indentation(SOURCE_OPTION_DSL)
+        
+        # Should handle the match statement and nested if-else properly
+        self.assertRegex(processed, _INDENT_DEDENT_RE)
         
         # No indentation errors
         self.assertEqual(len(self.lexer.indent_errors), 0)
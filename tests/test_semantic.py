@@ -5,14 +5,30 @@ Tests type checking, symbol resolution, and semantic validation to ensure
 the language adheres to its type safety and deterministic design principles.
 """
 
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 from src.semantic.type_checker import TypeChecker
 from src.semantic.symbol_table import SymbolTable, Symbol, SymbolType, Scope
 from src.parser.aeigix_ast_visitor import SourcePosition
 
+# Fixture pieces shared by many ASTs; the type checker only reads them
+POS = SourcePosition(1, 1, "test.ae")
+TYPE_INT = {"name": "int"}
+TYPE_STRING = {"name": "string"}
+TYPE_VOID = {"name": "void"}
+
 class TestSemanticAnalysis(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.shared_checker = TypeChecker()
+    
     def setUp(self):
-        self.type_checker = TypeChecker()
+        # Reuse one checker, clearing whatever the previous test left behind
+        self.type_checker = self.shared_checker
+        self.type_checker.reset()
         
     def test_basic_type_checking(self):
         """Test basic type checking for compatible types"""
@@ -23,16 +39,16 @@ class TestSemanticAnalysis(unittest.TestCase):
             "children": [{
                 "node_type": "variable_declaration",
                 "name": "x",
-                "var_type": {"name": "int"},
+                "var_type": TYPE_INT,
                 "init_value": {
                     "node_type": "literal",
                     "literal_type": "int",
                     "value": 42,
-                    "position": SourcePosition(1, 1, "test.ae")
+                    "position": POS
                 },
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
@@ -47,21 +63,21 @@ class TestSemanticAnalysis(unittest.TestCase):
             "children": [{
                 "node_type": "variable_declaration",
                 "name": "x",
-                "var_type": {"name": "int"},
+                "var_type": TYPE_INT,
                 "init_value": {
                     "node_type": "literal",
                     "literal_type": "string",
                     "value": "hello",
-                    "position": SourcePosition(1, 1, "test.ae")
+                    "position": POS
                 },
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
         self.assertGreater(len(errors), 0, "Type error should be detected")
-        self.assertIn("type", str(errors[0]).lower())
+        self.assertEqual(errors[0].kind, "var_init_mismatch")
 
     def test_undefined_symbol(self):
         """Test detection of undefined symbols"""
@@ -73,7 +89,7 @@ class TestSemanticAnalysis(unittest.TestCase):
                 "node_type": "function",
                 "name": "test_func",
                 "parameters": [],
-                "return_type": {"name": "void"},
+                "return_type": TYPE_VOID,
                 "body": [{
                     "node_type": "expression_statement",
                     "expression": {
@@ -83,14 +99,14 @@ class TestSemanticAnalysis(unittest.TestCase):
                     },
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
         self.assertGreater(len(errors), 0, "Undefined symbol error should be detected")
-        self.assertIn("undefined", str(errors[0]).lower())
+        self.assertEqual(errors[0].kind, "undefined_symbol")
 
     def test_missing_return(self):
         """Test detection of missing return in non-void functions"""
@@ -102,11 +118,11 @@ class TestSemanticAnalysis(unittest.TestCase):
                 "node_type": "function",
                 "name": "no_return",
                 "parameters": [],
-                "return_type": {"name": "int"},
+                "return_type": TYPE_INT,
                 "body": [{
                     "node_type": "variable_declaration",
                     "name": "x",
-                    "var_type": {"name": "int"},
+                    "var_type": TYPE_INT,
                     "init_value": {
                         "node_type": "literal",
                         "literal_type": "int",
@@ -115,14 +131,14 @@ class TestSemanticAnalysis(unittest.TestCase):
                     },
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
         self.assertGreater(len(errors), 0, "Missing return error should be detected")
-        self.assertIn("return", str(errors[0]).lower())
+        self.assertEqual(errors[0].kind, "missing_return")
 
     def test_option_type(self):
         """Test type checking with Option<T> types"""
@@ -136,7 +152,7 @@ class TestSemanticAnalysis(unittest.TestCase):
                 "parameters": [],
                 "return_type": {
                     "name": "Option",
-                    "type_params": [{"name": "int"}],
+                    "type_params": [TYPE_INT],
                     "position": SourcePosition(1, 20, "test.ae")
                 },
                 "body": [{
@@ -154,9 +170,9 @@ class TestSemanticAnalysis(unittest.TestCase):
                     },
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
@@ -175,12 +191,12 @@ class TestSemanticAnalysis(unittest.TestCase):
                     "name": "opt",
                     "param_type": {
                         "name": "Option",
-                        "type_params": [{"name": "int"}],
+                        "type_params": [TYPE_INT],
                         "position": SourcePosition(1, 25, "test.ae")
                     },
                     "position": SourcePosition(1, 20, "test.ae")
                 }],
-                "return_type": {"name": "int"},
+                "return_type": TYPE_INT,
                 "body": [{
                     "node_type": "match_statement",
                     "subject": {
@@ -215,14 +231,14 @@ class TestSemanticAnalysis(unittest.TestCase):
                     ],
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
         self.assertGreater(len(errors), 0, "Non-exhaustive match should be detected")
-        self.assertIn("exhaustive", str(errors[0]).lower())
+        self.assertEqual(errors[0].kind, "non_exhaustive_match")
 
     def test_concurrent_task_types(self):
         """Test type checking with async/await and Task<T> types"""
@@ -236,7 +252,7 @@ class TestSemanticAnalysis(unittest.TestCase):
                 "parameters": [],
                 "return_type": {
                     "name": "Task",
-                    "type_params": [{"name": "string"}],
+                    "type_params": [TYPE_STRING],
                     "position": SourcePosition(1, 20, "test.ae")
                 },
                 "is_async": True,
@@ -250,17 +266,17 @@ class TestSemanticAnalysis(unittest.TestCase):
                     },
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }, {
                 # Another function that awaits the first function
                 "node_type": "function",
                 "name": "process_data",
                 "parameters": [],
-                "return_type": {"name": "string"},
+                "return_type": TYPE_STRING,
                 "body": [{
                     "node_type": "variable_declaration",
                     "name": "data",
-                    "var_type": {"name": "string"},
+                    "var_type": TYPE_STRING,
                     "init_value": {
                         "node_type": "await_expression",
                         "expression": {
@@ -281,9 +297,9 @@ class TestSemanticAnalysis(unittest.TestCase):
                     },
                     "position": SourcePosition(3, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
@@ -301,18 +317,18 @@ class TestSemanticAnalysis(unittest.TestCase):
                 "parameters": [
                     {
                         "name": "a",
-                        "param_type": {"name": "int"},
+                        "param_type": TYPE_INT,
                         "position": SourcePosition(1, 15, "test.ae")
                     },
                     {
                         "name": "b",
-                        "param_type": {"name": "int"},
+                        "param_type": TYPE_INT,
                         "position": SourcePosition(1, 25, "test.ae")
                     }
                 ],
                 "return_type": {
                     "name": "Result",
-                    "type_params": [{"name": "int"}, {"name": "string"}],
+                    "type_params": [TYPE_INT, TYPE_STRING],
                     "position": SourcePosition(1, 35, "test.ae")
                 },
                 "body": [{
@@ -374,9 +390,9 @@ class TestSemanticAnalysis(unittest.TestCase):
                     }],
                     "position": SourcePosition(2, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
@@ -395,13 +411,13 @@ class TestSemanticAnalysis(unittest.TestCase):
                     {
                         "node_type": "field",
                         "name": "table",
-                        "field_type": {"name": "string"},
+                        "field_type": TYPE_STRING,
                         "position": SourcePosition(2, 5, "test.ae")
                     },
                     {
                         "node_type": "field",
                         "name": "conditions",
-                        "field_type": {"name": "string"},
+                        "field_type": TYPE_STRING,
                         "position": SourcePosition(3, 5, "test.ae")
                     }
                 ],
@@ -416,7 +432,7 @@ class TestSemanticAnalysis(unittest.TestCase):
                         },
                         {
                             "name": "condition",
-                            "param_type": {"name": "string"},
+                            "param_type": TYPE_STRING,
                             "position": SourcePosition(5, 25, "test.ae")
                         }
                     ],
@@ -464,13 +480,13 @@ class TestSemanticAnalysis(unittest.TestCase):
                     }],
                     "position": SourcePosition(5, 5, "test.ae")
                 }],
-                "position": SourcePosition(1, 1, "test.ae")
+                "position": POS
             }, {
                 "node_type": "function",
                 "name": "from",
                 "parameters": [{
                     "name": "table",
-                    "param_type": {"name": "string"},
+                    "param_type": TYPE_STRING,
                     "position": SourcePosition(10, 15, "test.ae")
                 }],
                 "return_type": {"name": "Query"},
@@ -498,11 +514,258 @@ class TestSemanticAnalysis(unittest.TestCase):
                 }],
                 "position": SourcePosition(10, 1, "test.ae")
             }],
-            "position": SourcePosition(1, 1, "test.ae")
+            "position": POS
         }
         
         errors = self.type_checker.check(ast)
         self.assertEqual(len(errors), 0, "DSL pattern should type check correctly")
 
+    def test_forward_reference_in_module(self):
+        """Test that a function can call another declared later in the same module"""
+        ast = {
+            "node_type": "module",
+            "name": "Test",
+            "children": [{
+                "node_type": "function",
+                "name": "main",
+                "params": [],
+                "return_type": TYPE_VOID,
+                "body": [{
+                    "node_type": "call",
+                    "callee": {"node_type": "identifier", "name": "helper", "position": POS},
+                    "args": [],
+                    "position": POS
+                }],
+                "position": POS
+            }, {
+                "node_type": "function",
+                "name": "helper",
+                "params": [],
+                "return_type": TYPE_VOID,
+                "body": [],
+                "position": POS
+            }],
+            "position": POS
+        }
+
+        errors = self.type_checker.check(ast)
+        self.assertEqual(len(errors), 0, "Later declarations should be visible in the module")
+
+    def test_duplicate_errors_reported_once(self):
+        """Test that re-checking the same node does not repeat its errors"""
+        pos = SourcePosition(2, 5, "test.ae")
+        ast = {
+            "node_type": "call",
+            "callee": {
+                "node_type": "member_access",
+                "object": {"node_type": "identifier", "name": "missing", "position": pos},
+                "member": "run",
+                "position": pos
+            },
+            "args": [],
+            "position": pos
+        }
+
+        errors = self.type_checker.check(ast)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].kind, "undefined_symbol")
+
+    def test_iter_errors_stops_early(self):
+        """Test that iterating errors lazily checks only as many declarations as needed"""
+        def broken_function(name, line):
+            pos = SourcePosition(line, 1, "test.ae")
+            return {
+                "node_type": "function",
+                "name": name,
+                "params": [],
+                "return_type": TYPE_VOID,
+                "body": [{"node_type": "identifier", "name": "missing", "position": pos}],
+                "position": pos
+            }
+        ast = {
+            "node_type": "module",
+            "name": "Test",
+            "children": [broken_function("a", 1), broken_function("b", 2)],
+            "position": POS
+        }
+
+        first = next(self.type_checker.iter_errors(ast))
+        self.assertEqual(first.position.line, 1)
+        self.assertEqual(len(self.type_checker.errors), 1)
+        self.assertEqual(len(self.type_checker.check(ast)), 2)
+
+    def test_cached_result_reused(self):
+        """Test that errors are cached on disk and reused for an identical AST"""
+        ast = {
+            "node_type": "identifier",
+            "name": "missing",
+            "position": SourcePosition(3, 5, "test.ae")
+        }
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "typecheck.json")
+            errors = TypeChecker(cache_path=cache_path).check(ast)
+            self.assertEqual(len(errors), 1)
+            with open(cache_path, encoding="utf-8") as f:
+                self.assertEqual(len(json.load(f)), 1)
+
+            checker = TypeChecker(cache_path=cache_path)
+            with mock.patch.object(checker, "iter_errors") as iter_errors:
+                cached = checker.check(ast)
+            iter_errors.assert_not_called()
+            self.assertEqual(cached, errors)
+            
+            # A cache hit leaves no state behind from an earlier check
+            checker = TypeChecker(cache_path=cache_path)
+            checker._register_declaration({"node_type": "struct", "name": "Point", "fields": [], "position": POS})
+            checker.check(ast)
+            self.assertFalse(checker._is_valid_type("Point"))
+            self.assertEqual(cached[0].message, errors[0].message)
+
+            # Results cached by a different checker version are checked again
+            with mock.patch("src.semantic.type_checker._CACHE_VERSION", "other"):
+                checker = TypeChecker(cache_path=cache_path)
+                with mock.patch.object(checker, "iter_errors", wraps=checker.iter_errors) as iter_errors:
+                    self.assertEqual(checker.check(ast), errors)
+            iter_errors.assert_called_once()
+
+            # A different AST misses the cache
+            changed = dict(ast, name="other")
+            self.assertIn("other", TypeChecker(cache_path=cache_path).check(changed)[0].message)
+
+    def test_deep_operator_chain(self):
+        """Test that long operator chains do not hit the recursion limit"""
+        expr = {"node_type": "literal", "literal_type": "int", "value": 0, "position": POS}
+        for i in range(5000):
+            operand = {"node_type": "literal", "literal_type": "int", "value": i, "position": POS}
+            expr = {"node_type": "binary_op", "operator": "+", "left": expr, "right": operand, "position": POS}
+        expr = {"node_type": "unary_op", "operator": "-", "operand": expr, "position": POS}
+
+        self.assertEqual(self.type_checker._check_node(expr), "int")
+        self.assertEqual(len(self.type_checker.errors), 0)
+
+    def test_missing_variants_reported_in_order(self):
+        """Test that missing enum variants are reported in a stable order"""
+        self.type_checker._register_declaration({
+            "node_type": "enum",
+            "name": "Color",
+            "variants": [{"name": name, "fields": []} for name in ("Red", "Green", "Blue")],
+            "position": POS
+        })
+
+        def branch(node_type, name):
+            return {"pattern": {"node_type": node_type, "name": name, "position": POS}}
+
+        self.type_checker.check_match_exhaustiveness("Color", [branch("variant_pattern", "Green")], POS)
+        self.assertEqual(len(self.type_checker.errors), 1)
+        self.assertIn("Blue, Red", self.type_checker.errors[0].message)
+
+        # A binding pattern covers every variant
+        self.type_checker.errors = []
+        self.type_checker.check_match_exhaustiveness("Color", [branch("identifier", "c")], POS)
+        self.assertEqual(self.type_checker.errors, [])
+
+    def test_reset_clears_previous_check(self):
+        """Test that a reset checker no longer sees the previous AST's declarations"""
+        self.type_checker._register_declaration({
+            "node_type": "struct",
+            "name": "Point",
+            "fields": [],
+            "position": POS
+        })
+        self.type_checker._report("undefined_symbol", POS, "x")
+        
+        self.type_checker.reset()
+        
+        self.assertEqual(self.type_checker.errors, [])
+        self.assertIsNone(self.type_checker.symbol_table.lookup("Point"))
+        self.assertFalse(self.type_checker._is_valid_type("Point"))
+
+class TestSymbolTable(unittest.TestCase):
+    def setUp(self):
+        self.symbol_table = SymbolTable()
+
+    def test_lookup_through_nested_scopes(self):
+        """Test that lookups find names declared in enclosing scopes"""
+        self.symbol_table.add_symbol("x", SymbolType.VARIABLE, "int")
+        self.symbol_table.enter_scope("outer")
+        self.symbol_table.add_symbol("y", SymbolType.VARIABLE, "float")
+        self.symbol_table.enter_scope("inner")
+
+        self.assertEqual(self.symbol_table.lookup("x").type_info, "int")
+        self.assertEqual(self.symbol_table.lookup("y").type_info, "float")
+        self.assertIsNone(self.symbol_table.lookup("z"))
+
+        self.symbol_table.exit_scope()
+        self.symbol_table.exit_scope()
+        self.assertIsNone(self.symbol_table.lookup("y"))
+
+    def test_repeated_lookup_sees_shadowing(self):
+        """Test that shadowing and scope exit are reflected in later lookups"""
+        name = "x"
+        self.symbol_table.add_symbol(name, SymbolType.VARIABLE, "int")
+        self.symbol_table.enter_scope("inner")
+        self.assertEqual(self.symbol_table.lookup(name).type_info, "int")
+
+        self.symbol_table.add_symbol(name, SymbolType.VARIABLE, "string")
+        self.assertEqual(self.symbol_table.lookup(name).type_info, "string")
+
+        self.symbol_table.exit_scope()
+        self.assertEqual(self.symbol_table.lookup(name).type_info, "int")
+
+    def test_get_all_symbols_in_declaration_order(self):
+        """Test the flat symbol registry, including redeclaration in one scope"""
+        self.symbol_table.add_symbol("Point", SymbolType.TYPE, {"kind": "struct", "fields": {}})
+        self.symbol_table.enter_scope("main")
+        self.symbol_table.add_symbol("p", SymbolType.VARIABLE, "Point")
+        self.symbol_table.add_symbol("p", SymbolType.VARIABLE, "int")
+        self.symbol_table.exit_scope()
+        self.symbol_table.add_symbol("main", SymbolType.FUNCTION, {"params": [], "return_type": "void"})
+
+        names = [(s.name, s.type_info) for s in self.symbol_table.get_all_symbols()]
+        self.assertEqual(names[0][0], "Point")
+        self.assertEqual(names[1:], [("p", "int"), ("main", {"params": [], "return_type": "void"})])
+        self.assertEqual([s.name for s in self.symbol_table.get_symbols_of_type(SymbolType.VARIABLE)], ["p"])
+
+    def test_add_symbols_matches_add_symbol(self):
+        """Test that bulk insertion behaves like repeated add_symbol calls"""
+        self.symbol_table.enter_scope("params")
+        created = self.symbol_table.add_symbols([
+            ("a", SymbolType.VARIABLE, "int", False),
+            ("b", SymbolType.VARIABLE, "float", True),
+            ("a", SymbolType.VARIABLE, "string", False),
+        ])
+
+        self.assertEqual([s.scope for s in created], ["params"] * 3)
+        self.assertEqual(self.symbol_table.lookup("a").type_info, "string")
+        self.assertTrue(self.symbol_table.lookup("b").is_mutable)
+        self.assertEqual([s.name for s in self.symbol_table.get_all_symbols()], ["a", "b"])
+
+    def test_streaming_mode_drops_exited_scopes(self):
+        """Test that a streaming table keeps lookups working but retains no finished scopes"""
+        table = SymbolTable(streaming=True)
+        table.add_symbol("x", SymbolType.VARIABLE, "int")
+        table.enter_scope("f")
+        table.add_symbol("y", SymbolType.VARIABLE, "int")
+        self.assertEqual(table.lookup("x").type_info, "int")
+        table.exit_scope()
+
+        self.assertIsNone(table.global_scope.children)
+        self.assertIsNone(table.lookup("y"))
+        with self.assertRaises(RuntimeError):
+            table.get_all_symbols()
+
+    def test_lookup_in_scope_finds_nested_scope(self):
+        """Test scope search by name through the scope tree"""
+        self.symbol_table.enter_scope("Test")
+        self.symbol_table.enter_scope("main")
+        self.symbol_table.add_symbol("x", SymbolType.VARIABLE, "int")
+        self.symbol_table.exit_scope()
+        self.symbol_table.exit_scope()
+
+        self.assertEqual(self.symbol_table.lookup_in_scope("x", "main").type_info, "int")
+        self.assertIsNone(self.symbol_table.lookup_in_scope("x", "missing"))
+        first = next(self.symbol_table.iter_all_symbols())
+        self.assertEqual(first.name, "x")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
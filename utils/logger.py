@@ -1,11 +1,15 @@
 # utils/logger.py
 import logging
 
+_FORMAT = "%(asctime)s [%(levelname)s]: %(message)s"
+
+# Set once the root logger has been configured by the first get_logger call
+_configured = False
+
 
 def get_logger(name):
-    logger = logging.getLogger(name)
-    logger_format = "%(asctime)s [%(levelname)s] %(message)s"
-    logging.basicConfig(
-        level=logging.DEBUG, format="%(asctime)s [%(levelname)s]: %(message)s"
-    )
+    global _configured
+    if not _configured:
+        logging.basicConfig(level=logging.DEBUG, format=_FORMAT)
+        _configured = True
     return logging.getLogger(name)